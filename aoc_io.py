@@ -5,121 +5,557 @@ Get input from and submit answer to AOC
 
 from __future__ import annotations
 
+import asyncio
+import html
+import json
+import os
+import re
 from datetime import datetime
+from functools import cache
+from hashlib import sha256
+from math import ceil
 from pathlib import Path
 from string import Template
-from time import sleep
+from time import monotonic, sleep, time
 from typing import TYPE_CHECKING
 from zoneinfo import ZoneInfo
 
-import requests
-import yaml
-from bs4 import BeautifulSoup
 from colorama import Fore, init
 
+from cache import CACHE_DIR, hash_file
 from utils import get_input_path
 
 if TYPE_CHECKING:
-    from typing import Literal, Optional
+    from collections.abc import Iterable
+    from typing import Any, Literal, Optional
+
+    import requests
+
+# `requests` and `yaml` are slow to import and only needed when talking to AOC, so
+#   they are imported where they are used
 
 init(autoreset=True)
 
 _CONFIG_PATH = Path(__file__).resolve().parent / "config.yml"
-with _CONFIG_PATH.open("r") as f:
-    _CONFIG = yaml.safe_load(f)
+# ETag/Last-Modified of downloaded inputs, with the path and hash of the file written
+_DOWNLOADS_PATH = CACHE_DIR / "downloads.json"
+# Outcomes of submitted answers, and until when AOC refuses submissions
+_SUBMISSIONS_PATH = CACHE_DIR / "submissions.json"
 
-DATA_URL = Template("https://adventofcode.com/2022/day/${day}/input")
-ANSWER_URL = Template("https://adventofcode.com/2022/day/${day}/answer")
+# Can be pointed at a local stand-in server
+BASE_URL = os.environ.get("AOC_BASE_URL", "https://adventofcode.com/2022")
+DATA_URL = Template("${base}/day/${day}/input")
+ANSWER_URL = Template("${base}/day/${day}/answer")
 
-_COOKIES = _CONFIG["cookies"]
+# Download attempts, and seconds to wait after the first failed one. The wait doubles
+#   after each failure
+_RETRIES = 3
+_BACKOFF_BASE = 2.0
+# Seconds to wait for AOC to connect and to send each part of a response
+_REQUEST_TIMEOUT = 30.0
+# Connections kept alive to AOC, which caps concurrent downloads
+_POOL_SIZE = 10
 
 _DAY_CHOICES = set(range(1, 26))
 _LEVEL_CHOICES = {1, 2}
 
+# Responses to submissions
+_ARTICLE_RE = re.compile(r"<article[^>]*>(.*?)</article>", re.DOTALL)
+_TAG_RE = re.compile(r"<[^>]+>")
+_TIME_LEFT_RE = re.compile(r"You have (?:(\d+)m )?(\d+)s left to wait")
+_WAIT_RE = re.compile(r"[Pp]lease wait (one|\d+) minutes?")
+# Outcomes of submissions recorded in the ledger
+_OUTCOME_COLORS = {
+    "correct": Fore.GREEN,
+    "wrong": Fore.RED,
+    "too_high": Fore.RED,
+    "too_low": Fore.RED,
+}
+
+
+@cache
+def _get_cookies() -> dict[str, str]:
+    """"""
+    import yaml
+
+    try:
+        with _CONFIG_PATH.open("r") as f:
+            config = yaml.safe_load(f)
+    except FileNotFoundError as err:
+        raise FileNotFoundError(
+            f"No config found at {_CONFIG_PATH}. See README.md for how to create it."
+        ) from err
+    return config["cookies"]
+
+
+@cache
+def _get_session() -> requests.Session:
+    """
+    Session shared by all requests, keeping connections to AOC alive.
+    """
+    import requests
+    from requests.adapters import HTTPAdapter
+
+    session = requests.Session()
+    session.mount("https://", HTTPAdapter(pool_maxsize=_POOL_SIZE))
+    session.mount("http://", HTTPAdapter(pool_maxsize=_POOL_SIZE))
+    session.cookies.update(_get_cookies())
+    return session
+
+
+def get_released_days() -> list[int]:
+    """
+    Get the days whose problems have been released.
+    Returns:
+        (list[int]): Sorted day numbers
+    """
+    now = datetime.now()
+    return [day for day in sorted(_DAY_CHOICES) if _get_release_time(day) <= now]
+
 
 def download_input(day: int, input_path: Optional[Path] = None) -> None:
     """
-    Download input from AOC website.
+    Download input from AOC website. If the input has been downloaded before and the
+    server reports it unchanged, nothing is fetched or written.
     Args:
         day        (1..25)       : The day of AOC
         input_path (pathlib.Path): Path of file to write input to
     """
     if day not in _DAY_CHOICES:
         raise ValueError(f"{day=} is not in range 1..25")
-    # One extra second just to be sure
-    target_time_est = datetime(2022, 12, day, 0, 0, 1, tzinfo=ZoneInfo("EST"))
-    target_time_local = datetime.fromtimestamp(target_time_est.timestamp())
+    release_time = _get_release_time(day)
 
-    while (now := datetime.now()) < target_time_local:
-        diff = target_time_local - now
+    while (now := datetime.now()) < release_time:
+        diff = release_time - now
         seconds = max(diff.days * 86400 + diff.seconds, 0)
         print(f"\r\x1b[K{seconds} seconds until problem opens. Waiting...", end="")
         sleep(1)
     print("\r\x1b[K", end="")
 
-    for _ in range(3):
-        with requests.get(DATA_URL.substitute(day=day), cookies=_COOKIES) as response:
-            data = response.content
-            if not response.ok:
-                print(Fore.RED + data.decode("utf-8").strip())
-                sleep(5)
-                continue
-            break
+    if input_path is None:
+        input_path = get_input_path(day)
+    downloads = _load_downloads()
+    headers = _get_conditional_headers(day, input_path, downloads)
+
+    for attempt in range(_RETRIES):
+        try:
+            download = _request_input(day, headers)
+        except _DownloadError as err:
+            print(Fore.RED + str(err))
+            sleep(_get_backoff(attempt))
+            continue
+        break
     else:
         raise ConnectionError("Download failed!")
 
+    if download is None:
+        print(Fore.GREEN + f"Day {day} input unchanged")
+        return
+    data, validators = download
     print(
         Fore.GREEN
         + f"Got input with {len(data)} characters and {len(data.splitlines())} lines"
     )
-    if input_path is None:
+    # Only recorded once written, so that a partial write is never trusted
+    _write_input(input_path, data)
+    downloads[str(day)] = _get_download_record(input_path, data, validators)
+    _dump_downloads(downloads)
+
+
+def download_inputs(
+    days: Iterable[int], *, concurrency: int = 4, rate: float = 1.0, burst: int = 3
+) -> None:
+    """
+    Download inputs of multiple released days concurrently. See `download_input`.
+    Requests are spread out by a token bucket, and failed ones are retried with
+    exponential backoff.
+    Args:
+        days        (Iterable[int]): Days of AOC
+        concurrency (int)          : Maximum number of downloads in flight
+        rate        (float)        : Maximum sustained requests per second
+        burst       (int)          : Maximum number of requests sent back to back
+    """
+    released_days = set(get_released_days())
+    days = sorted(set(days))
+    for day in days:
+        if day not in _DAY_CHOICES:
+            raise ValueError(f"{day=} is not in range 1..25")
+        if day not in released_days:
+            raise ValueError(f"Day {day} has not been released yet")
+    if not 1 <= concurrency <= _POOL_SIZE:
+        raise ValueError(f"{concurrency=} is not in range 1..{_POOL_SIZE}")
+    asyncio.run(_download_inputs(days, concurrency=concurrency, rate=rate, burst=burst))
+
+
+async def _download_inputs(
+    days: list[int], *, concurrency: int, rate: float, burst: int
+) -> None:
+    """"""
+    downloads = _load_downloads()
+    semaphore = asyncio.Semaphore(concurrency)
+    bucket = _TokenBucket(rate=rate, capacity=burst)
+
+    async def download(day: int) -> bool:
+        """"""
         input_path = get_input_path(day)
-    with input_path.open("wb") as input_fp:
+        headers = _get_conditional_headers(day, input_path, downloads)
+        async with semaphore:
+            for attempt in range(_RETRIES):
+                await bucket.acquire()
+                try:
+                    result = await asyncio.to_thread(_request_input, day, headers)
+                except _DownloadError as err:
+                    print(Fore.RED + f"Day {day}: {err}")
+                    await asyncio.sleep(_get_backoff(attempt))
+                    continue
+                break
+            else:
+                print(Fore.RED + f"Day {day}: Download failed!")
+                return False
+        if result is None:
+            print(Fore.GREEN + f"Day {day}: Input unchanged")
+            return True
+        data, validators = result
+        await asyncio.to_thread(_write_input, input_path, data)
+        downloads[str(day)] = _get_download_record(input_path, data, validators)
+        print(
+            Fore.GREEN
+            + f"Day {day}: Got input with {len(data)} characters and "
+            + f"{len(data.splitlines())} lines"
+        )
+        return True
+
+    try:
+        results = await asyncio.gather(
+            *(download(day) for day in days), return_exceptions=True
+        )
+    finally:
+        # Single writer for the record, after all downloads are done, keeping the
+        #   days that succeeded even if others failed
+        _dump_downloads(downloads)
+    failed_days: list[int] = []
+    for day, result in zip(days, results):
+        if isinstance(result, BaseException):
+            print(Fore.RED + f"Day {day}: {type(result).__name__}: {result}")
+        if result is not True:
+            failed_days.append(day)
+    if failed_days:
+        raise ConnectionError(f"Downloads failed for days {failed_days}!")
+
+
+class _DownloadError(Exception):
+    """"""
+
+
+class _TokenBucket:
+    """
+    Allow `rate` acquisitions per second on average, and up to `capacity` at once
+    """
+
+    def __init__(self, *, rate: float, capacity: int) -> None:
+        if rate <= 0:
+            raise ValueError(f"{rate=} must be positive")
+        if capacity < 1:
+            raise ValueError(f"{capacity=} must be positive")
+        self.rate = rate
+        self.capacity = capacity
+        self._tokens = float(capacity)
+        self._updated_at = monotonic()
+        self._lock = asyncio.Lock()
+
+    async def acquire(self) -> None:
+        """"""
+        async with self._lock:
+            while True:
+                now = monotonic()
+                self._tokens = min(
+                    self.capacity, self._tokens + (now - self._updated_at) * self.rate
+                )
+                self._updated_at = now
+                if self._tokens >= 1:
+                    self._tokens -= 1
+                    return
+                await asyncio.sleep((1 - self._tokens) / self.rate)
+
+
+def _get_conditional_headers(
+    day: int, input_path: Path, downloads: dict[str, dict[str, None | str]]
+) -> dict[str, str]:
+    """
+    Get the headers making a download conditional, only if the input on disk is still
+    the one the validators were recorded for. An input that was edited, truncated or
+    downloaded elsewhere is downloaded again.
+    """
+    headers: dict[str, str] = {}
+    validators = downloads.get(str(day), {})
+    if (
+        validators.get("path") != str(input_path.resolve())
+        or not input_path.exists()
+        or validators.get("sha256") != hash_file(input_path)
+    ):
+        return headers
+    if (etag := validators.get("etag")) is not None:
+        headers["If-None-Match"] = etag
+    if (last_modified := validators.get("last_modified")) is not None:
+        headers["If-Modified-Since"] = last_modified
+    return headers
+
+
+def _request_input(
+    day: int, headers: dict[str, str]
+) -> None | tuple[bytes, dict[str, None | str]]:
+    """
+    Request a day's input once.
+    Returns:
+        (None | tuple[bytes, dict]): `None` if unchanged, otherwise the input and its
+            ETag/Last-Modified
+    Raises:
+        _DownloadError: If the server responds with an error, or can't be reached
+    """
+    import requests
+
+    session = _get_session()
+    try:
+        with session.get(
+            DATA_URL.substitute(base=BASE_URL, day=day),
+            headers=headers,
+            timeout=_REQUEST_TIMEOUT,
+        ) as response:
+            if response.status_code == 304:
+                return None
+            data = response.content
+            if not response.ok:
+                raise _DownloadError(data.decode("utf-8").strip())
+            return data, {
+                "etag": response.headers.get("ETag"),
+                "last_modified": response.headers.get("Last-Modified"),
+            }
+    except requests.RequestException as err:
+        # Connection errors and timeouts are retried like server errors
+        raise _DownloadError(f"{type(err).__name__}: {err}") from err
+
+
+def _get_download_record(
+    input_path: Path, data: bytes, validators: dict[str, None | str]
+) -> dict[str, None | str]:
+    """"""
+    return {
+        **validators,
+        "path": str(input_path.resolve()),
+        "sha256": sha256(data).hexdigest(),
+    }
+
+
+def _write_input(input_path: Path, data: bytes) -> None:
+    """
+    Write an input atomically, so that an interrupted write leaves the previous one.
+    """
+    if input_path.exists() and input_path.read_bytes() == data:
+        return
+    # Days without a solution yet have no directory
+    input_path.parent.mkdir(parents=True, exist_ok=True)
+    tmp_path = input_path.with_suffix(f".{os.getpid()}.tmp")
+    with tmp_path.open("wb") as input_fp:
         input_fp.write(data)
+    os.replace(tmp_path, input_path)
+
+
+def _get_backoff(attempt: int) -> float:
+    """"""
+    return _BACKOFF_BASE * 2**attempt
+
+
+def _get_release_time(day: int) -> datetime:
+    """"""
+    # One extra second just to be sure
+    target_time_est = datetime(2022, 12, day, 0, 0, 1, tzinfo=ZoneInfo("EST"))
+    return datetime.fromtimestamp(target_time_est.timestamp())
+
+
+def _load_downloads() -> dict[str, dict[str, None | str]]:
+    """"""
+    try:
+        with _DOWNLOADS_PATH.open("r") as f:
+            return json.load(f)
+    except FileNotFoundError:
+        return {}
+
+
+def _dump_downloads(downloads: dict[str, dict[str, None | str]]) -> None:
+    """"""
+    _DOWNLOADS_PATH.parent.mkdir(parents=True, exist_ok=True)
+    tmp_path = _DOWNLOADS_PATH.with_suffix(f".{os.getpid()}.tmp")
+    with tmp_path.open("w") as f:
+        json.dump(downloads, f, indent=2)
+        f.write("\n")
+    os.replace(tmp_path, _DOWNLOADS_PATH)
 
 
-def submit_output(day: int, part: Literal[1, 2], answer: str | int) -> None:
+def submit_output(day: int, part: Literal[1, 2], answer: str | int) -> bool:
     """
-    Upload solution to AOC website
+    Upload solution to AOC website, printing the response with coloring. Outcomes are
+    kept in a local ledger, so an answer already accepted, already rejected, or
+    beyond a known too high/too low bound is not submitted again. While AOC asks to
+    wait before the next submission, the submission waits instead of retrying.
     Args:
         day    (1..25)    : The day of AOC
         part   (1, 2)     : Whether the submission is for part 1 or 2
         answer (str | int): Answer to be submitted
     Returns:
-        (str): Success/failure string, with coloring
+        (bool): Whether the answer was accepted as correct
     """
     if day not in _DAY_CHOICES:
         raise ValueError(f"{day=} is not in range 1..25")
     if part not in _LEVEL_CHOICES:
         raise ValueError(f"{part=} is not 1 or 2")
 
-    for _ in range(3):
-        with requests.post(
-            ANSWER_URL.substitute(day=day),
+    answer = str(answer)
+    submissions = _load_submissions()
+    attempts = submissions["days"].setdefault(str(day), {}).setdefault(str(part), {})
+    known_outcome = _get_known_outcome(attempts, answer)
+    if known_outcome is not None:
+        print(
+            _OUTCOME_COLORS[known_outcome]
+            + f"Not submitted, as {answer} is known to be {known_outcome}"
+        )
+        return known_outcome == "correct"
+
+    for _ in range(_RETRIES):
+        _wait_for_submissions(submissions["wait_until"])
+        response_text = _post_answer(day, part, answer)
+        outcome, wait = _parse_response(response_text)
+        if wait:
+            submissions["wait_until"] = time() + wait
+            _dump_submissions(submissions)
+        if outcome != "too_recent":
+            break
+        print(Fore.YELLOW + response_text)
+    else:
+        raise ConnectionError("Submissions still refused after waiting.")
+
+    if outcome == "wrong_level":
+        print(Fore.YELLOW + response_text)
+        return False
+    attempts[answer] = outcome
+    _dump_submissions(submissions)
+    print(_OUTCOME_COLORS[outcome] + response_text)
+    return outcome == "correct"
+
+
+def _get_known_outcome(attempts: dict[str, str], answer: str) -> None | str:
+    """
+    Get the outcome of an answer from the outcomes of earlier submissions, if it
+    follows from them.
+    """
+    if answer in attempts:
+        return attempts[answer]
+    # Only one answer is right
+    if "correct" in attempts.values():
+        return "wrong"
+    value = _to_int(answer)
+    if value is None:
+        return None
+    for attempt, outcome in attempts.items():
+        attempt_value = _to_int(attempt)
+        if attempt_value is None:
+            continue
+        if outcome == "too_high" and value >= attempt_value:
+            return "too_high"
+        if outcome == "too_low" and value <= attempt_value:
+            return "too_low"
+    return None
+
+
+def _to_int(answer: str) -> None | int:
+    """"""
+    try:
+        return int(answer)
+    except ValueError:
+        return None
+
+
+def _wait_for_submissions(wait_until: float) -> None:
+    """"""
+    while (seconds := wait_until - time()) > 0:
+        print(
+            f"\r\x1b[K{ceil(seconds)} seconds until AOC accepts answers. Waiting...",
+            end="",
+        )
+        sleep(min(seconds, 1))
+    print("\r\x1b[K", end="")
+
+
+def _post_answer(day: int, part: int, answer: str) -> str:
+    """
+    Post an answer, retrying with backoff on server errors.
+    Returns:
+        (str): Text of the response's article
+    """
+    session = _get_session()
+    for attempt in range(_RETRIES):
+        with session.post(
+            ANSWER_URL.substitute(base=BASE_URL, day=day),
             {"level": part, "answer": answer},
-            cookies=_COOKIES,
+            timeout=_REQUEST_TIMEOUT,
         ) as response:
             data = response.content
             if not response.ok:
                 print(Fore.RED + data.decode("utf-8").strip())
-                sleep(1)
+                sleep(_get_backoff(attempt))
                 continue
             break
     else:
         raise ConnectionError("Failed to submit response.")
 
-    html = BeautifulSoup(data, "html.parser")
-    try:
-        response_text: str = html.article.p.text
-    except AttributeError as err:
-        raise ValueError(f"Unknown response html: {data}") from err
+    match = _ARTICLE_RE.search(data.decode("utf-8"))
+    if match is None:
+        raise ValueError(f"Unknown response html: {data!r}")
+    return " ".join(html.unescape(_TAG_RE.sub("", match[1])).split())
+
+
+def _parse_response(response_text: str) -> tuple[str, float]:
+    """
+    Get the outcome of a submission, and how many seconds AOC asks to wait before the
+    next one.
+    Returns:
+        (tuple[str, float]): One of the ledger's outcomes, `"too_recent"` or
+            `"wrong_level"`, and the seconds to wait
+    """
+    wait = 0.0
+    if (match := _WAIT_RE.search(response_text)) is not None:
+        wait = 60.0 * (1 if match[1] == "one" else int(match[1]))
+    if response_text.startswith("That's the"):
+        return "correct", wait
+    if response_text.startswith("That's not"):
+        if "too high" in response_text:
+            return "too_high", wait
+        if "too low" in response_text:
+            return "too_low", wait
+        return "wrong", wait
+    if response_text.startswith("You gave"):
+        match = _TIME_LEFT_RE.search(response_text)
+        if match is None:
+            raise ValueError(f"Unknown wait time: {response_text}")
+        return "too_recent", 60.0 * int(match[1] or 0) + int(match[2])
     if response_text.startswith("You don't"):
-        print(Fore.YELLOW + response_text)
-    elif response_text.startswith("That's the"):
-        print(Fore.GREEN + response_text)
-    elif response_text.startswith("That's not"):
-        print(Fore.RED + response_text)
-    elif response_text.startswith("You gave"):
-        print(Fore.RED + response_text)
-    else:
-        raise ValueError(f"Unknown response text: {response_text}")
+        return "wrong_level", wait
+    raise ValueError(f"Unknown response text: {response_text}")
+
+
+def _load_submissions() -> dict[str, Any]:
+    """"""
+    try:
+        with _SUBMISSIONS_PATH.open("r") as f:
+            return json.load(f)
+    except FileNotFoundError:
+        return {"wait_until": 0.0, "days": {}}
+
+
+def _dump_submissions(submissions: dict[str, Any]) -> None:
+    """"""
+    _SUBMISSIONS_PATH.parent.mkdir(parents=True, exist_ok=True)
+    tmp_path = _SUBMISSIONS_PATH.with_suffix(f".{os.getpid()}.tmp")
+    with tmp_path.open("w") as f:
+        json.dump(submissions, f, indent=2)
+        f.write("\n")
+    os.replace(tmp_path, _SUBMISSIONS_PATH)
@@ -0,0 +1,441 @@
+# pyright: reportMissingTypeStubs=false
+"""
+Benchmark solutions phase by phase
+"""
+
+from __future__ import annotations
+
+import json
+import platform
+import statistics
+from contextlib import redirect_stdout
+from dataclasses import dataclass, field
+from math import ceil
+from os import devnull
+from pathlib import Path
+from time import perf_counter
+from typing import TYPE_CHECKING
+
+from runner import get_answer
+from utils import REFERENCE_IMPL, Instruments, get_solution_class
+
+BASELINE_PATH = Path(__file__).resolve().parent / "perf_baseline.json"
+
+if TYPE_CHECKING:
+    from collections.abc import Iterable
+    from typing import Any
+
+    from profiling import MemoryStats
+
+PHASES = ("init", "part_1", "part_2")
+
+
+@dataclass(kw_only=True)
+class PhaseStats:
+    """
+    Timing samples of a single phase, in seconds
+    """
+
+    samples: list[float] = field(default_factory=list)
+
+    @property
+    def min(self) -> float:
+        return min(self.samples)
+
+    @property
+    def median(self) -> float:
+        return statistics.median(self.samples)
+
+    @property
+    def p95(self) -> float:
+        # Nearest-rank percentile
+        ordered = sorted(self.samples)
+        return ordered[ceil(0.95 * len(ordered)) - 1]
+
+    def to_dict(self) -> dict[str, Any]:
+        """"""
+        return {
+            "min": self.min,
+            "median": self.median,
+            "p95": self.p95,
+            "samples": self.samples,
+        }
+
+
+def bench_day(
+    day: int, *, repeat: int = 5, warmup: int = 1, use_cache: bool = False
+) -> dict[str, PhaseStats]:
+    """
+    Time parsing, part 1 and part 2 of a day separately. Both parts run from a single
+    parse, each on a fresh snapshot of the data. Anything the solution prints is
+    discarded. With `use_cache`, `init` of days caching their data times loading it
+    from the cache instead of parsing. Searches never resume from checkpoints.
+    Args:
+        day       (1..25): The day of AOC
+        repeat    (int)  : Number of timed runs
+        warmup    (int)  : Number of untimed runs before the timed ones
+        use_cache (bool) : Whether processed data may come from the cache
+    Returns:
+        (dict[str, PhaseStats]): Timing stats for each phase in `PHASES`
+    """
+    if repeat < 1:
+        raise ValueError(f"{repeat=} must be positive")
+    SolutionClass = get_solution_class(day)
+    stats = {phase: PhaseStats() for phase in PHASES}
+    with open(devnull, "w") as null_fp, redirect_stdout(null_fp):
+        for i in range(warmup + repeat):
+            start = perf_counter()
+            solution_obj = SolutionClass(use_cache=use_cache, checkpoints=False)
+            end = perf_counter()
+            if i >= warmup:
+                stats["init"].samples.append(end - start)
+            snapshot = solution_obj.snapshot()
+            for phase in ("part_1", "part_2"):
+                solution_obj.restore(snapshot)
+                start = perf_counter()
+                getattr(solution_obj, phase)()
+                end = perf_counter()
+                if i >= warmup:
+                    stats[phase].samples.append(end - start)
+    return stats
+
+
+def instrument_day(day: int, *, use_cache: bool = False) -> dict[str, Instruments]:
+    """
+    Collect the timers and counters a day records, in an untimed run. Both parts run
+    from a single parse, each on a fresh snapshot of the data. Anything the solution
+    prints is discarded.
+    Args:
+        day       (1..25): The day of AOC
+        use_cache (bool) : Whether processed data may come from the cache
+    Returns:
+        (dict[str, Instruments]): What was recorded in each phase in `PHASES`
+    """
+    SolutionClass = get_solution_class(day)
+    instruments = {phase: Instruments() for phase in PHASES}
+    with open(devnull, "w") as null_fp, redirect_stdout(null_fp):
+        solution_obj = SolutionClass(
+            use_cache=use_cache, instruments=instruments["init"], checkpoints=False
+        )
+        snapshot = solution_obj.snapshot()
+        for part in (1, 2):
+            solution_obj.restore(snapshot)
+            solution_obj.instruments = instruments[f"part_{part}"]
+            get_answer(solution_obj, part)
+    return instruments
+
+
+def bench_days(
+    days: list[int], *, repeat: int = 5, warmup: int = 1, use_cache: bool = False
+) -> dict[int, dict[str, PhaseStats]]:
+    """
+    Benchmark multiple days. See `bench_day`.
+    Args:
+        days      (list[int]): Days of AOC
+        repeat    (int)      : Number of timed runs
+        warmup    (int)      : Number of untimed runs before the timed ones
+        use_cache (bool)     : Whether processed data may come from the cache
+    Returns:
+        (dict[int, dict[str, PhaseStats]]): Timing stats of each day
+    """
+    return {
+        day: bench_day(day, repeat=repeat, warmup=warmup, use_cache=use_cache)
+        for day in days
+    }
+
+
+def to_report(
+    results: dict[int, dict[str, PhaseStats]],
+    *,
+    repeat: int,
+    warmup: int,
+    use_cache: bool = False,
+    memory: None | dict[int, dict[str, MemoryStats]] = None,
+    instruments: None | dict[int, dict[str, Instruments]] = None,
+) -> dict[str, Any]:
+    """
+    Convert benchmark results, and optionally memory stats and instruments, to a
+    JSON-serializable report. `use_cache` records whether `init` loaded cached data.
+    """
+    days: dict[str, dict[str, dict[str, Any]]] = {
+        str(day): {phase: stats.to_dict() for phase, stats in day_stats.items()}
+        for day, day_stats in results.items()
+    }
+    for day, day_memory in (memory or {}).items():
+        for phase, memory_stats in day_memory.items():
+            days[str(day)][phase]["memory"] = memory_stats.to_dict()
+    for day, day_instruments in (instruments or {}).items():
+        for phase, phase_instruments in day_instruments.items():
+            days[str(day)][phase]["instruments"] = phase_instruments.to_dict()
+    return {
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        "repeat": repeat,
+        "warmup": warmup,
+        "use_cache": use_cache,
+        "days": days,
+    }
+
+
+def write_report(report: dict[str, Any], path: Path) -> None:
+    """
+    Write a benchmark report as JSON.
+    """
+    with path.open("w") as f:
+        json.dump(report, f, indent=2)
+        f.write("\n")
+
+
+def load_report(path: Path) -> dict[str, Any]:
+    """
+    Load a benchmark report written by `write_report`.
+    """
+    with path.open("r") as f:
+        return json.load(f)
+
+
+@dataclass(frozen=True, kw_only=True)
+class Comparison:
+    """
+    Median time of a phase against its baseline, in seconds
+    """
+
+    day: int
+    phase: str
+    baseline: float
+    current: float
+    regressed: bool
+
+    @property
+    def change(self) -> float:
+        """
+        Relative change, positive when slower
+        """
+        return self.current / self.baseline - 1 if self.baseline else 0.0
+
+
+def compare_to_baseline(
+    results: dict[int, dict[str, PhaseStats]],
+    baseline: dict[str, Any],
+    *,
+    tolerance: float = 0.2,
+    min_delta: float = 0.001,
+    use_cache: bool = False,
+) -> list[Comparison]:
+    """
+    Compare median timings to a baseline report. A phase regresses when its median is
+    slower than the baseline by more than `tolerance` and by more than `min_delta`, so
+    that the noise of very fast phases is not reported. Phases missing from the
+    baseline are skipped.
+    Args:
+        results   (dict[int, dict[str, PhaseStats]]): Results of `bench_days`
+        baseline  (dict[str, Any])                  : Report from `to_report`
+        tolerance (float)                           : Allowed relative slowdown
+        min_delta (float)                           : Allowed slowdown in seconds
+        use_cache (bool)                            : Whether `results` loaded cached
+                                                      data
+    Returns:
+        (list[Comparison]): Comparison of each phase found in the baseline
+    """
+    if baseline.get("use_cache") != use_cache:
+        raise ValueError(
+            f"The baseline was not recorded with {use_cache=}, parse times would not"
+            " be comparable"
+        )
+    comparisons: list[Comparison] = []
+    for day, day_stats in results.items():
+        baseline_day = baseline["days"].get(str(day), {})
+        for phase, stats in day_stats.items():
+            if phase not in baseline_day:
+                continue
+            baseline_median = baseline_day[phase]["median"]
+            current = stats.median
+            regressed = (
+                current > baseline_median * (1 + tolerance)
+                and current - baseline_median > min_delta
+            )
+            comparisons.append(
+                Comparison(
+                    day=day,
+                    phase=phase,
+                    baseline=baseline_median,
+                    current=current,
+                    regressed=regressed,
+                )
+            )
+    return comparisons
+
+
+@dataclass(frozen=True, kw_only=True)
+class ImplResult:
+    """
+    Timings and answer of one implementation of a part on one input
+    """
+
+    input_name: str
+    part: int
+    impl: str
+    stats: PhaseStats
+    answer: Any = None
+    error: None | str = None
+    # Whether the answer is the reference implementation's
+    agrees: bool = False
+
+
+def compare_implementations(
+    day: int,
+    inputs: dict[str, None | Path],
+    parts: Iterable[int] = (1, 2),
+    *,
+    repeat: int = 5,
+    warmup: int = 1,
+    use_cache: bool = True,
+) -> list[ImplResult]:
+    """
+    Time every implementation of each part on each input, and check that they all
+    get the reference implementation's answer. Each input is parsed once, and every
+    run gets a fresh snapshot of the data. Anything the solution prints is discarded.
+    Searches never resume from checkpoints.
+    Args:
+        day       (1..25)                        : The day of AOC
+        inputs    (dict[str, None | pathlib.Path]): Inputs by name. `None` is the
+            downloaded input
+        parts     (Iterable[int])                : Part numbers to compare
+        repeat    (int)                          : Number of timed runs
+        warmup    (int)                          : Number of untimed runs before the
+            timed ones
+        use_cache (bool)                         : Whether processed data may come
+            from the cache
+    Returns:
+        (list[ImplResult]): Results by input, part, then implementation, reference
+            first
+    """
+    if repeat < 1:
+        raise ValueError(f"{repeat=} must be positive")
+    SolutionClass = get_solution_class(day)
+    results: list[ImplResult] = []
+    with open(devnull, "w") as null_fp, redirect_stdout(null_fp):
+        for input_name, input_path in inputs.items():
+            solution_obj = SolutionClass(
+                use_cache=use_cache, input_path=input_path, checkpoints=False
+            )
+            snapshot = solution_obj.snapshot()
+            for part in parts:
+                reference = None
+                for impl in SolutionClass.get_implementation_names(part):
+                    stats = PhaseStats()
+                    try:
+                        for i in range(warmup + repeat):
+                            solution_obj.restore(snapshot)
+                            start = perf_counter()
+                            answer = get_answer(solution_obj, part, impl)
+                            end = perf_counter()
+                            if i >= warmup:
+                                stats.samples.append(end - start)
+                    except Exception as err:
+                        result = ImplResult(
+                            input_name=input_name,
+                            part=part,
+                            impl=impl,
+                            stats=stats,
+                            error=f"{type(err).__name__}: {err}",
+                        )
+                    else:
+                        if impl == REFERENCE_IMPL:
+                            reference = answer
+                        result = ImplResult(
+                            input_name=input_name,
+                            part=part,
+                            impl=impl,
+                            stats=stats,
+                            answer=answer,
+                            agrees=impl == REFERENCE_IMPL or answer == reference,
+                        )
+                    results.append(result)
+    return results
+
+
+def format_implementations(results: list[ImplResult]) -> str:
+    """
+    Format implementation results as a human-readable table, with median times in
+    milliseconds and speedups over the reference, marking disagreements.
+    """
+    lines = [
+        f"{'Input':<12}  {'Part':>4}  {'Impl':<12}  {'Median (ms)':>11}  "
+        f"{'Speedup':>7}  Answer"
+    ]
+    reference_medians: dict[tuple[str, int], float] = {}
+    for result in results:
+        key = (result.input_name, result.part)
+        if result.error is not None:
+            lines.append(
+                f"{result.input_name:<12}  {result.part:>4}  {result.impl:<12}  "
+                f"{'':>11}  {'':>7}  FAILED {result.error}"
+            )
+            continue
+        median = result.stats.median
+        if result.impl == REFERENCE_IMPL:
+            reference_medians[key] = median
+        reference_median = reference_medians.get(key)
+        speedup = (
+            f"{reference_median / median:>6.2f}x"
+            if reference_median is not None and median
+            else f"{'':>7}"
+        )
+        mark = "" if result.agrees else "  DISAGREES"
+        lines.append(
+            f"{result.input_name:<12}  {result.part:>4}  {result.impl:<12}  "
+            f"{median * 1000:>11.3f}  {speedup}  {result.answer!r}{mark}"
+        )
+    return "\n".join(lines)
+
+
+def format_comparisons(comparisons: list[Comparison]) -> str:
+    """
+    Format comparisons as a human-readable table, in milliseconds, marking regressions.
+    """
+    lines = [
+        f"{'Day':>3}  {'Phase':<6}  {'Baseline (ms)':>13}  {'Current (ms)':>12}  "
+        f"{'Change':>8}"
+    ]
+    for comparison in comparisons:
+        mark = "  REGRESSED" if comparison.regressed else ""
+        lines.append(
+            f"{comparison.day:>3}  {comparison.phase:<6}  "
+            f"{comparison.baseline * 1000:>13.3f}  {comparison.current * 1000:>12.3f}  "
+            f"{comparison.change:>+8.1%}{mark}"
+        )
+    return "\n".join(lines)
+
+
+def format_table(results: dict[int, dict[str, PhaseStats]]) -> str:
+    """
+    Format benchmark results as a human-readable table, in milliseconds.
+    """
+    lines = [
+        f"{'Day':>3}  {'Phase':<6}  {'Min (ms)':>10}  {'Median (ms)':>11}  "
+        f"{'P95 (ms)':>10}"
+    ]
+    for day, day_stats in results.items():
+        for phase, stats in day_stats.items():
+            lines.append(
+                f"{day:>3}  {phase:<6}  {stats.min * 1000:>10.3f}  "
+                f"{stats.median * 1000:>11.3f}  {stats.p95 * 1000:>10.3f}"
+            )
+    return "\n".join(lines)
+
+
+def format_instruments(instruments: dict[str, Instruments]) -> str:
+    """
+    Format a day's timers, in milliseconds, and counters as a human-readable report.
+    """
+    lines: list[str] = []
+    for phase, phase_instruments in instruments.items():
+        if not phase_instruments.timers and not phase_instruments.counters:
+            continue
+        lines.append(f"{phase}:")
+        for name, seconds in phase_instruments.timers.items():
+            lines.append(f"  {seconds * 1000:>12.3f} ms  {name}")
+        for name, count in phase_instruments.counters.items():
+            lines.append(f"  {count:>15,}  {name}")
+    return "\n".join(lines)
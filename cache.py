@@ -0,0 +1,227 @@
+# pyright: reportMissingTypeStubs=false
+"""
+On-disk caches keyed by input and solution source
+"""
+
+from __future__ import annotations
+
+import json
+import os
+import pickle
+from dataclasses import asdict, dataclass
+from datetime import datetime
+from hashlib import sha256
+from pathlib import Path
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from typing import Any
+
+CACHE_DIR = Path(__file__).resolve().parent / ".cache"
+
+
+def hash_file(path: Path) -> str:
+    """
+    Hash a file's content.
+    Args:
+        path (pathlib.Path): Path of the file
+    Returns:
+        (str): Hex SHA-256 digest of the content
+    """
+    with path.open("rb") as f:
+        return sha256(f.read()).hexdigest()
+
+
+class DataCache:
+    """
+    Pickled objects in a directory, evicted least-recently-used first once the
+    directory grows beyond a size limit
+    """
+
+    directory: Path
+    max_bytes: int
+
+    def __init__(
+        self, directory: Path = CACHE_DIR / "data", max_bytes: int = 256 * 2**20
+    ) -> None:
+        self.directory = directory
+        self.max_bytes = max_bytes
+
+    def get(self, key: str) -> Any:
+        """
+        Load a cached object.
+        Args:
+            key (str): Cache key
+        Returns:
+            (Any): The cached object
+        Raises:
+            KeyError: If nothing usable is cached under `key`
+        """
+        path = self._get_path(key)
+        try:
+            with path.open("rb") as f:
+                obj = pickle.load(f)
+        except FileNotFoundError as err:
+            raise KeyError(key) from err
+        except (pickle.UnpicklingError, EOFError, AttributeError, ImportError) as err:
+            # Corrupted or stale entry
+            path.unlink(missing_ok=True)
+            raise KeyError(key) from err
+        # Mark as recently used
+        os.utime(path)
+        return obj
+
+    def put(self, key: str, obj: Any) -> None:
+        """
+        Cache an object, then evict old entries if the cache is too large.
+        Args:
+            key (str): Cache key
+            obj (Any): Picklable object
+        """
+        self.directory.mkdir(parents=True, exist_ok=True)
+        path = self._get_path(key)
+        # Write then rename, so concurrent readers never see a partial file
+        tmp_path = path.with_suffix(f".{os.getpid()}.tmp")
+        with tmp_path.open("wb") as f:
+            pickle.dump(obj, f, protocol=pickle.HIGHEST_PROTOCOL)
+        tmp_path.replace(path)
+        self._evict()
+
+    def remove(self, key: str) -> None:
+        """
+        Remove a cached object, if any.
+        Args:
+            key (str): Cache key
+        """
+        self._get_path(key).unlink(missing_ok=True)
+
+    def clear(self) -> None:
+        """
+        Remove all cached objects.
+        """
+        for path in self.directory.glob("*.pickle"):
+            path.unlink(missing_ok=True)
+
+    def _get_path(self, key: str) -> Path:
+        """"""
+        return self.directory / f"{key}.pickle"
+
+    def _evict(self) -> None:
+        """"""
+        entries: list[tuple[float, int, Path]] = []
+        for path in self.directory.glob("*.pickle"):
+            try:
+                stat = path.stat()
+            except FileNotFoundError:
+                continue
+            entries.append((stat.st_mtime, stat.st_size, path))
+        total = sum(size for _, size, _ in entries)
+        # Oldest first
+        for _, size, path in sorted(entries):
+            if total <= self.max_bytes:
+                break
+            path.unlink(missing_ok=True)
+            total -= size
+
+
+@dataclass(frozen=True, kw_only=True)
+class StoredAnswer:
+    """
+    An answer computed earlier
+    """
+
+    answer: str | int
+    elapsed: float
+    computed_at: str
+
+
+class AnswerStore:
+    """
+    Computed answers in a JSON file, keyed by day, part, input hash and solution
+    source hash
+    """
+
+    path: Path
+
+    def __init__(self, path: Path = CACHE_DIR / "answers.json") -> None:
+        self.path = path
+
+    def get(
+        self, *, day: int, part: int, input_hash: str, source_hash: str
+    ) -> None | StoredAnswer:
+        """
+        Look up an answer.
+        Args:
+            day         (1..25): The day of AOC
+            part        (1, 2) : Part number
+            input_hash  (str)  : Hash of the input file
+            source_hash (str)  : Hash of the day's solution source
+        Returns:
+            (None | StoredAnswer): The stored answer, if any
+        """
+        entries = self._load().get(str(day), {}).get(str(part), {})
+        entry = entries.get(f"{input_hash}-{source_hash}")
+        if entry is None:
+            return None
+        return StoredAnswer(**entry)
+
+    def put(
+        self,
+        *,
+        day: int,
+        part: int,
+        input_hash: str,
+        source_hash: str,
+        answer: str | int,
+        elapsed: float,
+    ) -> None:
+        """
+        Store an answer.
+        Args:
+            day         (1..25)    : The day of AOC
+            part        (1, 2)     : Part number
+            input_hash  (str)      : Hash of the input file
+            source_hash (str)      : Hash of the day's solution source
+            answer      (str | int): The computed answer
+            elapsed     (float)    : Seconds it took to compute the answer
+        """
+        data = self._load()
+        entries = data.setdefault(str(day), {}).setdefault(str(part), {})
+        entries[f"{input_hash}-{source_hash}"] = asdict(
+            StoredAnswer(
+                answer=answer,
+                elapsed=elapsed,
+                computed_at=datetime.now().isoformat(timespec="seconds"),
+            )
+        )
+        self._dump(data)
+
+    def invalidate(self, day: int) -> int:
+        """
+        Forget all answers of a day.
+        Args:
+            day (1..25): The day of AOC
+        Returns:
+            (int): Number of answers forgotten
+        """
+        data = self._load()
+        parts = data.pop(str(day), {})
+        self._dump(data)
+        return sum(len(entries) for entries in parts.values())
+
+    def _load(self) -> dict[str, dict[str, dict[str, dict[str, Any]]]]:
+        """"""
+        try:
+            with self.path.open("r") as f:
+                return json.load(f)
+        except FileNotFoundError:
+            return {}
+
+    def _dump(self, data: dict[str, dict[str, dict[str, dict[str, Any]]]]) -> None:
+        """"""
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        tmp_path = self.path.with_suffix(f".{os.getpid()}.tmp")
+        with tmp_path.open("w") as f:
+            json.dump(data, f, indent=2)
+            f.write("\n")
+        tmp_path.replace(self.path)
@@ -0,0 +1,215 @@
+# pyright: reportMissingTypeStubs=false
+"""
+Long-lived process keeping solutions imported and parsed, answering over a Unix
+socket. Only available where Unix sockets are.
+"""
+
+from __future__ import annotations
+
+import json
+import os
+import socket
+import socketserver
+import sys
+from contextlib import redirect_stdout
+from dataclasses import dataclass
+from importlib import reload
+from time import perf_counter
+from typing import TYPE_CHECKING
+
+from cache import CACHE_DIR
+from runner import get_answer
+from utils import get_input_path, get_solution_class, get_solution_path
+
+if TYPE_CHECKING:
+    from pathlib import Path
+    from typing import Any
+
+    from utils import SolutionAbstract
+
+SOCKET_PATH = CACHE_DIR / "daemon.sock"
+
+# Seconds to wait for a daemon to accept a connection when checking if it is running
+_CONNECT_TIMEOUT = 0.5
+
+
+class DaemonError(RuntimeError):
+    """
+    Error reported by the daemon while handling a request
+    """
+
+
+@dataclass(kw_only=True)
+class _Resident:
+    """
+    Parsed solution kept in memory, with the state it was parsed from
+    """
+
+    input_mtime: int
+    use_cache: bool
+    solution_obj: SolutionAbstract
+    snapshot: Any
+
+
+class SolverDaemon:
+    """
+    Answers requests from parsed solutions kept in memory. A day's module is reloaded
+    when its `solution.py` changes, and its input is parsed again when the input
+    changes. Requests are JSON objects with a `day` and either a `part` or a `method`,
+    and optionally `use_cache` and the `impl` of the part.
+    """
+
+    def __init__(self) -> None:
+        self._source_mtimes: dict[int, int] = {}
+        self._residents: dict[int, _Resident] = {}
+
+    def handle(self, request: dict[str, Any]) -> dict[str, Any]:
+        """
+        Handle a request.
+        Args:
+            request (dict[str, Any]): The request
+        Returns:
+            (dict[str, Any]): The answer, or the method's result, with the seconds it
+                took and the seconds spent parsing for it, if any
+        """
+        day = int(request["day"])
+        use_cache = bool(request.get("use_cache", True))
+        reloaded = self._reload_if_changed(day)
+        parse_elapsed = 0.0
+        resident = self._residents.get(day)
+        input_mtime = get_input_path(day).stat().st_mtime_ns
+        if (
+            resident is None
+            or resident.input_mtime != input_mtime
+            or resident.use_cache != use_cache
+        ):
+            start = perf_counter()
+            solution_obj = get_solution_class(day)(use_cache=use_cache)
+            parse_elapsed = perf_counter() - start
+            resident = _Resident(
+                input_mtime=input_mtime,
+                use_cache=use_cache,
+                solution_obj=solution_obj,
+                snapshot=solution_obj.snapshot(),
+            )
+            self._residents[day] = resident
+
+        # Parts may mutate the data
+        solution_obj = resident.solution_obj
+        solution_obj.restore(resident.snapshot)
+        start = perf_counter()
+        if "method" in request:
+            result = getattr(solution_obj, request["method"])()
+        else:
+            result = get_answer(solution_obj, int(request["part"]), request.get("impl"))
+        return {
+            "ok": True,
+            "result": result,
+            "elapsed": perf_counter() - start,
+            "parse_elapsed": parse_elapsed,
+            "reloaded": reloaded,
+        }
+
+    def _reload_if_changed(self, day: int) -> bool:
+        """"""
+        source_mtime = get_solution_path(day).stat().st_mtime_ns
+        last_mtime = self._source_mtimes.get(day)
+        module = sys.modules.get(f"day_{day:>02}.solution")
+        reloaded = False
+        if module is not None and last_mtime not in (None, source_mtime):
+            self._residents.pop(day, None)
+            reload(module)
+            reloaded = True
+        # Only once reloaded, so that a module failing to reload is tried again
+        self._source_mtimes[day] = source_mtime
+        return reloaded
+
+
+class _RequestHandler(socketserver.StreamRequestHandler):
+    """
+    Handle JSON lines, one response line per request line
+    """
+
+    server: _Server
+
+    def handle(self) -> None:
+        """"""
+        for line in self.rfile:
+            try:
+                with open(os.devnull, "w") as null_fp, redirect_stdout(null_fp):
+                    response = self.server.solver.handle(json.loads(line))
+            except Exception as err:
+                response = {"ok": False, "error": f"{type(err).__name__}: {err}"}
+            # Results of methods may not be JSON-serializable
+            self.wfile.write(json.dumps(response, default=repr).encode() + b"\n")
+            self.wfile.flush()
+
+
+class _Server(socketserver.UnixStreamServer):
+    """
+    Server handling one connection at a time, as solutions keep state on classes
+    """
+
+    solver: SolverDaemon
+
+    def __init__(self, path: Path) -> None:
+        super().__init__(str(path), _RequestHandler)
+        self.solver = SolverDaemon()
+
+
+def serve(path: Path = SOCKET_PATH) -> None:
+    """
+    Serve requests until interrupted.
+    Args:
+        path (pathlib.Path): Path of the Unix socket to listen on
+    """
+    if is_running(path):
+        raise RuntimeError(f"A daemon is already listening on {path}")
+    # Left over by a daemon that was killed
+    path.unlink(missing_ok=True)
+    path.parent.mkdir(parents=True, exist_ok=True)
+    with _Server(path) as server:
+        try:
+            server.serve_forever()
+        finally:
+            path.unlink(missing_ok=True)
+
+
+def request(payload: dict[str, Any], path: Path = SOCKET_PATH) -> dict[str, Any]:
+    """
+    Send a request to a running daemon.
+    Args:
+        payload (dict[str, Any]): The request, see `SolverDaemon`
+        path    (pathlib.Path)  : Path of the daemon's Unix socket
+    Returns:
+        (dict[str, Any]): The response
+    Raises:
+        DaemonError: If the daemon failed to handle the request
+    """
+    with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as sock:
+        sock.connect(str(path))
+        sock.sendall(json.dumps(payload).encode() + b"\n")
+        with sock.makefile("r") as f:
+            response = json.loads(f.readline())
+    if not response["ok"]:
+        raise DaemonError(response["error"])
+    return response
+
+
+def is_running(path: Path = SOCKET_PATH) -> bool:
+    """
+    Check whether a daemon is listening.
+    Args:
+        path (pathlib.Path): Path of the daemon's Unix socket
+    Returns:
+        (bool): Whether a connection to the socket succeeds
+    """
+    if not path.exists():
+        return False
+    with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as sock:
+        sock.settimeout(_CONNECT_TIMEOUT)
+        try:
+            sock.connect(str(path))
+        except OSError:
+            return False
+    return True
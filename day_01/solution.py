@@ -5,23 +5,26 @@ from __future__ import annotations
 
 from typing import TYPE_CHECKING
 
-from utils import SolutionAbstract
+from utils import SolutionAbstract, iter_lines
 
 if TYPE_CHECKING:
+    from mmap import mmap
+
     _Data = list[list[int]]
 
 
 class Solution(SolutionAbstract):
     day = 1
+    reads_bytes = True
     data: _Data
 
-    def _process_data(self, raw_data: list[str]) -> _Data:
+    def _process_data(self, raw_data: mmap) -> _Data:
         """
         Process day 01 data.
         """
         data: _Data = []
         elf_calories: list[int] = []
-        for row in raw_data:
+        for row in iter_lines(raw_data):
             if row := row.strip():
                 elf_calories.append(int(row))
             else:
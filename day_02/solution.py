@@ -7,9 +7,10 @@ from dataclasses import dataclass
 from enum import Enum
 from typing import TYPE_CHECKING
 
-from utils import SolutionAbstract
+from utils import SolutionAbstract, iter_lines
 
 if TYPE_CHECKING:
+    from mmap import mmap
     from typing import Self
 
     _Data = list["_Round"]
@@ -68,13 +69,16 @@ class _Round:
 
 class Solution(SolutionAbstract):
     day = 2
+    reads_bytes = True
     data: _Data
 
-    def _process_data(self, raw_data: list[str]) -> _Data:
+    def _process_data(self, raw_data: mmap) -> _Data:
         """
         Process day 02 data.
         """
-        return [_Round.from_row(*line.split()) for line in raw_data]
+        return [
+            _Round.from_row(*line.decode().split()) for line in iter_lines(raw_data)
+        ]
 
     def part_1(self) -> int:
         """
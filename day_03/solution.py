@@ -5,21 +5,24 @@ from __future__ import annotations
 
 from typing import TYPE_CHECKING
 
-from utils import SolutionAbstract
+from utils import SolutionAbstract, iter_lines
 
 if TYPE_CHECKING:
-    _Data = list[str]
+    from mmap import mmap
+
+    _Data = list[bytes]
 
 
 class Solution(SolutionAbstract):
     day = 3
+    reads_bytes = True
     data: _Data
 
-    def _process_data(self, raw_data: list[str]) -> _Data:
+    def _process_data(self, raw_data: mmap) -> _Data:
         """
         Process day 03 data.
         """
-        return raw_data
+        return list(iter_lines(raw_data))
 
     def part_1(self) -> int:
         """
@@ -52,10 +55,10 @@ class Solution(SolutionAbstract):
         return sum_
 
     @staticmethod
-    def _to_priority(letter: str) -> int:
+    def _to_priority(letter: int) -> int:
         """"""
-        if "A" <= letter <= "Z":
-            return ord(letter) - 38
-        if "a" <= letter <= "z":
-            return ord(letter) - 96
-        raise ValueError(f"Unknown priority letter: {letter}")
+        if ord("A") <= letter <= ord("Z"):
+            return letter - 38
+        if ord("a") <= letter <= ord("z"):
+            return letter - 96
+        raise ValueError(f"Unknown priority letter: {chr(letter)}")
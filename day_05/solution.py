@@ -15,6 +15,7 @@ if TYPE_CHECKING:
 
 class Solution(SolutionAbstract):
     day = 5
+    mutates_data = True
     data: _Data
 
     def _process_data(self, raw_data: list[str]) -> _Data:
@@ -75,6 +76,14 @@ class Solution(SolutionAbstract):
             to_stack.stack(*from_stack.take(action.move_count))
         return "".join(stack.items[-1] for stack in self.data.stacks)
 
+    def _copy_data(self, data: _Data) -> _Data:
+        """"""
+        # Actions are never modified
+        return _Data(
+            stacks=[_Stack(stack.items.copy()) for stack in data.stacks],
+            actions=data.actions,
+        )
+
 
 @dataclass(frozen=True, kw_only=True)
 class _Data:
@@ -5,21 +5,24 @@ from __future__ import annotations
 
 from typing import TYPE_CHECKING
 
-from utils import SolutionAbstract
+from utils import SolutionAbstract, iter_lines
 
 if TYPE_CHECKING:
-    _Data = str
+    from mmap import mmap
+
+    _Data = bytes
 
 
 class Solution(SolutionAbstract):
     day = 6
+    reads_bytes = True
     data: _Data
 
-    def _process_data(self, raw_data: list[str]) -> _Data:
+    def _process_data(self, raw_data: mmap) -> _Data:
         """
         Process day 06 data.
         """
-        return raw_data[0].strip()
+        return next(iter_lines(raw_data)).strip()
 
     def part_1(self) -> int:
         """
@@ -5,9 +5,11 @@ from __future__ import annotations
 
 from typing import TYPE_CHECKING
 
-from utils import SolutionAbstract
+from utils import SolutionAbstract, iter_lines
 
 if TYPE_CHECKING:
+    from mmap import mmap
+
     _Data = list[list[int]]
     _R = int
     _C = int
@@ -16,13 +18,19 @@ if TYPE_CHECKING:
 
 class Solution(SolutionAbstract):
     day = 8
+    reads_bytes = True
     data: _Data
 
-    def _process_data(self, raw_data: list[str]) -> _Data:
+    def _process_data(self, raw_data: mmap) -> _Data:
         """
         Process day 08 data.
         """
-        return [list(map(int, list(r))) for row in raw_data if (r := row.strip())]
+        # Digits are bytes 48 to 57
+        return [
+            [height - 48 for height in r]
+            for row in iter_lines(raw_data)
+            if (r := row.strip())
+        ]
 
     def part_1(self) -> int:
         """
@@ -26,12 +26,16 @@ if TYPE_CHECKING:
 
 class Solution(SolutionAbstract):
     day = 11
+    mutates_data = True
     data: _Data
 
     def _process_data(self, raw_data: list[str]) -> _Data:
         """
         Process day 11 data.
         """
+        # Monkeys register themselves on the class. Start from a clean slate in case
+        #   the data has been processed before in this interpreter
+        _Monkey.reset()
         raw_data_iter = iter(raw_data)
         while True:
             # Index
@@ -122,6 +126,9 @@ class _Monkey:
     monkeys: ClassVar[list[_Monkey]] = []
     _monkey_divisor_lcm: ClassVar[None | int] = None
 
+    # Monkeys this one throws to. Kept per monkey rather than looked up on the class,
+    #   so that copies of the monkeys throw to each other
+    troop: list[_Monkey]
     index: int
     items: list[int]
     worry_increase: _WorryIncrease
@@ -144,6 +151,7 @@ class _Monkey:
         if len(_Monkey.monkeys) != index:
             raise ValueError("Monkeys not created in order")
         _Monkey.monkeys.append(self)
+        self.troop = _Monkey.monkeys
         self.index = index
         self.items = list(items)
         self.worry_increase = worry_increase
@@ -154,11 +162,17 @@ class _Monkey:
 
     @property
     def true_monkey(self) -> _Monkey:
-        return self.monkeys[self.true_monkey_index]
+        return self.troop[self.true_monkey_index]
 
     @property
     def false_monkey(self) -> _Monkey:
-        return self.monkeys[self.false_monkey_index]
+        return self.troop[self.false_monkey_index]
+
+    @classmethod
+    def reset(cls) -> None:
+        """"""
+        cls.monkeys = []
+        cls._monkey_divisor_lcm = None
 
     @classmethod
     def get_monkey_divisor_lcm(cls) -> int:
@@ -3,12 +3,13 @@
 
 from __future__ import annotations
 
+from collections import deque
 from dataclasses import dataclass
 from typing import TYPE_CHECKING
 
 import networkx as nx
 
-from utils import SolutionAbstract
+from utils import SolutionAbstract, implementation
 
 if TYPE_CHECKING:
     from typing import TypeAlias
@@ -57,17 +58,89 @@ class Solution(SolutionAbstract):
         """
         Day 12 part 1 solution.
         """
-        DG = self._get_graph()
-        return nx.shortest_path_length(DG, source=self.data.start, target=self.data.end)
+        with self.timer("build graph"):
+            DG = self._get_graph()
+        with self.timer("shortest path"):
+            return nx.shortest_path_length(
+                DG, source=self.data.start, target=self.data.end
+            )
 
     def part_2(self) -> int:
         """
         Day 12 part 2 solution.
         """
-        DG = self._get_graph()
-        lengths: dict[_Coord, int] = nx.shortest_path_length(DG, target=self.data.end)
+        with self.timer("build graph"):
+            DG = self._get_graph()
+        with self.timer("shortest path"):
+            lengths: dict[_Coord, int] = nx.shortest_path_length(
+                DG, target=self.data.end
+            )
+        self.count("cells reaching the end", len(lengths))
         return min(length for (r, c), length in lengths.items() if self.data[r, c] == 1)
 
+    @implementation(1, "bfs")
+    def part_1_bfs(self) -> int:
+        """
+        Day 12 part 1 solution, searching the flat height array.
+        """
+        width = len(self.data.data[0])
+        r, c = self.data.start
+        with self.timer("bfs"):
+            distance = self._get_distances_to_end()[r * width + c]
+        if distance < 0:
+            raise ValueError("No path from the start to the end")
+        return distance
+
+    @implementation(2, "bfs")
+    def part_2_bfs(self) -> int:
+        """
+        Day 12 part 2 solution, searching the flat height array.
+        """
+        heights = [height for row in self.data.data for height in row]
+        with self.timer("bfs"):
+            distances = self._get_distances_to_end()
+        return min(
+            distance
+            for height, distance in zip(heights, distances)
+            if height == 1 and distance >= 0
+        )
+
+    def _get_distances_to_end(self) -> list[int]:
+        """
+        Breadth-first search back from the end, over the heights flattened row by
+        row. Gets the steps from each cell to the end, `-1` where it can't be reached.
+        """
+        width = len(self.data.data[0])
+        heights = [height for row in self.data.data for height in row]
+        size = len(heights)
+        end_r, end_c = self.data.end
+        end = end_r * width + end_c
+        distances = [-1] * size
+        distances[end] = 0
+        queue = deque([end])
+        while queue:
+            index = queue.popleft()
+            # Cells that can step up to this one
+            min_height = heights[index] - 1
+            distance = distances[index] + 1
+            c = index % width
+            neighbors = [index - width, index + width]
+            if c > 0:
+                neighbors.append(index - 1)
+            if c < width - 1:
+                neighbors.append(index + 1)
+            for neighbor in neighbors:
+                if (
+                    0 <= neighbor < size
+                    and distances[neighbor] < 0
+                    and heights[neighbor] >= min_height
+                ):
+                    distances[neighbor] = distance
+                    queue.append(neighbor)
+        # Each of them is visited once
+        self.count("cells reaching the end", size - distances.count(-1))
+        return distances
+
     def _get_graph(self) -> nx.DiGraph:
         """"""
         DG = nx.DiGraph()
@@ -84,6 +157,8 @@ class Solution(SolutionAbstract):
                     for (nr, nc), nh in self.data.get_neighbors(r, c).items()
                     if nh <= max_h
                 )
+        self.count("graph nodes", DG.number_of_nodes())
+        self.count("graph edges", DG.number_of_edges())
         return DG
 
 
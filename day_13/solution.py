@@ -3,16 +3,19 @@
 
 from __future__ import annotations
 
+from bisect import bisect_right
 from dataclasses import dataclass
-from functools import total_ordering
+from functools import cache, total_ordering
 from typing import TYPE_CHECKING
 
-from utils import SolutionAbstract
+from utils import SolutionAbstract, implementation
 
 if TYPE_CHECKING:
     from typing import Literal
 
     _PacketContent = int | list["_PacketContent"]
+    # Nested tuples with all integers at the same depth
+    _PacketKey = int | tuple["_PacketKey", ...]
     _Data = list["_PacketPair"]
 
 
@@ -47,16 +50,37 @@ class Solution(SolutionAbstract):
         """
         Day 13 part 2 solution.
         """
+        dividers = [_Packet([[2]]), _Packet([[6]])]
         packets = [packet for pair in self.data for packet in (pair.left, pair.right)]
-        packets.extend([_Packet([[2]]), _Packet([[6]])])
+        packets.extend(dividers)
         packets.sort()
 
         prod = 1
         for i, packet in enumerate(packets, start=1):
-            if packet.data == [[2]] or packet.data == [[6]]:
+            # The dividers themselves, not the packets equal to them
+            if any(packet is divider for divider in dividers):
                 prod *= i
         return prod
 
+    @implementation(2, "key")
+    def part_2_key(self) -> int:
+        """
+        Day 13 part 2 solution, sorting by packet keys.
+        """
+        dividers: list[_PacketContent] = [[[2]], [[6]]]
+        contents = [
+            packet.data for pair in self.data for packet in (pair.left, pair.right)
+        ]
+        contents.extend(dividers)
+        depth = max(_get_depth(content) for content in contents)
+        keys = sorted(_to_key(content, depth) for content in contents)
+
+        prod = 1
+        for divider in dividers:
+            # After the packets it ties with, like the stable sort of `part_2` puts it
+            prod *= bisect_right(keys, _to_key(divider, depth))
+        return prod
+
 
 @total_ordering
 @dataclass(frozen=True)
@@ -119,3 +143,37 @@ def _compare_packet_contents(
             if len(left) < len(right):
                 return -1
             return 0
+
+
+def _get_depth(content: _PacketContent) -> int:
+    """
+    Get how many lists deep a packet content nests.
+    """
+    if isinstance(content, int):
+        return 0
+    return 1 + max(map(_get_depth, content), default=0)
+
+
+def _to_key(content: _PacketContent, depth: int) -> _PacketKey:
+    """
+    Convert a packet content to nested tuples comparing like the content does with
+    `_compare_packet_contents`. Every integer is wrapped in single-element tuples
+    down to `depth`, as an integer compares like the list of itself, so that lists
+    are never compared to integers. Keys compare only with keys of the same depth,
+    which must be at least the depth of every content compared.
+    """
+    if isinstance(content, int):
+        return _wrap_int(content, depth)
+    return tuple([_to_key(el, depth - 1) for el in content])
+
+
+@cache
+def _wrap_int(value: int, depth: int) -> _PacketKey:
+    """
+    Wrap an integer in `depth` single-element tuples. Packets hold few distinct
+    integers, so wrapped ones are shared.
+    """
+    key: _PacketKey = value
+    for _ in range(depth):
+        key = (key,)
+    return key
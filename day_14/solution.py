@@ -3,6 +3,7 @@
 
 from __future__ import annotations
 
+import copy
 from enum import Enum
 from itertools import count
 from typing import TYPE_CHECKING
@@ -20,6 +21,7 @@ if TYPE_CHECKING:
 
 class Solution(SolutionAbstract):
     day = 14
+    mutates_data = True
     data: _Data
 
     def _process_data(self, raw_data: list[str]) -> _Data:
@@ -43,6 +45,9 @@ class Solution(SolutionAbstract):
             stop_reason = self.data.drop_sand()
             if stop_reason == Map.StopReason.VOID:
                 break
+        # Including the one falling into the void
+        self.count("grains dropped", i + 1)
+        self.count("cells touched", self.data.cells_touched)
         return i
 
     def part_2(self) -> int:
@@ -55,8 +60,15 @@ class Solution(SolutionAbstract):
             stop_reason = self.data.drop_sand()
             if stop_reason == Map.StopReason.FULL:
                 break
+        # Including the one finding the source blocked
+        self.count("grains dropped", i + 1)
+        self.count("cells touched", self.data.cells_touched)
         return i
 
+    def _copy_data(self, data: _Data) -> _Data:
+        """"""
+        return data.copy()
+
 
 class Map:
     """"""
@@ -64,6 +76,8 @@ class Map:
     map_: list[list[Block]]
     max_r: int
     has_floor: bool
+    # Cells grains of sand have passed through
+    cells_touched: int
 
     class Block(Enum):
         AIR = " "
@@ -80,6 +94,7 @@ class Map:
         max_c = 500 + self.max_r + 3
         self.map_ = [[Map.Block.AIR] * (max_c + 1) for _ in range(self.max_r + 3)]
         self.has_floor = False
+        self.cells_touched = 0
 
         for line in lines:
             self.add_line(line)
@@ -91,6 +106,12 @@ class Map:
             for row in self.map_
         )
 
+    def copy(self) -> Map:
+        """"""
+        new_map = copy.copy(self)
+        new_map.map_ = [row.copy() for row in self.map_]
+        return new_map
+
     def add_line(self, line: list[_Coord]) -> None:
         """"""
         line = line.copy()
@@ -133,6 +154,7 @@ class Map:
             nr = r + 1
             if not self.has_floor and nr > self.max_r:
                 # Fell into the void
+                self.cells_touched += nr
                 return Map.StopReason.VOID
             nc = c
             if self.map_[nr][nc] != Map.Block.AIR:
@@ -144,6 +166,8 @@ class Map:
                     if self.map_[nr][nc] != Map.Block.AIR:
                         # Settle on top
                         self.map_[r][c] = Map.Block.SAND
+                        # One cell per row, from the top
+                        self.cells_touched += nr
                         return Map.StopReason.SETTLED
             # Keep dropping
             r = nr
@@ -25,6 +25,7 @@ _REPORT_RE = re.compile(
 
 class Solution(SolutionAbstract):
     day = 15
+    cache_data = True
     data: _Data
 
     def _process_data(self, raw_data: list[str]) -> _Data:
@@ -9,7 +9,6 @@ from functools import cached_property
 from itertools import permutations
 
 import networkx as nx
-from matplotlib import pyplot as plt
 
 from utils import SolutionAbstract
 
@@ -20,6 +19,7 @@ _LINE_RE = re.compile(
 
 class Solution(SolutionAbstract):
     day = 16
+    cache_data = True
     data: _Data
 
     def _process_data(self, raw_data: list[str]) -> _Data:
@@ -48,10 +48,18 @@ class Solution(SolutionAbstract):
         Day 16 part 1 solution.
         """
         valves = self.data.valves
-        shortest_lengths = self.data.lengths_map
+        # Computed by whichever part runs first
+        with self.timer("lengths map"):
+            shortest_lengths = self.data.lengths_map
+        states = 0
+        max_depth = 0
 
         def run(*, path: list[str], time: int, score: int, score_delta: int) -> int:
             """"""
+            nonlocal states, max_depth
+            states += 1
+            # Valves opened so far
+            max_depth = max(max_depth, len(path) - 1)
             node = path[-1]
             possible_ends = [
                 end
@@ -73,14 +81,35 @@ class Solution(SolutionAbstract):
             # Get max score
             return max_score
 
-        return run(path=["AA"], time=30, score=0, score_delta=0)
+        # Searched one first valve at a time, to resume from the branches done
+        checkpoint = self.checkpoint("part_1")
+        branch_scores: dict[str, int] = checkpoint.load() or {}
+        with self.timer("search"):
+            for end, travel_time in shortest_lengths["AA"].items():
+                if end in branch_scores or travel_time >= 30:
+                    continue
+                branch_scores[end] = run(
+                    path=["AA", end],
+                    time=30 - travel_time - 1,
+                    score=0,
+                    score_delta=valves[end],
+                )
+                checkpoint.save(branch_scores)
+        checkpoint.clear()
+        self.count("states expanded", states)
+        self.count_max("max depth", max_depth)
+        return max(branch_scores.values(), default=0)
 
     def part_2(self) -> int:
         """
         Day 16 part 2 solution.
         """
         valves = self.data.valves
-        shortest_lengths = self.data.lengths_map
+        with self.timer("lengths map"):
+            shortest_lengths = self.data.lengths_map
+        emit = self.emit
+        states = 0
+        max_depth = 0
 
         # cache: dict[tuple[frozenset[_Player], int, int, int], int] = {}
 
@@ -93,7 +122,11 @@ class Solution(SolutionAbstract):
             # if cached is not None:
             #     return cached
 
-            print(f"Trying {p1=}; {p2=}; {time=}; {score=}; {score_delta=}")
+            nonlocal states, max_depth
+            states += 1
+            # Minutes passed
+            max_depth = max(max_depth, 26 - time)
+            emit("search", time=time, score=score, score_delta=score_delta)
             # Wander around for the rest of the time
             max_score = score + time * score_delta
             # P1 in waiting
@@ -159,16 +192,38 @@ class Solution(SolutionAbstract):
             # cache[key] = max_score
             return max_score
 
-        return run(
-            p1=_Player(visited=("AA",), wait=0),
-            p2=_Player(visited=("AA",), wait=0),
-            time=26,
-            score=0,
-            score_delta=0,
-        )
+        # Searched one pair of first valves at a time, to resume from the branches
+        #   done
+        first_states = [
+            (_Player(visited=("AA", end), wait=travel_time), valves[end])
+            for end, travel_time in shortest_lengths["AA"].items()
+            if travel_time < 26
+        ]
+        checkpoint = self.checkpoint("part_2")
+        branch_scores: dict[tuple[str, str], int] = checkpoint.load() or {}
+        with self.timer("search"):
+            for np1, ndelta1 in first_states:
+                for np2, ndelta2 in first_states:
+                    ends = (np1.visited[-1], np2.visited[-1])
+                    if ends[0] == ends[1] or ends in branch_scores:
+                        continue
+                    branch_scores[ends] = run(
+                        p1=np1,
+                        p2=np2,
+                        time=25,
+                        score=0,
+                        score_delta=ndelta1 + ndelta2,
+                    )
+                    checkpoint.save(branch_scores)
+        checkpoint.clear()
+        self.count("states expanded", states)
+        self.count_max("max depth", max_depth)
+        return max(branch_scores.values(), default=0)
 
     def draw_graph(self) -> None:
         """"""
+        from matplotlib import pyplot as plt
+
         G = self.data.graph
         fig, ax = plt.subplots(nrows=1, ncols=1)
         nx.draw(
@@ -7,15 +7,20 @@ from dataclasses import dataclass
 from itertools import cycle
 from typing import TYPE_CHECKING
 
-from utils import SolutionAbstract
+from utils import SolutionAbstract, iter_lines
 
 if TYPE_CHECKING:
+    from mmap import mmap
+
+    from utils import Checkpoint
+
     _Coord = complex  # Bottom is 0+0j to 6+0j
     _Data = list[str]
 
 
 class Solution(SolutionAbstract):
     day = 17
+    reads_bytes = True
     data: _Data
 
     _ROCKS = [
@@ -26,12 +31,12 @@ class Solution(SolutionAbstract):
         [0 + 0j, 1 + 0j, 0 + 1j, 1 + 1j],
     ]
 
-    def _process_data(self, raw_data: list[str]) -> _Data:
+    def _process_data(self, raw_data: mmap) -> _Data:
         """
         Process day 17 data.
         """
-        (line,) = raw_data
-        return list(line)
+        (line,) = iter_lines(raw_data)
+        return list(line.decode())
 
     def part_1(self) -> int:
         """
@@ -43,20 +48,44 @@ class Solution(SolutionAbstract):
         """
         Day 17 part 2 solution.
         """
-        map_: set[_Coord] = set()
-        rock_patterns = cycle(self._ROCKS)
-        movements = cycle(self.data)
+        # The hunt is the slow half, so it is kept until the height is found
+        checkpoint = self.checkpoint("cycle")
+        stone_cycle, height_cycle = self._find_cycle(checkpoint)
+        self.emit("cycle", rocks=stone_cycle, height=height_cycle)
+        target = 1_000_000_000_000
+        cycle_count, cycle_remainder = divmod(target, stone_cycle)
+        height = cycle_count * height_cycle + self._get_height_after_stones(
+            cycle_remainder
+        )
+        checkpoint.clear()
+        return height
+
+    def _find_cycle(self, checkpoint: Checkpoint) -> tuple[int, int]:
+        """
+        Find how many rocks fall, and how much the tower grows, in each cycle. The
+        hunt is saved to the checkpoint as rocks come to rest, and resumed from it.
+        """
         movement_len = len(self.data)
-        # Make linter happy
-        has_rock_moving = True
-        rock = self._create_rock(pattern=next(rock_patterns), map_=map_)
-        # Cycle vars
-        last_past_10_rows: None | set[_Coord] = None
-        last_rock_count = 0
-        last_movement_index = 0
-        last_movement_height = 0
-        rock_count = 0
-        movement_count = 0
+        state = checkpoint.load()
+        if state is None:
+            state = (set(), 0, 0, None, 0, 0, 0)
+        (
+            map_,
+            rock_count,
+            movement_count,
+            # Cycle vars
+            last_past_10_rows,
+            last_rock_count,
+            last_movement_index,
+            last_movement_height,
+        ) = state
+        # Carry on from the rock and the movement after the last one
+        rock_index = rock_count % len(self._ROCKS)
+        rock_patterns = cycle(self._ROCKS[rock_index:] + self._ROCKS[:rock_index])
+        movement_index = movement_count % movement_len
+        movements = cycle(self.data[movement_index:] + self.data[:movement_index])
+        has_rock_moving = False
+        rock: _Rock
         while True:
             if not has_rock_moving:
                 pattern = next(rock_patterns)
@@ -80,7 +109,10 @@ class Solution(SolutionAbstract):
                         ):
                             stone_cycle = rock_count - last_rock_count
                             height_cycle = movement_height - last_movement_height
-                            break
+                            self.count("rocks dropped", rock_count)
+                            # Of the rock moving sideways, then down
+                            self.count("collision checks", 2 * movement_count)
+                            return stone_cycle, height_cycle
                 rock = self._create_rock(pattern=pattern, map_=map_)
                 has_rock_moving = True
             match next(movements):
@@ -96,13 +128,17 @@ class Solution(SolutionAbstract):
                 has_rock_moving = False
                 map_.update(rock.coords)
                 rock_count += 1
-
-        print(f"{stone_cycle=} {height_cycle=}")
-        target = 1_000_000_000_000
-        cycle_count, cycle_remainder = divmod(target, stone_cycle)
-        return cycle_count * height_cycle + self._get_height_after_stones(
-            cycle_remainder
-        )
+                checkpoint.save(
+                    (
+                        map_,
+                        rock_count,
+                        movement_count,
+                        last_past_10_rows,
+                        last_rock_count,
+                        last_movement_index,
+                        last_movement_height,
+                    )
+                )
 
     def _get_height_after_stones(self, n: int) -> int:
         """"""
@@ -113,6 +149,7 @@ class Solution(SolutionAbstract):
         has_rock_moving = True
         rock = self._create_rock(pattern=next(rock_patterns), map_=map_)
         rock_count = 0
+        movement_count = 0
         while rock_count < n:
             if not has_rock_moving:
                 rock = self._create_rock(pattern=next(rock_patterns), map_=map_)
@@ -124,12 +161,16 @@ class Solution(SolutionAbstract):
                     rock.move_right(map_)
                 case move:
                     raise ValueError(f"Invalid movement: {move}")
+            movement_count += 1
             stopped = rock.move_down(map_)
             if stopped:
                 has_rock_moving = False
                 map_.update(rock.coords)
                 rock_count += 1
 
+        self.count("rocks dropped", rock_count)
+        # Of the rock moving sideways, then down
+        self.count("collision checks", 2 * movement_count)
         # self._print_space(map_=map_, rock=rock)
         return int(max(coord.imag for coord in map_) + 1)
 
@@ -3,11 +3,12 @@
 
 from __future__ import annotations
 
+from collections import deque
 from typing import TYPE_CHECKING
 
 import networkx as nx
 
-from utils import SolutionAbstract
+from utils import SolutionAbstract, implementation
 
 if TYPE_CHECKING:
     from collections.abc import Generator
@@ -71,12 +72,16 @@ class Solution(SolutionAbstract):
                     if neighbor_coord in all_air_coords
                 ]
             )
+        self.count("graph nodes", G.number_of_nodes())
+        self.count("graph edges", G.number_of_edges())
 
         target_coord = (x_min - 1, y_min - 1, z_min - 1)
-        print(f"X range: {x_min} ~ {x_max}")
-        print(f"Y range: {y_min} ~ {y_max}")
-        print(f"Z range: {z_min} ~ {z_max}")
-        for airx in range(x_min, x_max + 1):
+        self.emit("bounds", x=[x_min, x_max], y=[y_min, y_max], z=[z_min, z_max])
+        x_count = x_max - x_min + 1
+        inside_count = 0
+        path_searches = 0
+        for i, airx in enumerate(range(x_min, x_max + 1)):
+            self.emit("scan", done=i, total=x_count, inside=inside_count)
             for airy in range(y_min, y_max + 1):
                 for airz in range(z_min, z_max + 1):
                     air_coord = (airx, airy, airz)
@@ -84,15 +89,54 @@ class Solution(SolutionAbstract):
                     if air_coord in droplets_set:
                         continue
                     # Can reach outside
+                    path_searches += 1
                     if nx.has_path(G, air_coord, target_coord):
                         continue
                     # Found inside air. Remove all faces touching
-                    print(f"  Found inside air at {air_coord}")
+                    inside_count += 1
                     for neighbor_coord in self._get_neighbors(air_coord):
                         all_faces -= neighbor_coord in droplets_set
+        self.emit("scan", done=x_count, total=x_count, inside=inside_count)
+        self.count("path searches", path_searches)
 
         return all_faces
 
+    @implementation(2, "flood")
+    def part_2_flood(self) -> int:
+        """
+        Day 18 part 2 solution, counting the faces reached by air flooding in from
+        around the droplets.
+        """
+        droplets_set = set(self.data)
+        x_min = min(x for x, _, _ in self.data) - 1
+        x_max = max(x for x, _, _ in self.data) + 1
+        y_min = min(y for _, y, _ in self.data) - 1
+        y_max = max(y for _, y, _ in self.data) + 1
+        z_min = min(z for _, _, z in self.data) - 1
+        z_max = max(z for _, _, z in self.data) + 1
+
+        start = (x_min, y_min, z_min)
+        outside = {start}
+        queue = deque([start])
+        faces = 0
+        while queue:
+            coord = queue.popleft()
+            for neighbor_coord in self._get_neighbors(coord):
+                if neighbor_coord in droplets_set:
+                    faces += 1
+                    continue
+                x, y, z = neighbor_coord
+                if (
+                    neighbor_coord not in outside
+                    and x_min <= x <= x_max
+                    and y_min <= y <= y_max
+                    and z_min <= z <= z_max
+                ):
+                    outside.add(neighbor_coord)
+                    queue.append(neighbor_coord)
+        self.count("outside cells visited", len(outside))
+        return faces
+
     @staticmethod
     def _get_neighbors(coord: _Coord) -> Generator[_Coord, None, None]:
         """"""
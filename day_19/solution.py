@@ -24,6 +24,7 @@ _BLUEPRINT_RE = re.compile(
 
 class Solution(SolutionAbstract):
     day = 19
+    cache_data = True
     data: _Data
 
     def _process_data(self, raw_data: list[str]) -> _Data:
@@ -54,15 +55,22 @@ class Solution(SolutionAbstract):
         """
         Day 19 part 1 solution.
         """
-        sum_ = 0
+        checkpoint = self.checkpoint("part_1")
+        # Geodes opened by each blueprint run so far
+        geodes: dict[int, int] = checkpoint.load() or {}
         l = len(self.data)
-        ll = len(str(l))
-        for i, b in enumerate(self.data, start=1):
-            print(f"\r\x1b[KRunning blueprint #{i:>{ll}}/{l}...", end="\r")
+        for i, b in enumerate(self.data):
+            self.emit("blueprint", done=i, total=l)
+            if b.index in geodes:
+                continue
             runner = _BlueprintRunner(b)
-            sum_ += b.index * runner.run()
-        print()
-        return sum_
+            geodes[b.index] = runner.run()
+            self.count("states expanded", runner.run_count)
+            self.count_max("max depth", runner.max_depth)
+            checkpoint.save(geodes)
+        self.emit("blueprint", done=l, total=l)
+        checkpoint.clear()
+        return sum(index * geode_count for index, geode_count in geodes.items())
 
     def part_2(self) -> ...:
         """
@@ -74,9 +82,14 @@ class _BlueprintRunner:
     """"""
 
     blueprint: _Blueprint
+    run_count: int
+    # Deepest recursion of `_run`, i.e. most robots built
+    max_depth: int
 
     def __init__(self, blueprint: _Blueprint) -> None:
         self.blueprint = blueprint
+        self.run_count = 0
+        self.max_depth = 0
 
     def run(self) -> int:
         """"""
@@ -86,9 +99,17 @@ class _BlueprintRunner:
         return resource_count.geode
 
     def _run(
-        self, *, time: int, robots: _RobotCount, resources: _ResourceCount
+        self,
+        *,
+        time: int,
+        robots: _RobotCount,
+        resources: _ResourceCount,
+        depth: int = 0,
     ) -> _ResourceCount:
         """"""
+        self.run_count += 1
+        if depth > self.max_depth:
+            self.max_depth = depth
         if time < 0:
             raise ValueError(f"Negative time: {time=} {robots=} {resources=}")
         if time == 0:
@@ -114,6 +135,7 @@ class _BlueprintRunner:
                 ceil(max(0, ore_robot_ore_cost - resources.ore) / robots.ore) + 1
             )
             new_resources = self._run(
+                depth=depth + 1,
                 time=time - time_needed,
                 robots=robots.diff_copy(ore=1),
                 resources=resources.pass_time(
@@ -129,6 +151,7 @@ class _BlueprintRunner:
                 ceil(max(0, clay_robot_ore_cost - resources.ore) / robots.ore) + 1
             )
             new_resources = self._run(
+                depth=depth + 1,
                 time=time - time_needed,
                 robots=robots.diff_copy(clay=1),
                 resources=resources.pass_time(
@@ -153,6 +176,7 @@ class _BlueprintRunner:
                 + 1
             )
             new_resources = self._run(
+                depth=depth + 1,
                 time=time - time_needed,
                 robots=robots.diff_copy(obby=1),
                 resources=resources.pass_time(
@@ -177,6 +201,7 @@ class _BlueprintRunner:
                 + 1
             )
             new_resources = self._run(
+                depth=depth + 1,
                 time=time - time_needed,
                 robots=robots.diff_copy(geode=1),
                 resources=resources.pass_time(
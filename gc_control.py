@@ -0,0 +1,137 @@
+# pyright: reportMissingTypeStubs=false
+"""
+Control and measure the cyclic garbage collector while solutions run
+"""
+
+from __future__ import annotations
+
+import gc
+from contextlib import contextmanager
+from dataclasses import dataclass
+from time import perf_counter
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from collections.abc import Generator
+    from typing import Any
+
+# How the collector runs during a part:
+# - default : untouched, only measured
+# - freeze  : objects created while parsing are moved out of the collector's reach
+# - tuned   : collections are triggered less often, see `_TUNED_THRESHOLDS`
+# - disabled: no automatic collections, as a bound of the collector's overhead
+GC_MODES = ("default", "freeze", "tuned", "disabled")
+
+# Allocations triggering a young collection, and collections of each generation
+# triggering one of the next. Python defaults to (700, 10, 10)
+_TUNED_THRESHOLDS = (50_000, 20, 20)
+
+
+@dataclass(frozen=True, kw_only=True)
+class GcStats:
+    """
+    Collections the garbage collector ran during a call
+    """
+
+    mode: str
+    # Collections of each generation, youngest first
+    collections: tuple[int, int, int]
+    # Unreachable objects found
+    collected: int
+    # Total and longest time spent collecting, in seconds
+    pause: float
+    max_pause: float
+
+
+class GcMonitor:
+    """
+    Records collections through `gc.callbacks` while entered
+    """
+
+    mode: str
+    collections: list[int]
+    collected: int
+    pause: float
+    max_pause: float
+
+    def __init__(self, mode: str = "default") -> None:
+        self.mode = mode
+        self.collections = [0, 0, 0]
+        self.collected = 0
+        self.pause = 0.0
+        self.max_pause = 0.0
+        self._start = 0.0
+
+    def __enter__(self) -> GcMonitor:
+        gc.callbacks.append(self._callback)
+        return self
+
+    def __exit__(self, *exc_info: Any) -> None:
+        gc.callbacks.remove(self._callback)
+
+    def stats(self) -> GcStats:
+        """"""
+        c0, c1, c2 = self.collections
+        return GcStats(
+            mode=self.mode,
+            collections=(c0, c1, c2),
+            collected=self.collected,
+            pause=self.pause,
+            max_pause=self.max_pause,
+        )
+
+    def _callback(self, phase: str, info: dict[str, int]) -> None:
+        """"""
+        if phase == "start":
+            self._start = perf_counter()
+            return
+        pause = perf_counter() - self._start
+        self.collections[info["generation"]] += 1
+        self.collected += info["collected"]
+        self.pause += pause
+        self.max_pause = max(self.max_pause, pause)
+
+
+@contextmanager
+def gc_mode(mode: str) -> Generator[GcMonitor, None, None]:
+    """
+    Run the collector in one of `GC_MODES` and measure it, restoring its state on
+    exit. Freezing moves everything alive on entry, e.g. parsed data, to a
+    generation that is never collected, so it should be entered right after parsing.
+    Args:
+        mode (str): One of `GC_MODES`
+    Returns:
+        (Generator[GcMonitor]): Monitor holding the collections run while entered
+    """
+    if mode not in GC_MODES:
+        raise ValueError(f"Unknown GC mode {mode!r}, expected one of {GC_MODES}")
+    was_enabled = gc.isenabled()
+    thresholds = gc.get_threshold()
+    match mode:
+        case "freeze":
+            gc.freeze()
+        case "tuned":
+            gc.set_threshold(*_TUNED_THRESHOLDS)
+        case "disabled":
+            gc.disable()
+    try:
+        with GcMonitor(mode) as monitor:
+            yield monitor
+    finally:
+        if mode == "freeze":
+            gc.unfreeze()
+        gc.set_threshold(*thresholds)
+        if was_enabled:
+            gc.enable()
+
+
+def format_gc(stats: GcStats) -> str:
+    """
+    Format collector stats on one line.
+    """
+    collections = "/".join(str(count) for count in stats.collections)
+    return (
+        f"gc {stats.mode}: {collections} collections (gen 0/1/2), "
+        f"{stats.collected:,} collected, {stats.pause * 1000:.1f} ms paused "
+        f"(max {stats.max_pause * 1000:.1f} ms)"
+    )
@@ -0,0 +1,40 @@
+# pyright: reportMissingTypeStubs=false
+"""
+Synthetic puzzle inputs of arbitrary size, to see how solutions scale
+"""
+
+from __future__ import annotations
+
+from importlib import import_module
+from pathlib import Path
+from random import Random
+
+
+def generate(day: int, scale: float = 1.0, seed: int = 0) -> str:
+    """
+    Generate a valid input for a day.
+    Args:
+        day   (1..25): The day of AOC
+        scale (float): Size relative to a real input
+        seed  (int)  : Seed of the random generator, for reproducible inputs
+    Returns:
+        (str): The input, ending with a newline
+    """
+    if day not in get_generator_days():
+        raise ValueError(f"No generator for day {day}.")
+    if scale <= 0:
+        raise ValueError(f"{scale=} must be positive")
+    generator_module = import_module(f"generators.day_{day:>02}")
+    return generator_module.generate(scale, Random(seed))
+
+
+def get_generator_days() -> list[int]:
+    """
+    Get all days with a generator.
+    Returns:
+        (list[int]): Sorted day numbers
+    """
+    generators_dir = Path(__file__).resolve().parent
+    return [
+        day for day in range(1, 26) if (generators_dir / f"day_{day:>02}.py").exists()
+    ]
@@ -0,0 +1,23 @@
+# pyright: reportMissingTypeStubs=false
+"""
+Day 01: Groups of calorie counts separated by blank lines
+"""
+
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from random import Random
+
+# A real input has about this many elves
+_ELF_COUNT = 250
+
+
+def generate(scale: float, rng: Random) -> str:
+    """"""
+    elves = [
+        "\n".join(str(rng.randint(1000, 60000)) for _ in range(rng.randint(1, 15)))
+        for _ in range(max(1, round(_ELF_COUNT * scale)))
+    ]
+    return "\n\n".join(elves) + "\n"
@@ -0,0 +1,21 @@
+# pyright: reportMissingTypeStubs=false
+"""
+Day 02: Rock paper scissors rounds
+"""
+
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from random import Random
+
+_ROUND_COUNT = 2500
+
+
+def generate(scale: float, rng: Random) -> str:
+    """"""
+    return "".join(
+        f"{rng.choice('ABC')} {rng.choice('XYZ')}\n"
+        for _ in range(max(1, round(_ROUND_COUNT * scale)))
+    )
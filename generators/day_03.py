@@ -0,0 +1,53 @@
+# pyright: reportMissingTypeStubs=false
+"""
+Day 03: Rucksacks in groups of 3. The two halves of each rucksack share exactly one
+item, and the 3 rucksacks of a group share exactly one item
+"""
+
+from __future__ import annotations
+
+from string import ascii_letters
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from random import Random
+
+_GROUP_COUNT = 100
+
+
+def generate(scale: float, rng: Random) -> str:
+    """"""
+    lines: list[str] = []
+    for _ in range(max(1, round(_GROUP_COUNT * scale))):
+        letters = list(ascii_letters)
+        rng.shuffle(letters)
+        badge = letters.pop()
+        # Each rucksack gets its own letters, so only the badge is shared by all 3
+        for i in range(3):
+            lines.append(_generate_rucksack(rng, badge, letters[17 * i : 17 * i + 17]))
+    return "\n".join(lines) + "\n"
+
+
+def _generate_rucksack(rng: Random, badge: str, letters: list[str]) -> str:
+    """"""
+    letters = letters + [badge]
+    rng.shuffle(letters)
+    common = letters.pop()
+    # Halves only share the common item
+    split = len(letters) // 2
+    first_only = letters[:split]
+    second_only = letters[split:]
+    if badge != common and badge not in first_only:
+        second_only = [badge]
+    half_length = rng.randint(4, 16)
+    first = [common] + rng.choices(first_only, k=half_length - 1)
+    second = [common] + rng.choices(second_only, k=half_length - 1)
+    if badge != common:
+        # Make sure the badge is in there
+        if badge in first_only:
+            first[-1] = badge
+        else:
+            second[-1] = badge
+    rng.shuffle(first)
+    rng.shuffle(second)
+    return "".join(first + second)
@@ -0,0 +1,22 @@
+# pyright: reportMissingTypeStubs=false
+"""
+Day 04: Pairs of section ranges
+"""
+
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from random import Random
+
+_PAIR_COUNT = 1000
+
+
+def generate(scale: float, rng: Random) -> str:
+    """"""
+    lines: list[str] = []
+    for _ in range(max(1, round(_PAIR_COUNT * scale))):
+        ranges = [sorted((rng.randint(1, 99), rng.randint(1, 99))) for _ in range(2)]
+        lines.append(",".join(f"{start}-{end}" for start, end in ranges))
+    return "\n".join(lines) + "\n"
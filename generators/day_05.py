@@ -0,0 +1,48 @@
+# pyright: reportMissingTypeStubs=false
+"""
+Day 05: Drawing of crate stacks followed by crane moves. Moves never take more
+crates than a stack holds, and never empty a stack, as the answer reads the top crate
+of every stack
+"""
+
+from __future__ import annotations
+
+from string import ascii_uppercase
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from random import Random
+
+_STACK_COUNT = 9
+_CRATE_COUNT = 50
+_MOVE_COUNT = 500
+
+
+def generate(scale: float, rng: Random) -> str:
+    """"""
+    # More crates than stacks, so that some stack can always give crates
+    crate_count = max(2 * _STACK_COUNT, round(_CRATE_COUNT * scale))
+    stacks = [[rng.choice(ascii_uppercase)] for _ in range(_STACK_COUNT)]
+    for _ in range(crate_count - _STACK_COUNT):
+        rng.choice(stacks).append(rng.choice(ascii_uppercase))
+
+    # Drawing, top row first
+    lines: list[str] = []
+    for level in reversed(range(max(map(len, stacks)))):
+        cells = [
+            f"[{stack[level]}]" if level < len(stack) else "   " for stack in stacks
+        ]
+        lines.append(" ".join(cells))
+    lines.append(" ".join(f" {i % 10} " for i in range(1, _STACK_COUNT + 1)))
+    lines.append("")
+
+    # Only stack heights matter for the moves to be valid
+    heights = list(map(len, stacks))
+    for _ in range(max(1, round(_MOVE_COUNT * scale))):
+        from_ = rng.choice([i for i, height in enumerate(heights) if height > 1])
+        to = rng.choice([i for i in range(_STACK_COUNT) if i != from_])
+        move_count = rng.randint(1, min(heights[from_] - 1, 30))
+        heights[from_] -= move_count
+        heights[to] += move_count
+        lines.append(f"move {move_count} from {from_ + 1} to {to + 1}")
+    return "\n".join(lines) + "\n"
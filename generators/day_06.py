@@ -0,0 +1,28 @@
+# pyright: reportMissingTypeStubs=false
+"""
+Day 06: A single line datastream. The markers are put at the very end, so finding
+them takes a scan of the whole line
+"""
+
+from __future__ import annotations
+
+from string import ascii_lowercase
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from random import Random
+
+_LENGTH = 4096
+# Markers need this many distinct characters in a row
+_MARKER_LENGTH = 14
+
+
+def generate(scale: float, rng: Random) -> str:
+    """"""
+    # With only 3 letters, no 4 characters in a row can be distinct
+    letters = rng.sample(ascii_lowercase, k=3)
+    length = max(0, round(_LENGTH * scale) - _MARKER_LENGTH - 1)
+    body = "".join(rng.choices(letters, k=length))
+    marker = "".join(rng.sample(ascii_lowercase, k=_MARKER_LENGTH))
+    # The solution doesn't look at a marker ending the line, so end with one more
+    return body + marker + rng.choice(letters) + "\n"
@@ -0,0 +1,62 @@
+# pyright: reportMissingTypeStubs=false
+"""
+Day 07: Terminal output of walking a directory tree depth-first with `cd` and `ls`
+"""
+
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from random import Random
+
+_DIRECTORY_COUNT = 180
+# Keep well within the recursion limit of the solution
+_MAX_DEPTH = 200
+# Directories go in one of the few created just before them, which are deep, so that
+#   depth grows with the size of the tree, making long `cd` chains and nested size
+#   sums
+_RECENT_PARENTS = 4
+
+
+def generate(scale: float, rng: Random) -> str:
+    """"""
+    directory_count = max(1, round(_DIRECTORY_COUNT * scale))
+    # Tree as parent indexes, root first
+    parents = [-1] + [
+        rng.randrange(max(0, i - _RECENT_PARENTS), i) for i in range(1, directory_count)
+    ]
+    depths = [0] * directory_count
+    children: list[list[int]] = [[] for _ in range(directory_count)]
+    for i, parent in enumerate(parents[1:], start=1):
+        if depths[parent] >= _MAX_DEPTH:
+            parent = parents[parent]
+        parents[i] = parent
+        depths[i] = depths[parent] + 1
+        children[parent].append(i)
+
+    # Like in real inputs, about 50M of the 70M disk is used, so that part 2 has to
+    #   free some space. Directories hold 2.5 files of half the max size on average
+    max_file_size = max(2, 40_000_000 // directory_count)
+    lines = ["$ cd /"]
+    # Depth-first walk without recursion, `None` meaning going back up
+    stack: list[None | int] = [0]
+    while stack:
+        index = stack.pop()
+        if index is None:
+            lines.append("$ cd ..")
+            continue
+        if index:
+            lines.append(f"$ cd d{index}")
+        lines.append("$ ls")
+        entries = [f"dir d{child}" for child in children[index]]
+        entries += [
+            f"{rng.randint(1, max_file_size)} f{i}.{rng.choice(['txt', 'dat', 'log'])}"
+            for i in range(rng.randint(0, 5))
+        ]
+        rng.shuffle(entries)
+        lines.extend(entries)
+        if index:
+            stack.append(None)
+        stack.extend(reversed(children[index]))
+    return "\n".join(lines) + "\n"
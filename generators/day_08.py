@@ -0,0 +1,23 @@
+# pyright: reportMissingTypeStubs=false
+"""
+Day 08: Square grid of tree heights
+"""
+
+from __future__ import annotations
+
+from math import sqrt
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from random import Random
+
+_SIDE = 99
+
+
+def generate(scale: float, rng: Random) -> str:
+    """"""
+    # Scale the number of trees rather than the side
+    side = max(1, round(_SIDE * sqrt(scale)))
+    return "".join(
+        "".join(rng.choices("0123456789", k=side)) + "\n" for _ in range(side)
+    )
@@ -0,0 +1,21 @@
+# pyright: reportMissingTypeStubs=false
+"""
+Day 09: Rope head moves
+"""
+
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from random import Random
+
+_MOVE_COUNT = 2000
+
+
+def generate(scale: float, rng: Random) -> str:
+    """"""
+    return "".join(
+        f"{rng.choice('UDLR')} {rng.randint(1, 20)}\n"
+        for _ in range(max(1, round(_MOVE_COUNT * scale)))
+    )
@@ -0,0 +1,29 @@
+# pyright: reportMissingTypeStubs=false
+"""
+Day 10: CPU program of `noop` and `addx`. Part 2 draws a 240-cycle screen, so only
+inputs of scale 1 or less are valid for it
+"""
+
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from random import Random
+
+_CYCLE_COUNT = 240
+
+
+def generate(scale: float, rng: Random) -> str:
+    """"""
+    cycle_count = max(1, round(_CYCLE_COUNT * scale))
+    lines: list[str] = []
+    cycle = 0
+    while cycle < cycle_count:
+        if cycle_count - cycle >= 2 and rng.random() < 0.6:
+            lines.append(f"addx {rng.randint(-20, 20) or 1}")
+            cycle += 2
+        else:
+            lines.append("noop")
+            cycle += 1
+    return "\n".join(lines) + "\n"
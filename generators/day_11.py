@@ -0,0 +1,44 @@
+# pyright: reportMissingTypeStubs=false
+"""
+Day 11: Monkeys throwing items. Divisors are primes like in real inputs, and no
+monkey throws to itself
+"""
+
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from random import Random
+
+_MONKEY_COUNT = 8
+_PRIMES = [2, 3, 5, 7, 11, 13, 17, 19, 23, 29, 31, 37, 41, 43, 47, 53, 59, 61, 67]
+
+
+def generate(scale: float, rng: Random) -> str:
+    """"""
+    monkey_count = max(2, round(_MONKEY_COUNT * scale))
+    # Like in real inputs, a single monkey squares the worry level. More would make
+    #   part 1 numbers grow huge
+    squaring_index = rng.randrange(monkey_count)
+    blocks: list[str] = []
+    for index in range(monkey_count):
+        items = ", ".join(str(rng.randint(50, 99)) for _ in range(rng.randint(1, 8)))
+        if index == squaring_index:
+            operation = "* old"
+        else:
+            operation = rng.choice(
+                [f"* {rng.randint(2, 19)}", f"+ {rng.randint(1, 8)}"]
+            )
+        others = [i for i in range(monkey_count) if i != index]
+        true_index = rng.choice(others)
+        false_index = rng.choice(others)
+        blocks.append(
+            f"Monkey {index}:\n"
+            f"  Starting items: {items}\n"
+            f"  Operation: new = old {operation}\n"
+            f"  Test: divisible by {_PRIMES[index % len(_PRIMES)]}\n"
+            f"    If true: throw to monkey {true_index}\n"
+            f"    If false: throw to monkey {false_index}\n"
+        )
+    return "\n".join(blocks)
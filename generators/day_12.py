@@ -0,0 +1,38 @@
+# pyright: reportMissingTypeStubs=false
+"""
+Day 12: Heightmap rising from `S` on the left to `E` on the right. The row of `S`
+and `E` rises by at most one per step, so there always is a path
+"""
+
+from __future__ import annotations
+
+from math import sqrt
+from string import ascii_lowercase
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from random import Random
+
+_ROW_COUNT = 41
+_COL_COUNT = 160
+
+
+def generate(scale: float, rng: Random) -> str:
+    """"""
+    row_count = max(1, round(_ROW_COUNT * sqrt(scale)))
+    # At least one column per letter for the path to be climbable
+    col_count = max(26, round(_COL_COUNT * sqrt(scale)))
+    path_r = rng.randrange(row_count)
+    lines: list[str] = []
+    for r in range(row_count):
+        row: list[str] = []
+        for c in range(col_count):
+            height = c * 25 // (col_count - 1)
+            if r != path_r:
+                height = min(25, max(0, height + rng.randint(-3, 1)))
+            row.append(ascii_lowercase[height])
+        if r == path_r:
+            row[0] = "S"
+            row[-1] = "E"
+        lines.append("".join(row))
+    return "\n".join(lines) + "\n"
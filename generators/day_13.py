@@ -0,0 +1,49 @@
+# pyright: reportMissingTypeStubs=false
+"""
+Day 13: Pairs of nested list packets
+"""
+
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from random import Random
+
+_PAIR_COUNT = 150
+_MAX_DEPTH = 4
+# Integers of the divider packets of part 2, `[[2]]` and `[[6]]`
+_DIVIDER_INTS = ("2", "6")
+
+
+def generate(scale: float, rng: Random) -> str:
+    """"""
+    pairs = [
+        f"{_generate_non_divider_packet(rng)}\n{_generate_non_divider_packet(rng)}\n"
+        for _ in range(max(1, round(_PAIR_COUNT * scale)))
+    ]
+    return "\n".join(pairs)
+
+
+def _generate_non_divider_packet(rng: Random) -> str:
+    """
+    Generate a packet that doesn't tie with either divider packet, as part 2 assumes
+    the dividers' positions are unique.
+    """
+    while True:
+        packet = _generate_packet(rng, 0)
+        # Only nested single-item lists around a divider's integer tie with the
+        #   divider, e.g. `[2]` or `[[[2]]]` with `[[2]]`
+        if "," in packet or packet.strip("[]") not in _DIVIDER_INTS:
+            return packet
+
+
+def _generate_packet(rng: Random, depth: int) -> str:
+    """"""
+    items: list[str] = []
+    for _ in range(rng.randint(0, 5)):
+        if depth < _MAX_DEPTH and rng.random() < 0.3:
+            items.append(_generate_packet(rng, depth + 1))
+        else:
+            items.append(str(rng.randint(0, 10)))
+    return f"[{','.join(items)}]"
@@ -0,0 +1,38 @@
+# pyright: reportMissingTypeStubs=false
+"""
+Day 14: Rock paths below the sand source at 500,0. Rocks stay within the triangle
+the sand can reach, as the solution's map is sized for it
+"""
+
+from __future__ import annotations
+
+from math import sqrt
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from random import Random
+
+_PATH_COUNT = 150
+_MAX_Y = 170
+# Sand spreads this far left of 500 at most, and the map starts at x=0
+_MAX_MAX_Y = 490
+
+
+def generate(scale: float, rng: Random) -> str:
+    """"""
+    max_y = min(_MAX_MAX_Y, round(_MAX_Y * sqrt(scale)))
+    lines: list[str] = []
+    for _ in range(max(1, round(_PATH_COUNT * scale))):
+        y = rng.randint(min(13, max_y), max_y)
+        x = rng.randint(500 - y, 500 + y)
+        points = [(x, y)]
+        horizontal = rng.random() < 0.5
+        for _ in range(rng.randint(1, 5)):
+            if horizontal:
+                x = min(500 + y, max(500 - y, x + rng.randint(-8, 8)))
+            else:
+                y = min(max_y, max(1, abs(x - 500), y + rng.randint(-8, 8)))
+            points.append((x, y))
+            horizontal = not horizontal
+        lines.append(" -> ".join(f"{x},{y}" for x, y in points))
+    return "\n".join(lines) + "\n"
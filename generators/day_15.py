@@ -0,0 +1,56 @@
+# pyright: reportMissingTypeStubs=false
+"""
+Day 15: Sensors and their closest beacons. Like in real inputs, the sensors cover
+the whole 4,000,000-wide square except for a single distress beacon position.
+
+Rotated by 45°, a sensor's range is a square, so the square is tiled with equal
+sensors. Tiles covering the distress beacon are replaced by 4 sensors diagonally
+around it, each reaching right next to it.
+"""
+
+from __future__ import annotations
+
+from math import ceil, sqrt
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from random import Random
+
+_SIDE = 4_000_000
+_SENSOR_COUNT = 30
+
+
+def generate(scale: float, rng: Random) -> str:
+    """"""
+    # Rotated, the square covers about 2 * _SIDE ** 2 and a tile (2 * radius) ** 2
+    radius = max(2, round(sqrt(2 * _SIDE**2 / (4 * _SENSOR_COUNT * scale))))
+    px = rng.randint(1, _SIDE - 1)
+    py = rng.randint(1, _SIDE - 1)
+    pu, pv = px + py, px - py
+
+    lines: list[str] = []
+    tile_count = ceil(_SIDE / (2 * radius)) + 1
+    for i in range(2 * tile_count):
+        for j in range(-tile_count, tile_count + 1):
+            u, v = 2 * radius * i, 2 * radius * j
+            if abs(u - pu) <= radius and abs(v - pv) <= radius:
+                continue
+            x, y = (u + v) // 2, (u - v) // 2
+            if not (-radius <= x <= _SIDE + radius and -radius <= y <= _SIDE + radius):
+                continue
+            lines.append(_format_report(x, y, x + radius, y))
+
+    offset = radius + 1
+    for sign_x, sign_y in ((1, 1), (1, -1), (-1, 1), (-1, -1)):
+        x, y = px + sign_x * offset, py + sign_y * offset
+        lines.append(_format_report(x, y, px + sign_x, py))
+    rng.shuffle(lines)
+    return "\n".join(lines) + "\n"
+
+
+def _format_report(sensor_x: int, sensor_y: int, beacon_x: int, beacon_y: int) -> str:
+    """"""
+    return (
+        f"Sensor at x={sensor_x}, y={sensor_y}: "
+        f"closest beacon is at x={beacon_x}, y={beacon_y}"
+    )
@@ -0,0 +1,53 @@
+# pyright: reportMissingTypeStubs=false
+"""
+Day 16: Connected graph of valves starting from `AA`. The solution's search is
+exponential in the number of valves with a flow rate, so keep scales small
+"""
+
+from __future__ import annotations
+
+from itertools import product
+from string import ascii_uppercase
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from random import Random
+
+_VALVE_COUNT = 60
+_FLOW_VALVE_COUNT = 15
+# Names are 2 letters
+_MAX_VALVE_COUNT = 26 * 26
+
+
+def generate(scale: float, rng: Random) -> str:
+    """"""
+    valve_count = min(_MAX_VALVE_COUNT, max(2, round(_VALVE_COUNT * scale)))
+    flow_valve_count = min(valve_count - 1, max(1, round(_FLOW_VALVE_COUNT * scale)))
+    other_names = ["".join(letters) for letters in product(ascii_uppercase, repeat=2)]
+    other_names.remove("AA")
+    names = ["AA"] + rng.sample(other_names, k=valve_count - 1)
+
+    # Random tree, plus a few more tunnels. Tunnels go both ways
+    tunnels: list[set[int]] = [set() for _ in range(valve_count)]
+    for i in range(1, valve_count):
+        j = rng.randrange(i)
+        tunnels[i].add(j)
+        tunnels[j].add(i)
+    for _ in range(valve_count // 2):
+        i, j = rng.sample(range(valve_count), k=2)
+        tunnels[i].add(j)
+        tunnels[j].add(i)
+
+    # `AA` never has a flow rate
+    flow_indexes = set(rng.sample(range(1, valve_count), k=flow_valve_count))
+    lines: list[str] = []
+    for i, name in enumerate(names):
+        rate = rng.randint(1, 25) if i in flow_indexes else 0
+        neighbors = [names[j] for j in sorted(tunnels[i])]
+        if len(neighbors) == 1:
+            tunnels_str = f"tunnel leads to valve {neighbors[0]}"
+        else:
+            tunnels_str = f"tunnels lead to valves {', '.join(neighbors)}"
+        lines.append(f"Valve {name} has flow rate={rate}; {tunnels_str}")
+    rng.shuffle(lines)
+    return "\n".join(lines) + "\n"
@@ -0,0 +1,18 @@
+# pyright: reportMissingTypeStubs=false
+"""
+Day 17: A single line of jet directions
+"""
+
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from random import Random
+
+_LENGTH = 10091
+
+
+def generate(scale: float, rng: Random) -> str:
+    """"""
+    return "".join(rng.choices("<>", k=max(1, round(_LENGTH * scale)))) + "\n"
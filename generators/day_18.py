@@ -0,0 +1,28 @@
+# pyright: reportMissingTypeStubs=false
+"""
+Day 18: Lava droplet cubes, about a third of a cube-shaped space
+"""
+
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from random import Random
+
+_SIDE = 20
+_CUBE_COUNT = 2800
+
+
+def generate(scale: float, rng: Random) -> str:
+    """"""
+    cube_count = max(1, round(_CUBE_COUNT * scale))
+    # Scale the volume rather than the side
+    side = max(1, round(_SIDE * scale ** (1 / 3)))
+    cube_count = min(cube_count, side**3)
+    lines: list[str] = []
+    for index in rng.sample(range(side**3), k=cube_count):
+        yz, x = divmod(index, side)
+        z, y = divmod(yz, side)
+        lines.append(f"{x},{y},{z}")
+    return "\n".join(lines) + "\n"
@@ -0,0 +1,29 @@
+# pyright: reportMissingTypeStubs=false
+"""
+Day 19: Robot blueprints, with costs in the ranges of real inputs
+"""
+
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from random import Random
+
+_BLUEPRINT_COUNT = 30
+
+
+def generate(scale: float, rng: Random) -> str:
+    """"""
+    lines: list[str] = []
+    for index in range(1, max(1, round(_BLUEPRINT_COUNT * scale)) + 1):
+        lines.append(
+            f"Blueprint {index}:"
+            f" Each ore robot costs {rng.randint(2, 4)} ore."
+            f" Each clay robot costs {rng.randint(2, 4)} ore."
+            f" Each obsidian robot costs {rng.randint(2, 4)} ore"
+            f" and {rng.randint(5, 20)} clay."
+            f" Each geode robot costs {rng.randint(2, 4)} ore"
+            f" and {rng.randint(5, 20)} obsidian."
+        )
+    return "\n".join(lines) + "\n"
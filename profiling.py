@@ -0,0 +1,273 @@
+# pyright: reportMissingTypeStubs=false
+"""
+Profile solutions
+"""
+
+from __future__ import annotations
+
+import cProfile
+import os
+import pstats
+import threading
+import tracemalloc
+from collections import Counter, defaultdict
+from contextlib import redirect_stdout
+from dataclasses import dataclass
+from pathlib import Path
+from typing import TYPE_CHECKING
+
+from cache import CACHE_DIR
+from runner import get_answer
+from utils import get_solution_class
+
+if TYPE_CHECKING:
+    from collections.abc import Callable, Iterable
+    from typing import Any, TypeVar
+
+    _T = TypeVar("_T")
+    _Func = tuple[str, int, str]
+
+PROFILE_DIR = CACHE_DIR / "profiles"
+
+# Paths in the collapsed stacks taking less than this many seconds are dropped
+_MIN_COLLAPSED_TIME = 1e-6
+# How often, in seconds, traced memory is polled for a new peak
+_MEMORY_POLL_INTERVAL = 0.01
+# How much, as a ratio, traced memory has to grow before a new snapshot is taken
+_MEMORY_SNAPSHOT_GROWTH = 1.1
+
+
+def profile(
+    func: Callable[[], _T], *, stem: str, out_dir: Path = PROFILE_DIR
+) -> tuple[_T, pstats.Stats]:
+    """
+    Run a function under cProfile, writing the raw profile to `<stem>.prof` and
+    collapsed stacks to `<stem>.collapsed` in `out_dir`. The collapsed stacks can be
+    fed to flame graph tools like `flamegraph.pl` or speedscope.
+    Args:
+        func    (Callable[[], T]): Function to profile
+        stem    (str)            : File name stem of the outputs
+        out_dir (pathlib.Path)   : Directory to write the outputs into
+    Returns:
+        (tuple[T, pstats.Stats]): Return value of `func` and the collected stats
+    """
+    out_dir.mkdir(parents=True, exist_ok=True)
+    profiler = cProfile.Profile()
+    result = profiler.runcall(func)
+    profiler.dump_stats(out_dir / f"{stem}.prof")
+    stats = pstats.Stats(profiler)
+    write_collapsed(stats, out_dir / f"{stem}.collapsed")
+    return result, stats
+
+
+def write_collapsed(stats: pstats.Stats, path: Path) -> None:
+    """
+    Write stats as collapsed stacks, one `frame;frame;frame microseconds` per line.
+    cProfile only records caller/callee pairs rather than full stacks, so the time of
+    a function called from several places is split between them in proportion to
+    the time spent under each caller.
+    Args:
+        stats (pstats.Stats): Collected stats
+        path  (pathlib.Path): Path of file to write collapsed stacks to
+    """
+    raw_stats: dict[_Func, Any] = stats.stats  # type: ignore[attr-defined]
+    callees: defaultdict[_Func, dict[_Func, float]] = defaultdict(dict)
+    for func, (_, _, _, _, callers) in raw_stats.items():
+        for caller, (_, _, _, edge_ct) in callers.items():
+            callees[caller][func] = edge_ct
+    roots = [func for func, (*_, callers) in raw_stats.items() if not callers]
+
+    collapsed: Counter[str] = Counter()
+
+    def walk(func: _Func, stack: tuple[_Func, ...], scale: float) -> None:
+        """"""
+        _, _, tt, _, _ = raw_stats[func]
+        stack = stack + (func,)
+        collapsed[";".join(map(_get_label, stack))] += tt * scale
+        for callee, edge_ct in callees[func].items():
+            # Recursive time is already included in the outermost call
+            if callee in stack:
+                continue
+            callee_ct = raw_stats[callee][3]
+            if not callee_ct:
+                continue
+            callee_scale = scale * edge_ct / callee_ct
+            if callee_ct * callee_scale < _MIN_COLLAPSED_TIME:
+                continue
+            walk(callee, stack, callee_scale)
+
+    for root in roots:
+        walk(root, (), 1.0)
+
+    with path.open("w") as f:
+        for stack_str, time in collapsed.items():
+            microseconds = round(time * 1_000_000)
+            if microseconds:
+                f.write(f"{stack_str} {microseconds}\n")
+
+
+def print_top(stats: pstats.Stats, top: int) -> None:
+    """
+    Print the functions with the most cumulative time.
+    Args:
+        stats (pstats.Stats): Collected stats
+        top   (int)         : Number of functions to print
+    """
+    stats.sort_stats(pstats.SortKey.CUMULATIVE).print_stats(top)
+
+
+def _get_label(func: _Func) -> str:
+    """"""
+    filename, lineno, name = func
+    if filename == "~":
+        # Built-ins
+        return name.replace(";", ",")
+    return f"{name} ({_get_short_path(filename)}:{lineno})".replace(";", ",")
+
+
+def _get_short_path(filename: str) -> str:
+    """"""
+    path = Path(filename)
+    return f"{path.parent.name}/{path.name}"
+
+
+@dataclass(frozen=True, kw_only=True)
+class MemoryStats:
+    """
+    Memory allocated while running a function
+    """
+
+    peak: int
+    # (`file:line`, bytes) at around the peak, largest first
+    top_sites: list[tuple[str, int]]
+
+    def to_dict(self) -> dict[str, Any]:
+        """"""
+        return {
+            "peak": self.peak,
+            "top_sites": [
+                {"site": site, "size": size} for site, size in self.top_sites
+            ],
+        }
+
+
+def trace_memory(func: Callable[[], _T], *, top: int = 10) -> tuple[_T, MemoryStats]:
+    """
+    Run a function under tracemalloc, recording the peak of memory allocated during
+    the call and the lines that allocated the most around that peak.
+    Args:
+        func (Callable[[], T]): Function to trace
+        top  (int)            : Number of allocation sites to record
+    Returns:
+        (tuple[T, MemoryStats]): Return value of `func` and the memory stats
+    """
+    sampler = _PeakSampler()
+    tracemalloc.start()
+    sampler.start()
+    try:
+        result = func()
+    finally:
+        sampler.stop()
+        _, peak = tracemalloc.get_traced_memory()
+        snapshot = sampler.snapshot or tracemalloc.take_snapshot()
+        tracemalloc.stop()
+    # Leave out the bookkeeping of the tracing itself
+    snapshot = snapshot.filter_traces(
+        [
+            tracemalloc.Filter(False, tracemalloc.__file__),
+            tracemalloc.Filter(False, threading.__file__),
+            tracemalloc.Filter(False, __file__),
+        ]
+    )
+    top_sites = [
+        (f"{_get_short_path(frame.filename)}:{frame.lineno}", stat.size)
+        for stat in snapshot.statistics("lineno")[:top]
+        for frame in stat.traceback[:1]
+    ]
+    return result, MemoryStats(peak=peak, top_sites=top_sites)
+
+
+def measure_memory(
+    day: int, parts: Iterable[int] = (1, 2), *, top: int = 10, use_cache: bool = True
+) -> dict[str, MemoryStats]:
+    """
+    Measure memory allocated by parsing and by each part of a day separately. Each
+    part runs on a fresh snapshot of the data. Anything the solution prints is
+    discarded.
+    Args:
+        day       (1..25)        : The day of AOC
+        parts     (Iterable[int]): Part numbers to measure
+        top       (int)          : Number of allocation sites to record per phase
+        use_cache (bool)         : Whether processed data may come from the cache
+    Returns:
+        (dict[str, MemoryStats]): Memory stats of `init` and each `part_N`
+    """
+    SolutionClass = get_solution_class(day)
+    results: dict[str, MemoryStats] = {}
+    with open(os.devnull, "w") as null_fp, redirect_stdout(null_fp):
+        solution_obj, results["init"] = trace_memory(
+            lambda: SolutionClass(use_cache=use_cache), top=top
+        )
+        snapshot = solution_obj.snapshot()
+        for part in parts:
+            solution_obj.restore(snapshot)
+            _, results[f"part_{part}"] = trace_memory(
+                lambda: get_answer(solution_obj, part), top=top
+            )
+    return results
+
+
+def format_memory(results: dict[str, MemoryStats]) -> str:
+    """
+    Format memory stats as a human-readable report.
+    """
+    lines: list[str] = []
+    for phase, stats in results.items():
+        lines.append(f"{phase}: peak {_format_bytes(stats.peak)}")
+        for site, size in stats.top_sites:
+            lines.append(f"  {_format_bytes(size):>10}  {site}")
+    return "\n".join(lines)
+
+
+class _PeakSampler(threading.Thread):
+    """
+    Background thread snapshotting traced memory whenever it reaches a new high
+    """
+
+    snapshot: None | tracemalloc.Snapshot
+
+    def __init__(self) -> None:
+        super().__init__(daemon=True)
+        self.snapshot = None
+        self._snapshot_size = 0
+        self._stopped = threading.Event()
+
+    def run(self) -> None:
+        """"""
+        while not self._stopped.wait(_MEMORY_POLL_INTERVAL):
+            current, _ = tracemalloc.get_traced_memory()
+            if current > self._snapshot_size * _MEMORY_SNAPSHOT_GROWTH:
+                self.snapshot = tracemalloc.take_snapshot()
+                self._snapshot_size = current
+
+    def stop(self) -> None:
+        """"""
+        self._stopped.set()
+        self.join()
+        # Keep the end state if it is the largest
+        current, _ = tracemalloc.get_traced_memory()
+        if current >= self._snapshot_size:
+            self.snapshot = tracemalloc.take_snapshot()
+            self._snapshot_size = current
+
+
+def _format_bytes(size: int) -> str:
+    """"""
+    if size < 1024:
+        return f"{size} B"
+    value = size / 1024
+    for unit in ("KiB", "MiB"):
+        if value < 1024:
+            return f"{value:.1f} {unit}"
+        value /= 1024
+    return f"{value:.1f} GiB"
@@ -3,20 +3,36 @@
 
 from __future__ import annotations
 
+import json
 import shutil
-from argparse import ArgumentParser
-from importlib import import_module
+import socket
+import sys
+from argparse import ArgumentParser, ArgumentTypeError
+from contextlib import nullcontext
 from pathlib import Path
+from time import perf_counter
 from typing import TYPE_CHECKING
 
 from colorama import Fore, init
 
-from aoc_io import download_input, submit_output
+from cache import AnswerStore, hash_file
+from gc_control import GC_MODES, format_gc
+from runner import get_answer, run_all, run_batch
+from utils import (
+    PROGRESS_KINDS,
+    REFERENCE_IMPL,
+    Instruments,
+    get_days,
+    get_input_path,
+    get_progress,
+    get_solution_class,
+    get_solution_path,
+)
 
 if TYPE_CHECKING:
     from argparse import Namespace
 
-    from .utils import SolutionAbstract
+    from .utils import Progress, SolutionAbstract
 
 init(autoreset=True)
 
@@ -25,6 +41,17 @@ _DOWNLOAD_CMDS = ["d", "dl", "download"]
 _PRINT_CMDS = ["p", "pr", "print"]
 _SUBMIT_CMDS = ["s", "sub", "submit"]
 _METHOD_CMDS = ["m", "me", "method"]
+_BENCH_CMDS = ["b", "be", "bench"]
+_ALL_CMDS = ["a", "all"]
+_FORGET_CMDS = ["f", "fo", "forget"]
+_PROFILE_CMDS = ["pf", "prof", "profile"]
+_GENERATE_CMDS = ["g", "gen", "generate"]
+_SCALE_CMDS = ["sc", "scale"]
+_PERFCHECK_CMDS = ["pc", "perfcheck"]
+_SERVE_CMDS = ["sv", "serve"]
+_BATCH_CMDS = ["bt", "batch"]
+_VERIFY_CMDS = ["v", "ve", "verify"]
+_IMPLS_CMDS = ["i", "im", "impls"]
 
 
 def _main() -> None:
@@ -38,30 +65,238 @@ def _main() -> None:
 
     # Download input
     if args.command in _DOWNLOAD_CMDS:
-        download_input(day=args.day)
+        from aoc_io import download_input, download_inputs, get_released_days
+
+        if args.days == [None]:
+            download_inputs(
+                get_released_days(), concurrency=args.concurrency, rate=args.rate
+            )
+        elif None in args.days:
+            raise ValueError("`all` can't be combined with other days.")
+        elif len(args.days) == 1:
+            download_input(day=args.days[0])
+        else:
+            download_inputs(args.days, concurrency=args.concurrency, rate=args.rate)
+        return
+
+    # Serve answers from a warm process
+    if args.command in _SERVE_CMDS:
+        from daemon import SOCKET_PATH, serve
+
+        print(f"{Fore.GREEN}Serving on {SOCKET_PATH}. Press Ctrl+C to stop")
+        try:
+            serve()
+        except KeyboardInterrupt:
+            pass
+        return
+
+    # Benchmark
+    if args.command in _BENCH_CMDS:
+        _bench(
+            day=args.day,
+            repeat=args.repeat,
+            warmup=args.warmup,
+            output=args.output,
+            memory=args.memory,
+            instrument=args.instrument,
+            use_cache=args.cached,
+        )
+        return
+
+    # Check for performance regressions
+    if args.command in _PERFCHECK_CMDS:
+        passed = _perfcheck(
+            days=args.days,
+            baseline_path=args.baseline,
+            tolerance=args.tolerance,
+            min_delta=args.min_delta / 1000,
+            repeat=args.repeat,
+            warmup=args.warmup,
+            update_baseline=args.update_baseline,
+            use_cache=args.cached,
+        )
+        if not passed:
+            sys.exit(1)
+        return
+
+    # Run all days
+    if args.command in _ALL_CMDS:
+        _run_all(
+            parts=args.parts,
+            max_workers=args.jobs,
+            timeout=args.timeout,
+            max_rss=None if args.max_rss is None else args.max_rss * 2**20,
+            counters=args.counters,
+            gc_mode=args.gc,
+            use_cache=not args.no_cache,
+        )
+        return
+
+    # Check answers against the known ones
+    if args.command in _VERIFY_CMDS:
+        passed = _verify(
+            days=args.days,
+            parts=args.parts,
+            max_workers=args.jobs,
+            timeout=args.timeout,
+            record=args.record,
+            use_cache=not args.no_cache,
+        )
+        if not passed:
+            sys.exit(1)
+        return
+
+    # Run a part on many inputs
+    if args.command in _BATCH_CMDS:
+        _batch(
+            day=args.day,
+            part=args.part,
+            inputs_dir=args.inputs,
+            pattern=args.glob,
+            output=args.output,
+            max_workers=args.jobs,
+            use_cache=not args.no_cache,
+        )
+        return
+
+    # Compare the implementations of parts
+    if args.command in _IMPLS_CMDS:
+        passed = _impls(
+            day=args.day,
+            parts=args.parts,
+            scales=args.scales,
+            seed=args.seed,
+            repeat=args.repeat,
+            warmup=args.warmup,
+            use_cache=not args.no_cache,
+        )
+        if not passed:
+            sys.exit(1)
+        return
+
+    # Profile
+    if args.command in _PROFILE_CMDS:
+        _profile(
+            day=args.day,
+            part=args.part,
+            method_name=args.method,
+            top=args.top,
+            out_dir=args.out_dir,
+            use_cache=not args.no_cache,
+        )
+        return
+
+    # Generate a synthetic input
+    if args.command in _GENERATE_CMDS:
+        _generate(day=args.day, scale=args.scale, seed=args.seed, output=args.output)
         return
 
-    # Get solution object
-    solution_obj = _get_solution_obj(args.day)
+    # Measure scaling on generated inputs
+    if args.command in _SCALE_CMDS:
+        _scale(
+            day=args.day,
+            parts=args.parts,
+            start=args.start,
+            factor=args.factor,
+            steps=args.steps,
+            seed=args.seed,
+            repeat=args.repeat,
+            memory=not args.no_memory,
+            out_dir=args.out_dir,
+        )
+        return
+
+    # Forget memoized answers
+    if args.command in _FORGET_CMDS:
+        count = AnswerStore().invalidate(args.day)
+        print(f"{Fore.GREEN}Forgot {count} answer(s) of day {args.day}")
+        return
+
+    # Progress is reported by solutions running in this process
+    use_daemon = not args.no_daemon and args.progress is None
+    progress = None if args.progress is None else get_progress(args.progress)
+
+    # Run method
     if args.command in _METHOD_CMDS:
-        _run_method(solution_obj=solution_obj, day=args.day, method_name=args.method)
+        if _is_daemon_running(use_daemon=use_daemon):
+            from daemon import request
+
+            response = request(
+                {"day": args.day, "method": args.method, "use_cache": not args.no_cache}
+            )
+            print(f"{Fore.GREEN}{response['result']}")
+            return
+        solution_obj = _get_solution_obj(
+            args.day, use_cache=not args.no_cache, progress=progress
+        )
+        try:
+            _run_method(
+                solution_obj=solution_obj, day=args.day, method_name=args.method
+            )
+        finally:
+            if progress is not None:
+                progress.close()
         return
 
-    # Run and get solution
-    if args.part is None:
+    # Run and get solution. Printing without a part runs both from a single parse
+    if args.part is None and args.command in _SUBMIT_CMDS:
         raise ValueError("No part number provided.")
-    solution = _get_solution(solution_obj, args.part)
-    if solution is None:
-        print(f"{Fore.RED}No response got. This part may need manual processing.")
-        return
-    print(f"{Fore.GREEN}Got solution {solution!r}")
+    parts = [1, 2] if args.part is None else [args.part]
+    try:
+        solutions = _solve(
+            day=args.day,
+            parts=parts,
+            use_cache=not args.no_cache,
+            use_memo=not args.force,
+            use_daemon=use_daemon,
+            progress=progress,
+            impl=args.impl,
+        )
+    finally:
+        if progress is not None:
+            progress.close()
+    for part, solution in solutions.items():
+        label = f"Part {part}: " if len(parts) > 1 else ""
+        if solution is None:
+            print(
+                f"{Fore.RED}{label}No response got. This part may need manual "
+                "processing."
+            )
+            continue
+        print(f"{Fore.GREEN}{label}Got solution {solution!r}")
+    if args.command in _PRINT_CMDS and args.memory:
+        from profiling import format_memory, measure_memory
+
+        memory = measure_memory(args.day, parts, use_cache=not args.no_cache)
+        print(format_memory(memory))
     if args.command in _SUBMIT_CMDS:
-        submit_output(day=args.day, part=args.part, answer=solution)
+        from aoc_io import submit_output
+
+        solution = solutions[args.part]
+        if solution is None:
+            return
+        if submit_output(day=args.day, part=args.part, answer=solution):
+            from verify import record_answer
+
+            record_answer(day=args.day, part=args.part, answer=solution)
 
 
 def _get_args() -> Namespace:
     """"""
     parser = ArgumentParser(description="AoC 2022")
+    parser.add_argument(
+        "--no-cache", action="store_true", help="Don't use cached processed data"
+    )
+    parser.add_argument(
+        "--no-daemon",
+        action="store_true",
+        help="Solve in this process even if a daemon is running",
+    )
+    parser.add_argument(
+        "--progress",
+        choices=PROGRESS_KINDS,
+        help="Report the progress of `p`, `s` and `m` on stderr, as a bar or JSON",
+    )
     subparsers = parser.add_subparsers(dest="command")
 
     # Preparations
@@ -70,28 +305,246 @@ def _get_args() -> Namespace:
 
     # Download
     dl_parser = subparsers.add_parser("download", aliases=_DOWNLOAD_CMDS)
-    dl_parser.add_argument("day", type=int, choices=range(1, 26))
+    dl_parser.add_argument(
+        "days", type=_day_or_all, nargs="+", help="Day numbers, or `all`"
+    )
+    dl_parser.add_argument(
+        "-c", "--concurrency", type=int, default=4, help="Max downloads in flight"
+    )
+    dl_parser.add_argument(
+        "-r", "--rate", type=float, default=1.0, help="Max requests per second"
+    )
 
     # Print
     print_parser = subparsers.add_parser("print", aliases=_PRINT_CMDS)
     print_parser.add_argument("day", type=int, choices=range(1, 26))
-    print_parser.add_argument("part", type=int, choices=(1, 2))
+    print_parser.add_argument("part", type=int, choices=(1, 2), nargs="?")
+    print_parser.add_argument(
+        "-f", "--force", action="store_true", help="Ignore memoized answers"
+    )
+    print_parser.add_argument(
+        "--memory", action="store_true", help="Also measure peak memory per phase"
+    )
+    print_parser.add_argument("--impl", help="Implementation of the part(s) to run")
 
     # Submit
     submit_parser = subparsers.add_parser("submit", aliases=_SUBMIT_CMDS)
     submit_parser.add_argument("day", type=int, choices=range(1, 26))
     submit_parser.add_argument("part", type=int, choices=(1, 2), nargs="?")
+    submit_parser.add_argument(
+        "-f", "--force", action="store_true", help="Ignore memoized answers"
+    )
+    submit_parser.add_argument("--impl", help="Implementation of the part to run")
+
+    # Serve answers from a warm process
+    subparsers.add_parser("serve", aliases=_SERVE_CMDS)
 
     # Run method
     method_parser = subparsers.add_parser("method", aliases=_METHOD_CMDS)
     method_parser.add_argument("day", type=int, choices=range(1, 26))
     method_parser.add_argument("method")
 
+    # Benchmark
+    bench_parser = subparsers.add_parser("bench", aliases=_BENCH_CMDS)
+    bench_parser.add_argument("day", type=int, choices=range(1, 26), nargs="?")
+    bench_parser.add_argument("-n", "--repeat", type=int, default=5)
+    bench_parser.add_argument("-w", "--warmup", type=int, default=1)
+    bench_parser.add_argument("-o", "--output", type=Path)
+    bench_parser.add_argument(
+        "--memory", action="store_true", help="Also measure peak memory per phase"
+    )
+    bench_parser.add_argument(
+        "-i",
+        "--instrument",
+        action="store_true",
+        help="Also collect the timers and counters solutions record",
+    )
+    bench_parser.add_argument(
+        "--cached",
+        action="store_true",
+        help="Time loading cached data instead of parsing, for days caching it",
+    )
+
+    # Check for performance regressions
+    perfcheck_parser = subparsers.add_parser("perfcheck", aliases=_PERFCHECK_CMDS)
+    perfcheck_parser.add_argument(
+        "days", type=_day, nargs="*", help="Defaults to all days with an input"
+    )
+    perfcheck_parser.add_argument(
+        "-b", "--baseline", type=Path, help="Defaults to perf_baseline.json"
+    )
+    perfcheck_parser.add_argument(
+        "-t", "--tolerance", type=float, default=0.2, help="Allowed relative slowdown"
+    )
+    perfcheck_parser.add_argument(
+        "--min-delta", type=float, default=1.0, help="Allowed slowdown in ms"
+    )
+    perfcheck_parser.add_argument("-n", "--repeat", type=int, default=5)
+    perfcheck_parser.add_argument("-w", "--warmup", type=int, default=1)
+    perfcheck_parser.add_argument(
+        "--update-baseline",
+        action="store_true",
+        help="Store the current timings as the baseline instead of comparing",
+    )
+    perfcheck_parser.add_argument(
+        "--cached",
+        action="store_true",
+        help="Time loading cached data instead of parsing, for days caching it",
+    )
+
+    # Run all days
+    all_parser = subparsers.add_parser("all", aliases=_ALL_CMDS)
+    all_parser.add_argument(
+        "-p", "--parts", type=int, choices=(1, 2), nargs="+", default=[1, 2]
+    )
+    all_parser.add_argument("-j", "--jobs", type=int)
+    all_parser.add_argument(
+        "-t", "--timeout", type=float, help="Seconds each part may run for"
+    )
+    all_parser.add_argument(
+        "--max-rss", type=int, help="Resident memory each part may use, in MiB"
+    )
+    all_parser.add_argument(
+        "-c",
+        "--counters",
+        action="store_true",
+        help="Also print the operations each part counted",
+    )
+    all_parser.add_argument(
+        "--gc",
+        choices=GC_MODES,
+        help="Run the garbage collector in this mode once parsed, and report it",
+    )
+
+    # Check answers against the known ones
+    verify_parser = subparsers.add_parser("verify", aliases=_VERIFY_CMDS)
+    verify_parser.add_argument(
+        "days", type=_day, nargs="*", help="Defaults to all days with an input"
+    )
+    verify_parser.add_argument(
+        "-p", "--parts", type=int, choices=(1, 2), nargs="+", default=[1, 2]
+    )
+    verify_parser.add_argument("-j", "--jobs", type=int)
+    verify_parser.add_argument(
+        "-t",
+        "--timeout",
+        type=float,
+        default=60.0,
+        help="Seconds each part may run for",
+    )
+    verify_parser.add_argument(
+        "--record",
+        action="store_true",
+        help="Store the answers of parts without a known answer as known",
+    )
+
+    # Run a part on many inputs
+    batch_parser = subparsers.add_parser("batch", aliases=_BATCH_CMDS)
+    batch_parser.add_argument("day", type=int, choices=range(1, 26))
+    batch_parser.add_argument("part", type=int, choices=(1, 2))
+    batch_parser.add_argument(
+        "-i", "--inputs", type=Path, required=True, help="Directory of inputs"
+    )
+    batch_parser.add_argument(
+        "-g", "--glob", default="*.txt", help="Pattern of input file names"
+    )
+    batch_parser.add_argument(
+        "-o", "--output", type=Path, help="JSON lines file. Defaults to stdout"
+    )
+    batch_parser.add_argument("-j", "--jobs", type=int)
+
+    # Compare the implementations of parts
+    impls_parser = subparsers.add_parser("impls", aliases=_IMPLS_CMDS)
+    impls_parser.add_argument("day", type=int, choices=range(1, 26))
+    impls_parser.add_argument(
+        "-p", "--parts", type=int, choices=(1, 2), nargs="+", default=[1, 2]
+    )
+    impls_parser.add_argument(
+        "-s",
+        "--scales",
+        type=float,
+        nargs="+",
+        default=[],
+        help="Also compare on inputs generated at these scales",
+    )
+    impls_parser.add_argument("--seed", type=int, default=0)
+    impls_parser.add_argument("-n", "--repeat", type=int, default=5)
+    impls_parser.add_argument("-w", "--warmup", type=int, default=1)
+
+    # Forget memoized answers
+    forget_parser = subparsers.add_parser("forget", aliases=_FORGET_CMDS)
+    forget_parser.add_argument("day", type=int, choices=range(1, 26))
+
+    # Profile
+    profile_parser = subparsers.add_parser("profile", aliases=_PROFILE_CMDS)
+    profile_parser.add_argument("day", type=int, choices=range(1, 26))
+    profile_target = profile_parser.add_mutually_exclusive_group(required=True)
+    profile_target.add_argument("part", type=int, choices=(1, 2), nargs="?")
+    profile_target.add_argument("-m", "--method")
+    profile_parser.add_argument("-n", "--top", type=int, default=20)
+    profile_parser.add_argument("-o", "--out-dir", type=Path)
+
+    # Generate a synthetic input
+    gen_parser = subparsers.add_parser("generate", aliases=_GENERATE_CMDS)
+    gen_parser.add_argument("day", type=int, choices=range(1, 26))
+    gen_parser.add_argument(
+        "-s", "--scale", type=float, default=1.0, help="Size relative to a real input"
+    )
+    gen_parser.add_argument("--seed", type=int, default=0)
+    gen_parser.add_argument(
+        "-o", "--output", type=Path, help="File to write into. Defaults to stdout"
+    )
+
+    # Measure scaling on generated inputs
+    scale_parser = subparsers.add_parser("scale", aliases=_SCALE_CMDS)
+    scale_parser.add_argument("day", type=int, choices=range(1, 26))
+    scale_parser.add_argument(
+        "-p", "--parts", type=int, choices=(1, 2), nargs="+", default=[1, 2]
+    )
+    scale_parser.add_argument(
+        "-s", "--start", type=float, default=0.25, help="Smallest input scale"
+    )
+    scale_parser.add_argument(
+        "-f", "--factor", type=float, default=2.0, help="Ratio between input scales"
+    )
+    scale_parser.add_argument("-k", "--steps", type=int, default=5)
+    scale_parser.add_argument("--seed", type=int, default=0)
+    scale_parser.add_argument("-n", "--repeat", type=int, default=3)
+    scale_parser.add_argument(
+        "--no-memory", action="store_true", help="Don't measure peak memory"
+    )
+    scale_parser.add_argument("-o", "--out-dir", type=Path)
+
     return parser.parse_args()
 
 
+def _day_or_all(value: str) -> None | int:
+    """
+    Parse a day argument, where `all` becomes `None`.
+    """
+    if value == "all":
+        return None
+    return _day(value)
+
+
+def _day(value: str) -> int:
+    """
+    Parse a day argument. Used instead of `choices` for optional lists of days, as
+    argparse checks their empty default against the choices.
+    """
+    try:
+        day = int(value)
+    except ValueError as err:
+        raise ArgumentTypeError(f"invalid day: {value!r}") from err
+    if day not in range(1, 26):
+        raise ArgumentTypeError(f"day {day} is not in range 1..25")
+    return day
+
+
 def _prepare(day: int) -> None:
     """"""
+    from aoc_io import download_input
+
     parent_dir = Path(__file__).resolve().parent
     target_dir = parent_dir / f"day_{day:>02}"
     if not target_dir.exists():
@@ -119,23 +572,528 @@ def _run_method(solution_obj: SolutionAbstract, day: int, method_name: str) -> N
     print(f"{Fore.GREEN}{result}")
 
 
-def _get_solution_obj(day: int) -> SolutionAbstract:
+def _bench(
+    day: None | int,
+    repeat: int,
+    warmup: int,
+    output: None | Path,
+    memory: bool,
+    instrument: bool,
+    use_cache: bool,
+) -> None:
     """"""
-    dir_name = f"day_{day:>02}"
-    solution_module = import_module(f"{dir_name}.solution")
-    SolutionClass: type[SolutionAbstract] = getattr(solution_module, "Solution")
-    return SolutionClass()
+    from bench import (
+        bench_days,
+        format_instruments,
+        format_table,
+        instrument_day,
+        to_report,
+        write_report,
+    )
+    from profiling import format_memory, measure_memory
+
+    if day is None:
+        days = _get_input_days()
+    else:
+        days = [day]
+    results = bench_days(days, repeat=repeat, warmup=warmup, use_cache=use_cache)
+    if use_cache:
+        print(f"{Fore.YELLOW}init loads the cached data of days caching it")
+    print(format_table(results))
+    memory_results = None
+    if memory:
+        memory_results = {day: measure_memory(day, use_cache=use_cache) for day in days}
+        for day, day_memory in memory_results.items():
+            print(f"{Fore.CYAN}Day {day} memory")
+            print(format_memory(day_memory))
+    instruments = None
+    if instrument:
+        instruments = {day: instrument_day(day, use_cache=use_cache) for day in days}
+        for day, day_instruments in instruments.items():
+            report_str = format_instruments(day_instruments)
+            if report_str:
+                print(f"{Fore.CYAN}Day {day} instruments")
+                print(report_str)
+    if output is not None:
+        report = to_report(
+            results,
+            repeat=repeat,
+            warmup=warmup,
+            use_cache=use_cache,
+            memory=memory_results,
+            instruments=instruments,
+        )
+        write_report(report, output)
+        print(f"{Fore.GREEN}Wrote report to {output}")
+
+
+def _perfcheck(
+    days: list[int],
+    baseline_path: None | Path,
+    tolerance: float,
+    min_delta: float,
+    repeat: int,
+    warmup: int,
+    update_baseline: bool,
+    use_cache: bool,
+) -> bool:
+    """"""
+    from bench import (
+        BASELINE_PATH,
+        bench_days,
+        compare_to_baseline,
+        format_comparisons,
+        load_report,
+        to_report,
+        write_report,
+    )
+
+    if baseline_path is None:
+        baseline_path = BASELINE_PATH
+    if not days:
+        days = _get_input_days()
+    baseline = None
+    if baseline_path.exists():
+        baseline = load_report(baseline_path)
+    elif not update_baseline:
+        raise FileNotFoundError(
+            f"No baseline at {baseline_path}. Create it with --update-baseline."
+        )
+
+    results = bench_days(days, repeat=repeat, warmup=warmup, use_cache=use_cache)
+    if update_baseline:
+        report = to_report(results, repeat=repeat, warmup=warmup, use_cache=use_cache)
+        # Keep the baselines of days not benchmarked this time
+        if baseline is not None and baseline.get("use_cache") == use_cache:
+            report["days"] = baseline["days"] | report["days"]
+        write_report(report, baseline_path)
+        print(f"{Fore.GREEN}Updated the baseline of days {days} in {baseline_path}")
+        return True
+
+    assert baseline is not None
+    missing = [day for day in days if str(day) not in baseline["days"]]
+    if missing:
+        print(f"{Fore.YELLOW}No baseline for days {missing}")
+    comparisons = compare_to_baseline(
+        results,
+        baseline,
+        tolerance=tolerance,
+        min_delta=min_delta,
+        use_cache=use_cache,
+    )
+    print(format_comparisons(comparisons))
+    regressions = [comparison for comparison in comparisons if comparison.regressed]
+    if regressions:
+        print(
+            f"{Fore.RED}{len(regressions)} phase(s) slower than the baseline by more "
+            f"than {tolerance:.0%}"
+        )
+        return False
+    print(f"{Fore.GREEN}No regressions")
+    return True
+
+
+def _run_all(
+    parts: list[int],
+    max_workers: None | int,
+    timeout: None | float,
+    max_rss: None | int,
+    counters: bool,
+    gc_mode: None | str,
+    use_cache: bool,
+) -> None:
+    """"""
+    days = _get_input_days()
+    results = run_all(
+        days,
+        parts,
+        max_workers=max_workers,
+        timeout=timeout,
+        max_rss=max_rss,
+        use_cache=use_cache,
+        gc_mode=gc_mode,
+    )
+    for result in results:
+        label = f"Day {result.day:>2} part {result.part} ({result.elapsed:.3f}s):"
+        if result.exceeded is not None:
+            print(f"{Fore.MAGENTA}{label} {result.error}")
+        elif result.error is not None:
+            print(f"{Fore.RED}{label} {result.error}")
+        elif result.answer is None:
+            print(f"{Fore.YELLOW}{label} No response got")
+        else:
+            print(f"{Fore.GREEN}{label} {result.answer!r}")
+        if counters:
+            for name, value in result.counters.items():
+                print(f"    {name}: {value:,}")
+        if result.gc is not None:
+            print(f"    {format_gc(result.gc)}")
+
+
+def _verify(
+    days: list[int],
+    parts: list[int],
+    max_workers: None | int,
+    timeout: float,
+    record: bool,
+    use_cache: bool,
+) -> bool:
+    """"""
+    from verify import dump_answers, format_summary, load_answers, verify
+
+    if not days:
+        days = _get_input_days()
+    answers = load_answers()
+    checks = []
+    for check in verify(
+        days,
+        answers,
+        parts,
+        max_workers=max_workers,
+        timeout=timeout,
+        use_cache=use_cache,
+    ):
+        checks.append(check)
+        result = check.result
+        label = f"Day {result.day:>2} part {result.part} ({result.elapsed:.3f}s):"
+        match check.status:
+            case "ok":
+                print(f"{Fore.GREEN}{label} {result.answer!r}")
+            case "mismatch":
+                print(
+                    f"{Fore.RED}{label} Got {result.answer!r}, expected "
+                    f"{check.expected!r}"
+                )
+            case "exceeded":
+                print(f"{Fore.MAGENTA}{label} {result.error}")
+            case "error":
+                print(f"{Fore.RED}{label} {result.error}")
+            case _:
+                print(f"{Fore.YELLOW}{label} {result.answer!r} (no known answer)")
+    print(format_summary(checks))
+
+    recorded = [
+        check.result
+        for check in checks
+        if check.status == "unknown" and check.result.answer is not None
+    ]
+    if record and recorded:
+        for result in recorded:
+            answers.setdefault(str(result.day), {})[str(result.part)] = str(
+                result.answer
+            )
+        dump_answers(answers)
+        print(f"{Fore.GREEN}Recorded {len(recorded)} answer(s)")
+    return all(check.status in ("ok", "unknown") for check in checks)
+
+
+def _impls(
+    day: int,
+    parts: list[int],
+    scales: list[float],
+    seed: int,
+    repeat: int,
+    warmup: int,
+    use_cache: bool,
+) -> bool:
+    """"""
+    from tempfile import TemporaryDirectory
+
+    from bench import compare_implementations, format_implementations
+    from generators import generate
+
+    inputs: dict[str, None | Path] = {}
+    if get_input_path(day).exists():
+        inputs["input"] = None
+    with TemporaryDirectory() as tmp_dir:
+        for scale in scales:
+            input_path = Path(tmp_dir) / f"scale_{scale:g}.txt"
+            with input_path.open("w") as f:
+                f.write(generate(day, scale=scale, seed=seed))
+            inputs[f"x{scale:g}"] = input_path
+        if not inputs:
+            raise FileNotFoundError(f"No input for day {day}. Pass generated scales.")
+        results = compare_implementations(
+            day, inputs, parts, repeat=repeat, warmup=warmup, use_cache=use_cache
+        )
+    print(format_implementations(results))
+    failed = [result for result in results if not result.agrees]
+    if failed:
+        print(f"{Fore.RED}{len(failed)} implementation run(s) failed or disagreed")
+        return False
+    print(f"{Fore.GREEN}All implementations agree")
+    return True
+
+
+def _batch(
+    day: int,
+    part: int,
+    inputs_dir: Path,
+    pattern: str,
+    output: None | Path,
+    max_workers: None | int,
+    use_cache: bool,
+) -> None:
+    """"""
+    input_paths = sorted(path for path in inputs_dir.glob(pattern) if path.is_file())
+    if not input_paths:
+        raise FileNotFoundError(f"No inputs matching {pattern} in {inputs_dir}")
+    results = run_batch(
+        day, part, input_paths, max_workers=max_workers, use_cache=use_cache
+    )
+    failed = 0
+    with nullcontext(sys.stdout) if output is None else output.open("w") as f:
+        for result in results:
+            failed += result.error is not None
+            line = {
+                "input": str(result.input_path),
+                "answer": result.answer,
+                "elapsed": result.elapsed,
+                "error": result.error,
+                "counters": result.counters,
+            }
+            f.write(json.dumps(line) + "\n")
+            f.flush()
+    color = Fore.RED if failed else Fore.GREEN
+    print(f"{color}Ran {len(input_paths)} input(s), {failed} failed", file=sys.stderr)
+
+
+def _profile(
+    day: int,
+    part: None | int,
+    method_name: None | str,
+    top: int,
+    out_dir: None | Path,
+    use_cache: bool,
+) -> None:
+    """"""
+    from bench import format_instruments
+    from profiling import PROFILE_DIR, print_top, profile
+
+    if out_dir is None:
+        out_dir = PROFILE_DIR
+    # Import outside of the profiled function, as imports would dominate the profile
+    SolutionClass = get_solution_class(day)
+    instruments = {"init": Instruments(), "run": Instruments()}
+
+    def run() -> None:
+        """"""
+        solution_obj = SolutionClass(
+            use_cache=use_cache, instruments=instruments["init"]
+        )
+        solution_obj.instruments = instruments["run"]
+        if method_name is not None:
+            _run_method(solution_obj=solution_obj, day=day, method_name=method_name)
+        else:
+            assert part is not None
+            print(f"{Fore.GREEN}Got solution {get_answer(solution_obj, part)!r}")
+
+    stem = f"day_{day:>02}_" + (f"part_{part}" if method_name is None else method_name)
+    _, stats = profile(run, stem=stem, out_dir=out_dir)
+    print_top(stats, top)
+    instruments_str = format_instruments(instruments)
+    if instruments_str:
+        print(f"{Fore.CYAN}Instruments (inflated by profiling)")
+        print(instruments_str)
+    print(f"{Fore.GREEN}Wrote {stem}.prof and {stem}.collapsed to {out_dir}")
+
+
+def _generate(day: int, scale: float, seed: int, output: None | Path) -> None:
+    """"""
+    from generators import generate
+
+    data = generate(day, scale=scale, seed=seed)
+    if output is None:
+        print(data, end="")
+        return
+    with output.open("w") as f:
+        f.write(data)
+    print(f"{Fore.GREEN}Wrote {len(data)} bytes to {output}")
+
+
+def _scale(
+    day: int,
+    parts: list[int],
+    start: float,
+    factor: float,
+    steps: int,
+    seed: int,
+    repeat: int,
+    memory: bool,
+    out_dir: None | Path,
+) -> None:
+    """"""
+    from scaling import (
+        SCALING_DIR,
+        fit_points,
+        format_fits,
+        get_ladder,
+        measure_scaling,
+        plot,
+        write_csv,
+    )
+
+    if out_dir is None:
+        out_dir = SCALING_DIR
+    scales = get_ladder(start, factor, steps)
+    points = measure_scaling(
+        day, scales, parts, seed=seed, repeat=repeat, memory=memory
+    )
+    for point in points:
+        if point.error is not None:
+            print(
+                f"{Fore.YELLOW}Scale {point.scale:g} {point.phase} failed: "
+                f"{point.error}"
+            )
+    fits = fit_points(points)
+    print(format_fits(fits))
+    out_dir.mkdir(parents=True, exist_ok=True)
+    stem = f"day_{day:>02}_scaling"
+    write_csv(points, out_dir / f"{stem}.csv")
+    plot(points, fits, out_dir / f"{stem}.png", day=day)
+    print(f"{Fore.GREEN}Wrote {stem}.csv and {stem}.png to {out_dir}")
+
+
+def _solve(
+    day: int,
+    parts: list[int],
+    use_cache: bool,
+    use_memo: bool,
+    use_daemon: bool,
+    progress: None | Progress,
+    impl: None | str,
+) -> dict[int, None | str | int]:
+    """"""
+    # Only answers of the reference implementation are memoized, so that an
+    #   alternative is always run, and its answers never stand in for the reference's
+    memoize = impl is None or impl == REFERENCE_IMPL
+    if not memoize:
+        SolutionClass = get_solution_class(day)
+        for part in parts:
+            if impl not in SolutionClass.get_implementation_names(part):
+                raise ValueError(
+                    f"No implementation {impl!r} of day {day} part {part}."
+                )
+    store = AnswerStore()
+    input_hash = hash_file(get_input_path(day))
+    source_hash = hash_file(get_solution_path(day))
+    solutions: dict[int, None | str | int] = {}
+    for part in parts:
+        if not use_memo or not memoize:
+            break
+        stored = store.get(
+            day=day, part=part, input_hash=input_hash, source_hash=source_hash
+        )
+        if stored is not None:
+            print(
+                f"{Fore.CYAN}Using part {part} answer memoized at "
+                f"{stored.computed_at}, which took {stored.elapsed:.3f}s to compute"
+            )
+            solutions[part] = stored.answer
+
+    missing_parts = [part for part in parts if part not in solutions]
+    if not missing_parts:
+        return solutions
+    if _is_daemon_running(use_daemon):
+        computed = _solve_with_daemon(
+            day, missing_parts, use_cache=use_cache, impl=impl
+        )
+    else:
+        computed = _solve_locally(
+            day, missing_parts, use_cache=use_cache, progress=progress, impl=impl
+        )
+    for part, (solution, elapsed) in computed.items():
+        solutions[part] = solution
+        if solution is not None and memoize:
+            store.put(
+                day=day,
+                part=part,
+                input_hash=input_hash,
+                source_hash=source_hash,
+                answer=solution,
+                elapsed=elapsed,
+            )
+    return {part: solutions[part] for part in parts}
+
+
+def _solve_locally(
+    day: int,
+    parts: list[int],
+    use_cache: bool,
+    progress: None | Progress,
+    impl: None | str,
+) -> dict[int, tuple[None | str | int, float]]:
+    """
+    Run parts from a single parse, getting each answer with the seconds it took,
+    including parsing.
+    """
+    start = perf_counter()
+    solution_obj = _get_solution_obj(day, use_cache=use_cache, progress=progress)
+    parse_elapsed = perf_counter() - start
+    snapshot = solution_obj.snapshot() if len(parts) > 1 else None
+    computed: dict[int, tuple[None | str | int, float]] = {}
+    for i, part in enumerate(parts):
+        if i and snapshot is not None:
+            solution_obj.restore(snapshot)
+        start = perf_counter()
+        solution = get_answer(solution_obj, part, impl)
+        computed[part] = (solution, parse_elapsed + perf_counter() - start)
+    return computed
+
+
+def _solve_with_daemon(
+    day: int, parts: list[int], use_cache: bool, impl: None | str
+) -> dict[int, tuple[None | str | int, float]]:
+    """
+    Like `_solve_locally`, on the running daemon.
+    """
+    from daemon import request
+
+    computed: dict[int, tuple[None | str | int, float]] = {}
+    for part in parts:
+        response = request(
+            {"day": day, "part": part, "use_cache": use_cache, "impl": impl}
+        )
+        if response["reloaded"]:
+            print(f"{Fore.CYAN}Daemon reloaded day {day}'s solution")
+        message = f"Daemon solved part {part} in {response['elapsed']:.3f}s"
+        if response["parse_elapsed"]:
+            message += f" after parsing for {response['parse_elapsed']:.3f}s"
+        print(f"{Fore.CYAN}{message}")
+        computed[part] = (
+            response["result"],
+            response["parse_elapsed"] + response["elapsed"],
+        )
+    return computed
+
+
+def _is_daemon_running(use_daemon: bool) -> bool:
+    """"""
+    # The daemon listens on a Unix socket, which not every platform has
+    if not use_daemon or not hasattr(socket, "AF_UNIX"):
+        return False
+    from daemon import is_running
+
+    return is_running()
+
+
+def _get_input_days() -> list[int]:
+    """
+    Get the days with both a solution and an input, warning about the others.
+    """
+    days = [day for day in get_days() if get_input_path(day).exists()]
+    skipped = sorted(set(get_days()) - set(days))
+    if skipped:
+        print(f"{Fore.YELLOW}Skipping days without input: {skipped}")
+    return days
 
 
-def _get_solution(solution_obj: SolutionAbstract, part: int) -> str | int:
+def _get_solution_obj(
+    day: int, use_cache: bool, progress: None | Progress = None
+) -> SolutionAbstract:
     """"""
-    match part:
-        case 1:
-            return solution_obj.part_1()
-        case 2:
-            return solution_obj.part_2()
-        case _:
-            raise ValueError(f"Unknown part number {part}.")
+    SolutionClass = get_solution_class(day)
+    return SolutionClass(use_cache=use_cache, progress=progress)
 
 
 if __name__ == "__main__":
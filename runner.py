@@ -0,0 +1,325 @@
+# pyright: reportMissingTypeStubs=false
+"""
+Run solutions outside of the interactive CLI
+"""
+
+from __future__ import annotations
+
+import os
+from contextlib import nullcontext, redirect_stdout
+from dataclasses import dataclass, field
+from pathlib import Path
+from time import perf_counter
+from typing import TYPE_CHECKING
+
+from gc_control import gc_mode as apply_gc_mode
+from utils import REFERENCE_IMPL, Instruments, get_solution_class
+
+if TYPE_CHECKING:
+    from collections.abc import Generator, Iterable
+    from multiprocessing.connection import Connection
+    from typing import Any
+
+    from gc_control import GcStats
+    from utils import SolutionAbstract
+
+# How often, in seconds, a budgeted part is checked on
+_BUDGET_POLL_INTERVAL = 0.05
+# Parts are started from threads, which must not fork the process they run in
+_START_METHODS = ("forkserver", "spawn")
+
+
+@dataclass(frozen=True, kw_only=True)
+class PartResult:
+    """
+    Outcome of running one part of one day
+    """
+
+    day: int
+    part: int
+    answer: Any
+    elapsed: float
+    error: None | str = None
+    # Budget the part was killed for, `"timeout"` or `"max_rss"`
+    exceeded: None | str = None
+    # Input other than the day's downloaded one
+    input_path: None | Path = None
+    # Operations the solution counted, see `SolutionAbstract.count`
+    counters: dict[str, int] = field(default_factory=dict)
+    # Collections run during the part, when run in a GC mode
+    gc: None | GcStats = None
+
+
+def get_answer(
+    solution_obj: SolutionAbstract, part: int, impl: None | str = None
+) -> Any:
+    """
+    Run a part on a solution object.
+    Args:
+        solution_obj (SolutionAbstract): Solution object with parsed data
+        part         (1, 2)            : Part number
+        impl         (None | str)      : Name of the implementation to run. Defaults
+            to `part_1`/`part_2`
+    Returns:
+        (Any): The part's answer
+    """
+    if impl is not None and impl != REFERENCE_IMPL:
+        method_name = type(solution_obj).implementations.get(part, {}).get(impl)
+        if method_name is None:
+            raise ValueError(
+                f"No implementation {impl!r} of day {solution_obj.day} part {part}."
+            )
+        return getattr(solution_obj, method_name)()
+    match part:
+        case 1:
+            return solution_obj.part_1()
+        case 2:
+            return solution_obj.part_2()
+        case _:
+            raise ValueError(f"Unknown part number {part}.")
+
+
+def run_part(
+    day: int,
+    part: int,
+    *,
+    use_cache: bool = True,
+    input_path: None | Path = None,
+    gc_mode: None | str = None,
+) -> PartResult:
+    """
+    Parse a day's input and run one part, discarding anything the solution prints,
+    and collecting what it counts. Errors are caught and reported in the result.
+    Args:
+        day        (1..25)              : The day of AOC
+        part       (1, 2)               : Part number
+        use_cache  (bool)               : Whether processed data may come from the
+            cache
+        input_path (None | pathlib.Path): Input to use instead of the downloaded one
+        gc_mode    (None | str)         : Mode to run the garbage collector in once
+            parsed, and measure it, see `gc_control.GC_MODES`
+    Returns:
+        (PartResult): The answer and the time taken, including parsing
+    """
+    instruments = Instruments()
+    monitor = None
+    start = perf_counter()
+    try:
+        with open(os.devnull, "w") as null_fp, redirect_stdout(null_fp):
+            SolutionClass = get_solution_class(day)
+            solution_obj = SolutionClass(
+                use_cache=use_cache, input_path=input_path, instruments=instruments
+            )
+            with (
+                nullcontext() if gc_mode is None else apply_gc_mode(gc_mode)
+            ) as monitor:
+                answer = get_answer(solution_obj, part)
+    except Exception as err:
+        return PartResult(
+            day=day,
+            part=part,
+            answer=None,
+            elapsed=perf_counter() - start,
+            error=f"{type(err).__name__}: {err}",
+            input_path=input_path,
+            counters=instruments.counters,
+            gc=None if monitor is None else monitor.stats(),
+        )
+    return PartResult(
+        day=day,
+        part=part,
+        answer=answer,
+        elapsed=perf_counter() - start,
+        input_path=input_path,
+        counters=instruments.counters,
+        gc=None if monitor is None else monitor.stats(),
+    )
+
+
+def run_part_budgeted(
+    day: int,
+    part: int,
+    *,
+    timeout: None | float = None,
+    max_rss: None | int = None,
+    use_cache: bool = True,
+    gc_mode: None | str = None,
+) -> PartResult:
+    """
+    Like `run_part`, in a child process that is killed once it runs for longer than
+    `timeout` or its resident memory grows beyond `max_rss`. Memory is read from
+    `/proc`, so `max_rss` is only enforced on Linux. The child is started from a fork
+    server where available, as this may be called from threads, which makes forking
+    the calling process unsafe.
+    Args:
+        day       (1..25)       : The day of AOC
+        part      (1, 2)        : Part number
+        timeout   (None | float): Wall-clock budget in seconds
+        max_rss   (None | int)  : Resident memory budget in bytes
+        use_cache (bool)        : Whether processed data may come from the cache
+        gc_mode   (None | str)  : Mode to run the garbage collector in, see
+            `run_part`
+    Returns:
+        (PartResult): The part's result, or the time until it was killed with
+            `exceeded` set
+    """
+    # Only needed for budgets, and slow to import
+    import multiprocessing
+
+    start_method = next(
+        method
+        for method in _START_METHODS
+        if method in multiprocessing.get_all_start_methods()
+    )
+    context = multiprocessing.get_context(start_method)
+    if start_method == "forkserver":
+        # Imported once by the server rather than by each child
+        context.set_forkserver_preload([__name__])
+    receiver, sender = context.Pipe(duplex=False)
+    process = context.Process(
+        target=_send_part_result,
+        args=(sender, day, part),
+        kwargs={"use_cache": use_cache, "gc_mode": gc_mode},
+        daemon=True,
+    )
+    start = perf_counter()
+    process.start()
+    sender.close()
+    exceeded = None
+    try:
+        while True:
+            if receiver.poll(_BUDGET_POLL_INTERVAL):
+                try:
+                    return receiver.recv()
+                except EOFError:
+                    # Died without sending a result
+                    break
+            if timeout is not None and perf_counter() - start > timeout:
+                exceeded = "timeout"
+                break
+            if max_rss is not None and (_get_rss(process.pid) or 0) > max_rss:
+                exceeded = "max_rss"
+                break
+    finally:
+        process.kill()
+        process.join()
+        receiver.close()
+    elapsed = perf_counter() - start
+    if exceeded is None:
+        error = f"Process died with exit code {process.exitcode}"
+    else:
+        error = f"Budget exceeded: {exceeded}"
+    return PartResult(
+        day=day, part=part, answer=None, elapsed=elapsed, error=error, exceeded=exceeded
+    )
+
+
+def run_all(
+    days: Iterable[int],
+    parts: Iterable[int] = (1, 2),
+    *,
+    max_workers: None | int = None,
+    timeout: None | float = None,
+    max_rss: None | int = None,
+    use_cache: bool = True,
+    gc_mode: None | str = None,
+) -> Generator[PartResult, None, None]:
+    """
+    Run every part of every given day in parallel, yielding results as they finish.
+    Each day/part gets a process of its own, as some solutions keep state on classes
+    or mutate their parsed data, started by `run_part_budgeted` so that a part
+    exceeding a budget doesn't hold up the rest.
+    Args:
+        days        (Iterable[int]): Days of AOC
+        parts       (Iterable[int]): Part numbers to run for each day
+        max_workers (None | int)   : Parts run at once. Defaults to the CPU count
+        timeout     (None | float) : Wall-clock budget of each part in seconds
+        max_rss     (None | int)   : Resident memory budget of each part in bytes
+        use_cache   (bool)         : Whether processed data may come from the cache
+        gc_mode     (None | str)   : Mode to run the garbage collector in, see
+            `run_part`
+    Returns:
+        (Generator[PartResult]): Results in order of completion
+    """
+    # Only needed for sweeps, and slow to import
+    from concurrent.futures import ThreadPoolExecutor, as_completed
+
+    tasks = [(day, part) for day in days for part in parts]
+    if max_workers is None:
+        max_workers = os.cpu_count() or 1
+    kwargs = {
+        "timeout": timeout,
+        "max_rss": max_rss,
+        "use_cache": use_cache,
+        "gc_mode": gc_mode,
+    }
+    # Threads only wait on the processes running the parts
+    with ThreadPoolExecutor(max_workers=max_workers) as pool:
+        futures = [
+            pool.submit(run_part_budgeted, day, part, **kwargs) for day, part in tasks
+        ]
+        for future in as_completed(futures):
+            yield future.result()
+
+
+def run_batch(
+    day: int,
+    part: int,
+    input_paths: Iterable[Path],
+    *,
+    max_workers: None | int = None,
+    use_cache: bool = True,
+) -> Generator[PartResult, None, None]:
+    """
+    Run one part of a day on many inputs on a process pool, yielding results as they
+    finish. Unlike `run_all`, workers are reused across inputs, and the solution is
+    imported before the workers are forked so that they don't each import it.
+    Args:
+        day         (1..25)                 : The day of AOC
+        part        (1, 2)                  : Part number
+        input_paths (Iterable[pathlib.Path]): Inputs to run the part on
+        max_workers (None | int)            : Pool size. Defaults to the CPU count
+        use_cache   (bool)                  : Whether processed data may come from
+            the cache
+    Returns:
+        (Generator[PartResult]): Results in order of completion
+    """
+    # Only needed for batches, and slow to import
+    from concurrent.futures import ProcessPoolExecutor, as_completed
+
+    get_solution_class(day)
+    if max_workers is None:
+        max_workers = os.cpu_count() or 1
+    with ProcessPoolExecutor(max_workers=max_workers) as pool:
+        futures = [
+            pool.submit(run_part, day, part, use_cache=use_cache, input_path=path)
+            for path in input_paths
+        ]
+        for future in as_completed(futures):
+            yield future.result()
+
+
+def _send_part_result(
+    conn: Connection, day: int, part: int, *, use_cache: bool, gc_mode: None | str
+) -> None:
+    """
+    Run a part in a child process and send its result to the parent. The connection
+    is closed once sent, so that the parent sees the child dying without a result
+    as the end of the pipe.
+    """
+    with conn:
+        conn.send(run_part(day, part, use_cache=use_cache, gc_mode=gc_mode))
+
+
+def _get_rss(pid: None | int) -> None | int:
+    """
+    Get the resident memory of a process in bytes, if it can be read from `/proc`.
+    """
+    try:
+        with Path(f"/proc/{pid}/status").open("r") as f:
+            for line in f:
+                if line.startswith("VmRSS:"):
+                    return int(line.split()[1]) * 1024
+    except OSError:
+        pass
+    return None
@@ -0,0 +1,364 @@
+# pyright: reportMissingTypeStubs=false
+"""
+Measure how solutions scale with input size, on generated inputs
+"""
+
+from __future__ import annotations
+
+import csv
+import os
+from contextlib import redirect_stdout
+from dataclasses import dataclass
+from math import log, sqrt
+from pathlib import Path
+from tempfile import TemporaryDirectory
+from time import perf_counter
+from typing import TYPE_CHECKING
+
+from cache import CACHE_DIR
+from generators import generate
+from profiling import trace_memory
+from runner import get_answer
+from utils import get_solution_class
+
+if TYPE_CHECKING:
+    from collections.abc import Callable, Iterable
+    from typing import Any
+
+    from utils import SolutionAbstract
+
+    _Measure = Callable[[Callable[[], Any]], tuple[Any, float]]
+
+SCALING_DIR = CACHE_DIR / "scaling"
+
+# Cost functions of the complexity classes fitted to measurements
+COMPLEXITIES: dict[str, Callable[[float], float]] = {
+    "O(1)": lambda n: 1.0,
+    "O(log n)": lambda n: log(n),
+    "O(n)": lambda n: n,
+    "O(n log n)": lambda n: n * log(n),
+    "O(n^2)": lambda n: n**2,
+    "O(n^3)": lambda n: n**3,
+}
+# Values measured on every input size
+METRICS = ("seconds", "peak_bytes")
+
+
+@dataclass(frozen=True, kw_only=True)
+class ScalePoint:
+    """
+    Measurements of one phase on one input size
+    """
+
+    scale: float
+    # Input size in bytes
+    size: int
+    phase: str
+    # Fastest of the timed runs
+    seconds: None | float = None
+    peak_bytes: None | int = None
+    error: None | str = None
+
+
+@dataclass(frozen=True, kw_only=True)
+class Fit:
+    """
+    Complexity class best matching measurements
+    """
+
+    complexity: str
+    coefficient: float
+    # Root mean square of the relative errors of the fitted values
+    residual: float
+    # Slope of the measurements on a log-log scale
+    exponent: float
+
+
+def get_ladder(start: float, factor: float, steps: int) -> list[float]:
+    """
+    Get a geometric ladder of scales.
+    Args:
+        start  (float): Smallest scale
+        factor (float): Ratio between consecutive scales
+        steps  (int)  : Number of scales
+    Returns:
+        (list[float]): Scales, smallest first
+    """
+    if start <= 0 or factor <= 1 or steps < 1:
+        raise ValueError(f"Invalid ladder: {start=}, {factor=}, {steps=}")
+    return [start * factor**i for i in range(steps)]
+
+
+def measure_scaling(
+    day: int,
+    scales: Iterable[float],
+    parts: Iterable[int] = (1, 2),
+    *,
+    seed: int = 0,
+    repeat: int = 3,
+    memory: bool = True,
+) -> list[ScalePoint]:
+    """
+    Time parsing and each part of a day on generated inputs of increasing size, and
+    optionally measure their peak memory in a separate, untimed run. Failing phases
+    are recorded with their error rather than stopping the measurements. Anything the
+    solution prints is discarded.
+    Args:
+        day    (1..25)          : The day of AOC
+        scales (Iterable[float]): Input scales, see `generators.generate`
+        parts  (Iterable[int])  : Part numbers to measure
+        seed   (int)            : Seed of the generated inputs
+        repeat (int)            : Number of timed runs per input
+        memory (bool)           : Whether to measure peak memory
+    Returns:
+        (list[ScalePoint]): Measurements of each phase on each input
+    """
+    if repeat < 1:
+        raise ValueError(f"{repeat=} must be positive")
+    SolutionClass = get_solution_class(day)
+    parts = list(parts)
+    points: list[ScalePoint] = []
+    with TemporaryDirectory() as tmp_dir:
+        input_path = Path(tmp_dir) / "input.txt"
+        for scale in scales:
+            data = generate(day, scale=scale, seed=seed)
+            with input_path.open("w") as f:
+                f.write(data)
+            with open(os.devnull, "w") as null_fp, redirect_stdout(null_fp):
+                points.extend(
+                    _measure_input(
+                        SolutionClass,
+                        input_path,
+                        parts,
+                        scale=scale,
+                        size=len(data),
+                        repeat=repeat,
+                        memory=memory,
+                    )
+                )
+    return points
+
+
+def fit_complexity(sizes: list[int], values: list[float]) -> None | Fit:
+    """
+    Fit measurements to each of `COMPLEXITIES`, as `value = coefficient * f(size)`
+    with least squares, and pick the one with the smallest relative errors.
+    Args:
+        sizes  (list[int])  : Input sizes
+        values (list[float]): Positive measurements on each input size
+    Returns:
+        (None | Fit): Best fit, or `None` with fewer than 3 distinct sizes
+    """
+    if len(set(sizes)) < 3 or min(values) <= 0:
+        return None
+    log_sizes = [log(size) for size in sizes]
+    log_values = [log(value) for value in values]
+    mean_log_size = sum(log_sizes) / len(log_sizes)
+    mean_log_value = sum(log_values) / len(log_values)
+    exponent = sum(
+        (log_size - mean_log_size) * (log_value - mean_log_value)
+        for log_size, log_value in zip(log_sizes, log_values)
+    ) / sum((log_size - mean_log_size) ** 2 for log_size in log_sizes)
+
+    fits: list[Fit] = []
+    for complexity, cost in COMPLEXITIES.items():
+        costs = [cost(size) for size in sizes]
+        coefficient = sum(c * v for c, v in zip(costs, values)) / sum(
+            c**2 for c in costs
+        )
+        residual = sqrt(
+            sum(((coefficient * c - v) / v) ** 2 for c, v in zip(costs, values))
+            / len(values)
+        )
+        fits.append(
+            Fit(
+                complexity=complexity,
+                coefficient=coefficient,
+                residual=residual,
+                exponent=exponent,
+            )
+        )
+    return min(fits, key=lambda fit: fit.residual)
+
+
+def fit_points(points: list[ScalePoint]) -> dict[tuple[str, str], Fit]:
+    """
+    Fit each phase's time and peak memory. See `fit_complexity`.
+    Args:
+        points (list[ScalePoint]): Measurements from `measure_scaling`
+    Returns:
+        (dict[tuple[str, str], Fit]): Fits keyed by phase and metric in `METRICS`
+    """
+    fits: dict[tuple[str, str], Fit] = {}
+    for phase in dict.fromkeys(point.phase for point in points):
+        for metric in METRICS:
+            measured = _get_measured(points, phase, metric)
+            fit = fit_complexity(
+                [size for size, _ in measured], [value for _, value in measured]
+            )
+            if fit is not None:
+                fits[phase, metric] = fit
+    return fits
+
+
+def write_csv(points: list[ScalePoint], path: Path) -> None:
+    """
+    Write measurements as CSV, one row per phase and input size.
+    """
+    with path.open("w", newline="") as f:
+        writer = csv.writer(f)
+        writer.writerow(["scale", "size", "phase", *METRICS, "error"])
+        for point in points:
+            writer.writerow(
+                [
+                    point.scale,
+                    point.size,
+                    point.phase,
+                    point.seconds,
+                    point.peak_bytes,
+                    point.error,
+                ]
+            )
+
+
+def plot(
+    points: list[ScalePoint], fits: dict[tuple[str, str], Fit], path: Path, *, day: int
+) -> None:
+    """
+    Plot time and peak memory against input size on log-log scales, labelling each
+    phase with its fitted complexity.
+    """
+    # Only needed for plots, and slow to import
+    import matplotlib
+
+    # Write files without a display
+    matplotlib.use("Agg")
+    from matplotlib import pyplot as plt
+
+    fig, axes = plt.subplots(1, len(METRICS), figsize=(12, 5))
+    for ax, metric in zip(axes, METRICS):
+        for phase in dict.fromkeys(point.phase for point in points):
+            measured = _get_measured(points, phase, metric)
+            if not measured:
+                continue
+            fit = fits.get((phase, metric))
+            label = phase if fit is None else f"{phase} ~ {fit.complexity}"
+            ax.plot(*zip(*measured), marker="o", label=label)
+        ax.set_xscale("log")
+        ax.set_yscale("log")
+        ax.set_xlabel("Input size (bytes)")
+        ax.set_ylabel(metric)
+        ax.legend()
+    fig.suptitle(f"Day {day} scaling")
+    fig.tight_layout()
+    fig.savefig(path)
+    plt.close(fig)
+
+
+def format_fits(fits: dict[tuple[str, str], Fit]) -> str:
+    """
+    Format fits as a human-readable table.
+    """
+    lines = [
+        f"{'Phase':<6}  {'Metric':<10}  {'Complexity':<10}  {'Exponent':>8}  "
+        f"{'Residual':>8}"
+    ]
+    for (phase, metric), fit in fits.items():
+        lines.append(
+            f"{phase:<6}  {metric:<10}  {fit.complexity:<10}  {fit.exponent:>8.2f}  "
+            f"{fit.residual:>8.3f}"
+        )
+    return "\n".join(lines)
+
+
+def _measure_input(
+    SolutionClass: type[SolutionAbstract],
+    input_path: Path,
+    parts: list[int],
+    *,
+    scale: float,
+    size: int,
+    repeat: int,
+    memory: bool,
+) -> list[ScalePoint]:
+    """"""
+    timings: dict[str, list[float]] = {}
+    errors: dict[str, str] = {}
+    for _ in range(repeat):
+        results = _run_phases(SolutionClass, input_path, parts, _time_call)
+        for phase, result in results.items():
+            if isinstance(result, str):
+                errors[phase] = result
+            else:
+                timings.setdefault(phase, []).append(result)
+    peaks: dict[str, float | str] = {}
+    if memory:
+        peaks = _run_phases(SolutionClass, input_path, parts, _trace_call)
+
+    points: list[ScalePoint] = []
+    for phase in ["init"] + [f"part_{part}" for part in parts]:
+        peak = peaks.get(phase)
+        points.append(
+            ScalePoint(
+                scale=scale,
+                size=size,
+                phase=phase,
+                seconds=None if phase in errors else min(timings[phase]),
+                peak_bytes=None if peak is None or isinstance(peak, str) else int(peak),
+                error=errors.get(phase),
+            )
+        )
+    return points
+
+
+def _run_phases(
+    SolutionClass: type[SolutionAbstract],
+    input_path: Path,
+    parts: list[int],
+    measure: _Measure,
+) -> dict[str, float | str]:
+    """
+    Measure parsing and each part, on a fresh snapshot of the data. Failing phases get
+    their error message instead.
+    """
+    results: dict[str, float | str] = {}
+    try:
+        solution_obj, results["init"] = measure(
+            lambda: SolutionClass(use_cache=False, input_path=input_path)
+        )
+    except Exception as err:
+        error = f"{type(err).__name__}: {err}"
+        return dict.fromkeys(["init"] + [f"part_{part}" for part in parts], error)
+    snapshot = solution_obj.snapshot()
+    for part in parts:
+        solution_obj.restore(snapshot)
+        try:
+            _, results[f"part_{part}"] = measure(lambda: get_answer(solution_obj, part))
+        except Exception as err:
+            results[f"part_{part}"] = f"{type(err).__name__}: {err}"
+    return results
+
+
+def _time_call(func: Callable[[], Any]) -> tuple[Any, float]:
+    """"""
+    start = perf_counter()
+    result = func()
+    return result, perf_counter() - start
+
+
+def _trace_call(func: Callable[[], Any]) -> tuple[Any, float]:
+    """"""
+    result, stats = trace_memory(func, top=0)
+    return result, stats.peak
+
+
+def _get_measured(
+    points: list[ScalePoint], phase: str, metric: str
+) -> list[tuple[int, float]]:
+    """"""
+    measured: list[tuple[int, float]] = []
+    for point in points:
+        value = getattr(point, metric)
+        if point.phase == phase and value is not None:
+            measured.append((point.size, value))
+    return measured
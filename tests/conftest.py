@@ -0,0 +1,116 @@
+"""
+Fixtures shared by the tests
+"""
+
+from __future__ import annotations
+
+import re
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import TYPE_CHECKING
+
+import pytest
+
+import aoc_io
+
+if TYPE_CHECKING:
+    from collections.abc import Generator
+    from pathlib import Path
+
+_INPUT_PATH_RE = re.compile(r"/day/(\d+)/input")
+
+
+class StandInServer(ThreadingHTTPServer):
+    """
+    Local stand-in for AOC serving inputs, `input <day>` with the day as ETag
+    """
+
+    # Requests received, as (method, path)
+    requests: list[tuple[str, str]]
+    # Days whose input requests fail with a status code
+    failing_days: dict[int, int]
+    # Seconds to stall before responding to a day's input requests
+    delays: dict[int, float]
+
+    def __init__(self) -> None:
+        super().__init__(("127.0.0.1", 0), _StandInHandler)
+        self.requests = []
+        self.failing_days = {}
+        self.delays = {}
+
+    @property
+    def url(self) -> str:
+        """"""
+        host, port = self.server_address[:2]
+        return f"http://{host}:{port}"
+
+
+class _StandInHandler(BaseHTTPRequestHandler):
+    """"""
+
+    server: StandInServer
+
+    def do_GET(self) -> None:
+        """"""
+        self.server.requests.append(("GET", self.path))
+        match = _INPUT_PATH_RE.fullmatch(self.path)
+        if match is None:
+            self.send_error(404)
+            return
+        day = int(match[1])
+        time.sleep(self.server.delays.get(day, 0.0))
+        if day in self.server.failing_days:
+            self.send_error(self.server.failing_days[day])
+            return
+        etag = f'"{day}"'
+        if self.headers.get("If-None-Match") == etag:
+            self.send_response(304)
+            self.end_headers()
+            return
+        body = f"input {day}\n".encode()
+        self.send_response(200)
+        self.send_header("ETag", etag)
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, *args: object) -> None:
+        """"""
+
+
+@pytest.fixture
+def stand_in_server() -> Generator[StandInServer, None, None]:
+    """
+    Stand-in server running on a background thread.
+    """
+    server = StandInServer()
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    try:
+        yield server
+    finally:
+        server.shutdown()
+        server.server_close()
+
+
+@pytest.fixture
+def aoc(
+    monkeypatch: pytest.MonkeyPatch, tmp_path: Path, stand_in_server: StandInServer
+) -> Generator[StandInServer, None, None]:
+    """
+    Point `aoc_io` at the stand-in server, with inputs and records under `tmp_path`.
+    """
+    monkeypatch.setattr(aoc_io, "BASE_URL", stand_in_server.url)
+    monkeypatch.setattr(
+        aoc_io,
+        "get_input_path",
+        lambda day: tmp_path / f"day_{day:>02}" / "input.txt",
+    )
+    monkeypatch.setattr(aoc_io, "_DOWNLOADS_PATH", tmp_path / "downloads.json")
+    monkeypatch.setattr(aoc_io, "_SUBMISSIONS_PATH", tmp_path / "submissions.json")
+    monkeypatch.setattr(aoc_io, "_get_cookies", lambda: {})
+    monkeypatch.setattr(aoc_io, "_BACKOFF_BASE", 0.0)
+    aoc_io._get_session.cache_clear()
+    yield stand_in_server
+    aoc_io._get_session.cache_clear()
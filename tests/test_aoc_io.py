@@ -0,0 +1,152 @@
+"""
+Downloads and submissions against a local stand-in for AOC
+"""
+
+from __future__ import annotations
+
+import json
+import sys
+from typing import TYPE_CHECKING
+
+import pytest
+
+import aoc_io
+import run
+
+if TYPE_CHECKING:
+    from pathlib import Path
+    from typing import IO, Any
+
+    from conftest import StandInServer
+
+
+def test_download_all_creates_day_directories(
+    aoc: StandInServer, monkeypatch: pytest.MonkeyPatch, tmp_path: Path
+) -> None:
+    monkeypatch.setattr(
+        sys, "argv", ["run.py", "download", "all", "-c", "10", "-r", "1000"]
+    )
+    run._main()
+
+    days = aoc_io.get_released_days()
+    assert days == list(range(1, 26))
+    for day in days:
+        assert aoc_io.get_input_path(day).read_text() == f"input {day}\n"
+    with (tmp_path / "downloads.json").open("r") as f:
+        downloads = json.load(f)
+    assert sorted(downloads, key=int) == [str(day) for day in days]
+    assert not list(tmp_path.glob("day_*/*.tmp"))
+
+
+def test_download_inputs_keeps_records_of_days_that_succeeded(
+    aoc: StandInServer, monkeypatch: pytest.MonkeyPatch, tmp_path: Path
+) -> None:
+    write_input = aoc_io._write_input
+
+    def failing_write_input(input_path: Path, data: bytes) -> None:
+        if input_path.parent.name == "day_02":
+            raise OSError("Disk full")
+        write_input(input_path, data)
+
+    monkeypatch.setattr(aoc_io, "_write_input", failing_write_input)
+    monkeypatch.setattr(aoc_io, "_REQUEST_TIMEOUT", 0.5)
+    aoc.failing_days[3] = 500
+    aoc.delays[4] = 2.0
+
+    with pytest.raises(ConnectionError, match=r"\[2, 3, 4\]"):
+        aoc_io.download_inputs(range(1, 6), concurrency=5, rate=1000, burst=5)
+
+    with (tmp_path / "downloads.json").open("r") as f:
+        downloads = json.load(f)
+    assert sorted(downloads) == ["1", "5"]
+    # Server errors and timeouts are retried, failed writes aren't
+    attempts = [path for _, path in aoc.requests]
+    assert attempts.count("/day/2/input") == 1
+    assert attempts.count("/day/3/input") == aoc_io._RETRIES
+    assert attempts.count("/day/4/input") == aoc_io._RETRIES
+
+
+_RESPONSES = {
+    "correct": "That's the right answer! You are one gold star closer.",
+    "wrong": "That's not the right answer.",
+    "too_high": "That's not the right answer; your answer is too high.",
+    "too_low": "That's not the right answer; your answer is too low.",
+}
+
+
+@pytest.mark.parametrize(
+    ("judged", "answer", "posted", "accepted"),
+    [
+        # Already judged
+        ({"100": "too_high"}, "100", False, False),
+        ({"42": "correct"}, "42", False, True),
+        # Beyond a known bound
+        ({"100": "too_high"}, "150", False, False),
+        ({"10": "too_low"}, "5", False, False),
+        # Only one answer is right
+        ({"42": "correct"}, "43", False, False),
+        # Within the known bounds
+        ({"100": "too_high", "10": "too_low"}, "50", True, True),
+        ({"abc": "wrong"}, "abd", True, True),
+    ],
+)
+def test_submit_output_skips_answers_with_known_outcomes(
+    aoc: StandInServer,
+    monkeypatch: pytest.MonkeyPatch,
+    tmp_path: Path,
+    judged: dict[str, str],
+    answer: str,
+    posted: bool,
+    accepted: bool,
+) -> None:
+    submissions_path = tmp_path / "submissions.json"
+    ledger = {"wait_until": 0.0, "days": {"1": {"1": judged}}}
+    submissions_path.write_text(json.dumps(ledger))
+    posts: list[tuple[int, int, str]] = []
+
+    def post_answer(day: int, part: int, answer: str) -> str:
+        posts.append((day, part, answer))
+        return _RESPONSES["correct"]
+
+    monkeypatch.setattr(aoc_io, "_post_answer", post_answer)
+    assert aoc_io.submit_output(1, 1, answer) is accepted
+    assert posts == ([(1, 1, answer)] if posted else [])
+
+    with submissions_path.open("r") as f:
+        attempts = json.load(f)["days"]["1"]["1"]
+    assert attempts == (judged | {answer: "correct"} if posted else judged)
+    assert not list(tmp_path.glob("*.tmp"))
+
+
+def test_submit_output_records_bounds(
+    aoc: StandInServer, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    outcomes = {"100": "too_high", "10": "too_low", "50": "wrong"}
+    posts: list[str] = []
+
+    def post_answer(day: int, part: int, answer: str) -> str:
+        posts.append(answer)
+        return _RESPONSES[outcomes[answer]]
+
+    monkeypatch.setattr(aoc_io, "_post_answer", post_answer)
+    for answer in ["100", "10", "50", "200", "1", "50", "100"]:
+        assert aoc_io.submit_output(3, 2, answer) is False
+    assert posts == ["100", "10", "50"]
+
+
+def test_interrupted_ledger_write_keeps_the_ledger(
+    aoc: StandInServer, monkeypatch: pytest.MonkeyPatch, tmp_path: Path
+) -> None:
+    submissions_path = tmp_path / "submissions.json"
+    ledger = {"wait_until": 0.0, "days": {"1": {"1": {"100": "too_high"}}}}
+    submissions_path.write_text(json.dumps(ledger))
+
+    def interrupted_dump(obj: Any, fp: IO[str], **kwargs: Any) -> None:
+        fp.write("{")
+        raise KeyboardInterrupt
+
+    monkeypatch.setattr(aoc_io, "_post_answer", lambda *_: _RESPONSES["too_low"])
+    monkeypatch.setattr(aoc_io.json, "dump", interrupted_dump)
+    with pytest.raises(KeyboardInterrupt):
+        aoc_io.submit_output(1, 1, "10")
+    assert json.loads(submissions_path.read_text()) == ledger
@@ -0,0 +1,46 @@
+"""
+Day 13 packet keys against the reference comparison
+"""
+
+from __future__ import annotations
+
+import json
+from itertools import pairwise
+from typing import TYPE_CHECKING
+
+import pytest
+
+from day_13.solution import Solution, _compare_packet_contents, _get_depth, _to_key
+from generators import generate
+
+if TYPE_CHECKING:
+    from pathlib import Path
+
+_TRICKY_PACKETS = [[2], [[2]], [[[2]]], [], [[]], [[[]]], [2, 2], [[2], 2], [6]]
+
+
+def _sign(value: int) -> int:
+    """"""
+    return (value > 0) - (value < 0)
+
+
+@pytest.mark.parametrize("seed", range(3))
+def test_keys_compare_like_packets(seed: int) -> None:
+    packets = [
+        json.loads(line)
+        for line in generate(13, scale=1, seed=seed).splitlines()
+        if line
+    ]
+    packets.extend(_TRICKY_PACKETS)
+    depth = max(map(_get_depth, packets))
+    for left, right in [*pairwise(packets), *pairwise(_TRICKY_PACKETS[::-1])]:
+        left_key, right_key = _to_key(left, depth), _to_key(right, depth)
+        expected = _compare_packet_contents(left, right)
+        assert _sign((left_key > right_key) - (left_key < right_key)) == expected
+
+
+def test_part_2_implementations_agree_with_divider_packets(tmp_path: Path) -> None:
+    input_path = tmp_path / "input.txt"
+    input_path.write_text("[[2]]\n[1]\n\n[6]\n[[6]]\n\n[2]\n[3]\n")
+    solution = Solution(use_cache=False, input_path=input_path)
+    assert solution.part_2() == solution.part_2_key()
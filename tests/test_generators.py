@@ -0,0 +1,21 @@
+"""
+Generated inputs
+"""
+
+from __future__ import annotations
+
+import json
+
+import pytest
+
+from day_13.solution import _Packet
+from generators import generate
+
+
+@pytest.mark.parametrize("seed", range(5))
+@pytest.mark.parametrize("scale", [0.5, 1, 4])
+def test_day_13_has_no_divider_packets(scale: float, seed: int) -> None:
+    dividers = [_Packet([[2]]), _Packet([[6]])]
+    for line in generate(13, scale=scale, seed=seed).splitlines():
+        if line:
+            assert _Packet(json.loads(line)) not in dividers, line
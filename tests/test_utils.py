@@ -0,0 +1,62 @@
+"""
+Checkpoints of long-running searches
+"""
+
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+
+import utils
+from cache import DataCache
+from day_17.solution import Solution
+from generators import generate
+from utils import Checkpoint
+
+if TYPE_CHECKING:
+    from pathlib import Path
+
+    import pytest
+
+
+def _get_solution(tmp_path: Path, *, checkpoints: bool) -> Solution:
+    """"""
+    input_path = tmp_path / "input.txt"
+    input_path.write_text(generate(17, scale=1, seed=0))
+    return Solution(use_cache=True, input_path=input_path, checkpoints=checkpoints)
+
+
+def test_checkpoint_waits_an_interval_before_saving(tmp_path: Path) -> None:
+    checkpoint = Checkpoint(DataCache(tmp_path), "key", interval=60.0)
+    checkpoint.save(1)
+    assert checkpoint.load() is None
+    checkpoint.save(2, force=True)
+    assert checkpoint.load() == 2
+
+
+def test_checkpoint_key_is_hashed_once(
+    monkeypatch: pytest.MonkeyPatch, tmp_path: Path
+) -> None:
+    monkeypatch.setattr(utils, "_CHECKPOINT_DIR", tmp_path / "checkpoints")
+    hashed: list[Path] = []
+
+    def hash_file(path: Path) -> str:
+        hashed.append(path)
+        return "0" * 64
+
+    monkeypatch.setattr(utils, "hash_file", hash_file)
+    solution = _get_solution(tmp_path, checkpoints=True)
+    for _ in range(3):
+        solution.checkpoint("search", interval=0.0).save(1)
+    assert len(hashed) == 2
+    assert solution.checkpoint("search").load() == 1
+
+
+def test_disabled_checkpoints_neither_save_nor_load(
+    monkeypatch: pytest.MonkeyPatch, tmp_path: Path
+) -> None:
+    monkeypatch.setattr(utils, "_CHECKPOINT_DIR", tmp_path / "checkpoints")
+    _get_solution(tmp_path, checkpoints=True).checkpoint("search").save(1, force=True)
+    checkpoint = _get_solution(tmp_path, checkpoints=False).checkpoint("search")
+    assert checkpoint.load() is None
+    checkpoint.save(2, force=True)
+    assert _get_solution(tmp_path, checkpoints=True).checkpoint("search").load() == 1
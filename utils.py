@@ -3,25 +3,255 @@
 
 from __future__ import annotations
 
+import copy
+import inspect
+import json
+import mmap
+import sys
 from abc import ABC, abstractmethod
+from contextlib import contextmanager, nullcontext
+from importlib import import_module
 from pathlib import Path
+from time import monotonic, perf_counter
 from typing import TYPE_CHECKING
 
+from cache import CACHE_DIR, DataCache, hash_file
+
 if TYPE_CHECKING:
-    from typing import Any, ClassVar
+    from collections.abc import Callable, Generator, Iterator
+    from contextlib import AbstractContextManager
+    from typing import Any, ClassVar, TextIO, TypeVar
+
+    _F = TypeVar("_F", bound=Callable[..., Any])
+
+# Shared by all timers of solutions that are not instrumented
+_NULL_TIMER = nullcontext()
+# Bytes of input buffers split into lines at once
+_LINES_CHUNK_SIZE = 2**20
+# Kinds of progress reporting, see `get_progress`
+PROGRESS_KINDS = ("bar", "json")
+# Characters in progress bars
+_PROGRESS_BAR_WIDTH = 30
+# Directory of checkpoints of long-running searches
+_CHECKPOINT_DIR = CACHE_DIR / "checkpoints"
+# Name of `part_1`/`part_2` among the implementations of a part
+REFERENCE_IMPL = "reference"
 
 
 class SolutionAbstract(ABC):
     day: ClassVar[int] = 0
+    # Whether processed data can be pickled and is worth caching on disk
+    cache_data: ClassVar[bool] = False
+    # Whether parts modify processed data in place, so that it has to be copied before
+    #   being reused by another part
+    mutates_data: ClassVar[bool] = False
+    # Whether `_process_data` gets the input as a read-only memory-mapped buffer
+    #   instead of a list of lines, for parsing without copying the whole input. Use
+    #   `iter_lines` to go through its lines lazily
+    reads_bytes: ClassVar[bool] = False
+    # Collects what `timer` and `count` record, if set
+    instruments: None | Instruments
+    # Reports what `emit` sends, if set
+    progress: None | Progress
+    # Method names of the alternative implementations of each part, by implementation
+    #   name. Filled from the methods decorated with `implementation`
+    implementations: ClassVar[dict[int, dict[str, str]]] = {}
 
-    def __init__(self) -> None:
-        raw_data = self._get_raw_data()
-        self.data = self._process_data(raw_data)
+    def __init_subclass__(cls, **kwargs: Any) -> None:
+        super().__init_subclass__(**kwargs)
+        implementations = {
+            part: dict(names) for part, names in cls.implementations.items()
+        }
+        for attr_name, value in vars(cls).items():
+            registered: None | tuple[int, str] = getattr(value, "_implementation", None)
+            if registered is not None:
+                part, name = registered
+                implementations.setdefault(part, {})[name] = attr_name
+        cls.implementations = implementations
+
+    def __init__(
+        self,
+        *,
+        use_cache: bool = True,
+        input_path: None | Path = None,
+        instruments: None | Instruments = None,
+        progress: None | Progress = None,
+        checkpoints: bool = True,
+    ) -> None:
+        # Read another input than the downloaded one, e.g. a generated one
+        self._input_path = input_path
+        self._use_cache = use_cache
+        # Whether long searches save and resume, off when they are timed
+        self._checkpoints = checkpoints
+        self._cache_key: None | str = None
+        self.instruments = instruments
+        self.progress = progress
+        if use_cache and self.cache_data:
+            self.data = self._get_cached_data(DataCache())
+        else:
+            self.data = self._load_data()
+
+    @classmethod
+    def get_implementation_names(cls, part: int) -> list[str]:
+        """
+        Get the names of a part's implementations.
+        Args:
+            part (1, 2): Part number
+        Returns:
+            (list[str]): `REFERENCE_IMPL` first, then the alternatives
+        """
+        return [REFERENCE_IMPL, *cls.implementations.get(part, {})]
+
+    def snapshot(self) -> Any:
+        """
+        Take a snapshot of the processed data, so that both parts can run from a single
+        parse. The snapshot is not affected by parts run afterwards.
+        Returns:
+            (Any): The snapshot, to be passed to `restore`
+        """
+        return self._copy_data(self.data)
+
+    def restore(self, snapshot: Any) -> None:
+        """
+        Reset the processed data to a snapshot. The snapshot can be restored again.
+        Args:
+            snapshot (Any): Snapshot from `snapshot`
+        """
+        self.data = self._copy_data(snapshot)
+
+    def timer(self, name: str) -> AbstractContextManager[Any]:
+        """
+        Time a block, adding up the time of all blocks with the same name. Does
+        nothing unless the solution is instrumented.
+        Args:
+            name (str): Name of the timer
+        Returns:
+            (AbstractContextManager): Context manager around the block
+        """
+        if self.instruments is None:
+            return _NULL_TIMER
+        return self.instruments.timer(name)
+
+    def count(self, name: str, n: int = 1) -> None:
+        """
+        Add to a counter. Does nothing unless the solution is instrumented. In hot
+        loops, count in a local variable and add it up once.
+        Args:
+            name (str): Name of the counter
+            n    (int): Amount to add
+        """
+        if self.instruments is not None:
+            self.instruments.count(name, n)
+
+    def count_max(self, name: str, value: int) -> None:
+        """
+        Raise a counter to a value, if it is lower, e.g. to record a maximum depth.
+        Does nothing unless the solution is instrumented.
+        Args:
+            name  (str): Name of the counter
+            value (int): Value reached
+        """
+        if self.instruments is not None:
+            self.instruments.count_max(name, value)
+
+    def emit(self, name: str, **fields: Any) -> None:
+        """
+        Report progress, instead of printing it. Does nothing unless progress is
+        reported, and events are rate-limited when it is. Pass `done` and `total` to
+        fill progress bars.
+        Args:
+            name   (str): Name of the event
+            fields (Any): JSON-serializable details of the event
+        """
+        if self.progress is not None:
+            self.progress.emit(self.day, name, fields)
+
+    def checkpoint(self, name: str, *, interval: float = 5.0) -> Checkpoint:
+        """
+        Get a checkpoint to save the state of a long-running search into, so that it
+        resumes where it was after a crash or a kill. Checkpoints are kept until
+        cleared, and are discarded when the input or the solution source changes.
+        With caching or checkpoints disabled, they neither load nor save anything.
+        Args:
+            name     (str)  : Name of the checkpoint, unique within the day
+            interval (float): Minimum seconds between two saves
+        Returns:
+            (Checkpoint): The checkpoint
+        """
+        if not self._use_cache or not self._checkpoints:
+            return Checkpoint(None, name, interval=interval)
+        cache = DataCache(_CHECKPOINT_DIR)
+        return Checkpoint(cache, f"{self._get_cache_key()}-{name}", interval=interval)
+
+    def _copy_data(self, data: Any) -> Any:
+        """
+        Copy processed data. Data is shared when parts don't mutate it. Override to
+        share the parts that are never mutated.
+        """
+        if not self.mutates_data:
+            return data
+        return copy.deepcopy(data)
 
     def _get_input_path(self) -> Path:
         """"""
+        if self._input_path is not None:
+            return self._input_path
         return get_input_path(self.day)
 
+    def _get_source_path(self) -> Path:
+        """"""
+        return Path(inspect.getfile(type(self)))
+
+    def _get_cached_data(self, cache: DataCache) -> Any:
+        """
+        Get processed data from the cache, processing and caching it on a miss. The key
+        changes whenever the input or the solution source changes.
+        """
+        key = self._get_cache_key()
+        try:
+            return cache.get(key)
+        except KeyError:
+            pass
+        data = self._load_data()
+        cache.put(key, data)
+        return data
+
+    def _get_cache_key(self) -> str:
+        """
+        Key changing whenever the input or the solution source changes. Hashed once
+        per instance.
+        """
+        if self._cache_key is None:
+            input_hash = hash_file(self._get_input_path())
+            source_hash = hash_file(self._get_source_path())
+            self._cache_key = f"day_{self.day:>02}-{input_hash[:16]}-{source_hash[:16]}"
+        return self._cache_key
+
+    def _load_data(self) -> Any:
+        """
+        Read and process the input, as lines or as a buffer depending on
+        `reads_bytes`.
+        """
+        if not self.reads_bytes:
+            return self._process_data(self._get_raw_data())
+        with self._open_raw_buffer() as raw_buffer:
+            return self._process_data(raw_buffer)
+
+    @contextmanager
+    def _open_raw_buffer(self) -> Generator[mmap.mmap, None, None]:
+        """
+        Memory-map the input. Slicing the map copies only the slice, so nothing
+        sliced out of it has to outlive the context.
+        """
+        path = self._get_input_path()
+        with path.open("rb") as f:
+            try:
+                raw_buffer = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+            except ValueError as err:
+                raise ValueError(f"Empty input: {path}") from err
+            with raw_buffer:
+                yield raw_buffer
+
     def _get_raw_data(self) -> list[str]:
         path = self._get_input_path()
         with path.open("r") as f:
@@ -32,9 +262,9 @@ class SolutionAbstract(ABC):
         return lines
 
     @abstractmethod
-    def _process_data(self, raw_data: list[str]) -> Any:
+    def _process_data(self, raw_data: Any) -> Any:
         """
-        Process input data.
+        Process input data, lines or a buffer depending on `reads_bytes`.
         """
         raise NotImplementedError()
 
@@ -53,6 +283,251 @@ class SolutionAbstract(ABC):
         raise NotImplementedError()
 
 
+class Instruments:
+    """
+    Timers and counters recorded by a solution while it runs
+    """
+
+    # Total seconds per timer name
+    timers: dict[str, float]
+    counters: dict[str, int]
+
+    def __init__(self) -> None:
+        self.timers = {}
+        self.counters = {}
+
+    @contextmanager
+    def timer(self, name: str) -> Generator[None, None, None]:
+        """"""
+        start = perf_counter()
+        try:
+            yield
+        finally:
+            self.timers[name] = self.timers.get(name, 0.0) + perf_counter() - start
+
+    def count(self, name: str, n: int = 1) -> None:
+        """"""
+        self.counters[name] = self.counters.get(name, 0) + n
+
+    def count_max(self, name: str, value: int) -> None:
+        """"""
+        self.counters[name] = max(self.counters.get(name, value), value)
+
+    def to_dict(self) -> dict[str, Any]:
+        """"""
+        return {"timers": self.timers, "counters": self.counters}
+
+
+def implementation(part: int, name: str) -> Callable[[_F], _F]:
+    """
+    Register a solution method as an alternative implementation of a part, to be
+    selected by name and cross-checked against `part_1`/`part_2`.
+    Args:
+        part (1, 2): Part number
+        name (str) : Name of the implementation
+    Returns:
+        (Callable): Decorator of the method
+    """
+    if name == REFERENCE_IMPL:
+        raise ValueError(f"{name!r} is reserved for `part_{part}`")
+
+    def decorator(method: _F) -> _F:
+        """"""
+        setattr(method, "_implementation", (part, name))
+        return method
+
+    return decorator
+
+
+class Checkpoint:
+    """
+    State of a long-running search, saved to disk at intervals
+    """
+
+    interval: float
+
+    def __init__(self, cache: None | DataCache, key: str, *, interval: float) -> None:
+        self.interval = interval
+        self._cache = cache
+        self._key = key
+        # The first interval starts now, so that searches shorter than it never save
+        self._saved_at = monotonic()
+
+    def load(self) -> Any:
+        """
+        Load the saved state.
+        Returns:
+            (Any): The state, or `None` if nothing is saved
+        """
+        if self._cache is None:
+            return None
+        try:
+            return self._cache.get(self._key)
+        except KeyError:
+            return None
+
+    def save(self, state: Any, *, force: bool = False) -> None:
+        """
+        Save a state, unless one was saved, or the checkpoint created, less than
+        `interval` seconds ago.
+        Args:
+            state (Any) : Picklable state
+            force (bool): Whether to save regardless of the interval
+        """
+        if self._cache is None:
+            return
+        now = monotonic()
+        if not force and now - self._saved_at < self.interval:
+            return
+        self._cache.put(self._key, state)
+        self._saved_at = now
+
+    def clear(self) -> None:
+        """
+        Remove the saved state, once the search is done.
+        """
+        if self._cache is not None:
+            self._cache.remove(self._key)
+
+
+class Progress(ABC):
+    """
+    Progress events emitted by a solution while it runs. Each event name is let
+    through at most once per `interval` seconds, except for events with
+    `done == total`, so that the end of a task is always reported.
+    """
+
+    interval: float
+
+    def __init__(self, *, stream: TextIO = sys.stderr, interval: float = 0.1) -> None:
+        self.interval = interval
+        self._stream = stream
+        self._start = monotonic()
+        self._last_times: dict[str, float] = {}
+
+    def emit(self, day: int, name: str, fields: dict[str, Any]) -> None:
+        """"""
+        now = monotonic()
+        last_time = self._last_times.get(name)
+        is_done = "total" in fields and fields.get("done") == fields["total"]
+        if last_time is not None and now - last_time < self.interval and not is_done:
+            return
+        self._last_times[name] = now
+        self._write(day, name, fields, now - self._start)
+
+    def close(self) -> None:
+        """
+        Finish reporting.
+        """
+
+    @abstractmethod
+    def _write(
+        self, day: int, name: str, fields: dict[str, Any], elapsed: float
+    ) -> None:
+        """"""
+        raise NotImplementedError()
+
+
+class ProgressBar(Progress):
+    """
+    Progress redrawn on a single line
+    """
+
+    def __init__(self, *, stream: TextIO = sys.stderr, interval: float = 0.1) -> None:
+        super().__init__(stream=stream, interval=interval)
+        self._drawn = False
+
+    def close(self) -> None:
+        """"""
+        if self._drawn:
+            self._stream.write("\n")
+            self._stream.flush()
+            self._drawn = False
+
+    def _write(
+        self, day: int, name: str, fields: dict[str, Any], elapsed: float
+    ) -> None:
+        """"""
+        parts = [f"[{elapsed:7.2f}s] Day {day} {name}"]
+        fields = dict(fields)
+        total = fields.pop("total", None)
+        done = fields.pop("done", None)
+        if total and done is not None:
+            filled = round(_PROGRESS_BAR_WIDTH * min(done / total, 1))
+            bar = "#" * filled + "." * (_PROGRESS_BAR_WIDTH - filled)
+            parts.append(f"[{bar}] {done}/{total}")
+        parts.extend(f"{key}={value}" for key, value in fields.items())
+        self._stream.write("\r\x1b[K" + " ".join(parts))
+        self._stream.flush()
+        self._drawn = True
+
+
+class JsonProgress(Progress):
+    """
+    Progress logged as JSON lines
+    """
+
+    def _write(
+        self, day: int, name: str, fields: dict[str, Any], elapsed: float
+    ) -> None:
+        """"""
+        event = {"elapsed": elapsed, "day": day, "event": name, **fields}
+        # Fields may not be JSON-serializable
+        self._stream.write(json.dumps(event, default=repr) + "\n")
+        self._stream.flush()
+
+
+def get_progress(kind: str, *, stream: TextIO = sys.stderr) -> Progress:
+    """
+    Create progress reporting of one of `PROGRESS_KINDS`.
+    Args:
+        kind   (str)   : `"bar"` to redraw a line, `"json"` to log JSON lines
+        stream (TextIO): Stream to report to
+    Returns:
+        (Progress): Progress to pass to solutions
+    """
+    match kind:
+        case "bar":
+            return ProgressBar(stream=stream)
+        case "json":
+            return JsonProgress(stream=stream)
+        case _:
+            raise ValueError(f"Unknown progress kind {kind}.")
+
+
+def iter_lines(raw_buffer: mmap.mmap | bytes) -> Iterator[bytes]:
+    """
+    Lazily go through the lines of an input buffer, like `_get_raw_data` does
+    eagerly: without line endings, and without the trailing empty lines. The buffer
+    is split a chunk at a time, so at most a chunk of it is copied at once.
+    Args:
+        raw_buffer (mmap.mmap | bytes): The input
+    Returns:
+        (Iterator[bytes]): Lines
+    """
+    # Empty lines are held back until a non-empty one shows they aren't trailing
+    pending_empty_count = 0
+    partial_line = b""
+    for chunk_start in range(0, len(raw_buffer), _LINES_CHUNK_SIZE):
+        chunk = partial_line + raw_buffer[chunk_start : chunk_start + _LINES_CHUNK_SIZE]
+        lines = chunk.split(b"\n")
+        # Cut by the end of the chunk, or after the last line ending
+        partial_line = lines.pop()
+        for line in lines:
+            line = line.rstrip(b"\r")
+            if not line:
+                pending_empty_count += 1
+                continue
+            if pending_empty_count:
+                yield from [b""] * pending_empty_count
+                pending_empty_count = 0
+            yield line
+    partial_line = partial_line.rstrip(b"\r")
+    if partial_line:
+        yield from [b""] * pending_empty_count
+        yield partial_line
+
+
 def get_input_path(day: int) -> Path:
     """
     Get the path of the file the input data is downloaded into.
@@ -61,6 +536,51 @@ def get_input_path(day: int) -> Path:
     Returns:
         (pathlib.Path): Path of the input data file
     """
+    return get_day_dir(day) / "input.txt"
+
+
+def get_day_dir(day: int) -> Path:
+    """
+    Get the directory containing a day's solution.
+    Args:
+        day (1..25): The day of AOC
+    Returns:
+        (pathlib.Path): Path of the day's directory
+    """
+    if day not in range(1, 26):
+        raise ValueError(f"Invalid day number {day}.")
+    return Path(__file__).resolve().parent / f"day_{day:>02}"
+
+
+def get_solution_path(day: int) -> Path:
+    """
+    Get the path of a day's solution module.
+    Args:
+        day (1..25): The day of AOC
+    Returns:
+        (pathlib.Path): Path of the day's `solution.py`
+    """
+    return get_day_dir(day) / "solution.py"
+
+
+def get_days() -> list[int]:
+    """
+    Get all days with a solution module.
+    Returns:
+        (list[int]): Sorted day numbers
+    """
+    return [day for day in range(1, 26) if get_solution_path(day).exists()]
+
+
+def get_solution_class(day: int) -> type[SolutionAbstract]:
+    """
+    Import a day's solution module and get its `Solution` class.
+    Args:
+        day (1..25): The day of AOC
+    Returns:
+        (type[SolutionAbstract]): The day's solution class
+    """
     if day not in range(1, 26):
         raise ValueError(f"Invalid day number {day}.")
-    return Path(__file__).resolve().parent / f"day_{day:>02}" / "input.txt"
+    solution_module = import_module(f"day_{day:>02}.solution")
+    return getattr(solution_module, "Solution")
@@ -0,0 +1,147 @@
+# pyright: reportMissingTypeStubs=false
+"""
+Check solutions against known answers
+"""
+
+from __future__ import annotations
+
+import json
+import os
+from dataclasses import dataclass
+from pathlib import Path
+from typing import TYPE_CHECKING
+
+from runner import run_all
+
+if TYPE_CHECKING:
+    from collections.abc import Generator, Iterable
+
+    from runner import PartResult
+
+    # Answers as submitted, keyed by day then part
+    _Answers = dict[str, dict[str, str]]
+
+ANSWERS_PATH = Path(__file__).resolve().parent / "answers.json"
+
+# Passing parts listed as the slowest in summaries
+_SLOWEST_COUNT = 3
+
+
+@dataclass(frozen=True, kw_only=True)
+class Check:
+    """
+    Result of a part against its known answer
+    """
+
+    result: PartResult
+    # `None` when no answer is known for the part
+    expected: None | str
+
+    @property
+    def status(self) -> str:
+        """
+        `"ok"`, `"mismatch"`, `"exceeded"`, `"error"` or `"unknown"`
+        """
+        if self.result.exceeded is not None:
+            return "exceeded"
+        if self.result.error is not None:
+            return "error"
+        if self.expected is None:
+            return "unknown"
+        if self.result.answer is None or str(self.result.answer) != self.expected:
+            return "mismatch"
+        return "ok"
+
+
+def load_answers(path: Path = ANSWERS_PATH) -> _Answers:
+    """
+    Load known answers, `{day: {part: answer}}` with answers as strings.
+    """
+    try:
+        with path.open("r") as f:
+            return json.load(f)
+    except FileNotFoundError:
+        return {}
+
+
+def dump_answers(answers: _Answers, path: Path = ANSWERS_PATH) -> None:
+    """
+    Write known answers, sorted by day and part.
+    """
+    ordered = {
+        day: dict(sorted(answers[day].items(), key=lambda item: int(item[0])))
+        for day in sorted(answers, key=int)
+    }
+    tmp_path = path.with_suffix(f".{os.getpid()}.tmp")
+    with tmp_path.open("w") as f:
+        json.dump(ordered, f, indent=2)
+        f.write("\n")
+    tmp_path.replace(path)
+
+
+def record_answer(
+    day: int, part: int, answer: str | int, path: Path = ANSWERS_PATH
+) -> None:
+    """
+    Store a part's answer as known, replacing any previous one.
+    Args:
+        day    (1..25)       : The day of AOC
+        part   (1, 2)        : Part number
+        answer (str | int)   : The correct answer
+        path   (pathlib.Path): Path of the answers file
+    """
+    answers = load_answers(path)
+    answers.setdefault(str(day), {})[str(part)] = str(answer)
+    dump_answers(answers, path)
+
+
+def verify(
+    days: Iterable[int],
+    answers: _Answers,
+    parts: Iterable[int] = (1, 2),
+    *,
+    max_workers: None | int = None,
+    timeout: None | float = None,
+    use_cache: bool = True,
+) -> Generator[Check, None, None]:
+    """
+    Run every part of every given day on a process pool, and check each answer
+    against the known one as the parts finish. See `runner.run_all`.
+    Args:
+        days        (Iterable[int]): Days of AOC
+        answers     (_Answers)     : Known answers, see `load_answers`
+        parts       (Iterable[int]): Part numbers to run for each day
+        max_workers (None | int)   : Pool size. Defaults to the CPU count
+        timeout     (None | float) : Wall-clock budget of each part in seconds
+        use_cache   (bool)         : Whether processed data may come from the cache
+    Returns:
+        (Generator[Check]): Checks in order of completion
+    """
+    results = run_all(
+        days, parts, max_workers=max_workers, timeout=timeout, use_cache=use_cache
+    )
+    for result in results:
+        expected = answers.get(str(result.day), {}).get(str(result.part))
+        yield Check(result=result, expected=expected)
+
+
+def format_summary(checks: list[Check]) -> str:
+    """
+    Format the count of checks by status, and the slowest parts that passed.
+    """
+    counts = {
+        status: sum(check.status == status for check in checks)
+        for status in ("ok", "mismatch", "exceeded", "error", "unknown")
+    }
+    lines = [", ".join(f"{count} {status}" for status, count in counts.items())]
+    passed = [check.result for check in checks if check.status == "ok"]
+    if passed:
+        slowest = sorted(passed, key=lambda result: -result.elapsed)[:_SLOWEST_COUNT]
+        lines.append(
+            "Slowest: "
+            + ", ".join(
+                f"day {result.day} part {result.part} ({result.elapsed:.3f}s)"
+                for result in slowest
+            )
+        )
+    return "\n".join(lines)